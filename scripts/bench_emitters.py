@@ -0,0 +1,152 @@
+"""
+On-device benchmark of the code emitters for hot functions.
+
+Compiles each module with "# emit:" markers once per emitter on the
+device itself (bytecode, native, viper), then times its hot functions.
+Upload the sources first, then run the benchmark from the host:
+
+    ./scripts/upload.sh /dev/ttyUSB0 dev
+    uv run mpremote connect /dev/ttyUSB0 run scripts/bench_emitters.py
+
+Prints microseconds per call and the speed-up over bytecode; use it to
+pick the --emit level of scripts/build.py. The numbers only mean
+something on MicroPython: the emulated runtime's emitters are no-ops.
+"""
+import gc
+from time import ticks_diff, ticks_us
+
+import micropython
+
+MARKER = "# emit: "
+EMITTERS = ("bytecode", "native", "viper")
+ITERATIONS = 2000
+
+
+def variant(source: str, emit: str) -> str:
+    """
+    Turn emitter markers into decorators, like build.apply_emitters().
+
+    Args:
+        source: Module source.
+        emit: Emitter level (see EMITTERS).
+
+    Returns:
+        Source with decorators applied.
+    """
+    if emit == "bytecode":
+        return source
+    lines = source.split("\n")
+    for i, line in enumerate(lines):
+        marker = line.strip()
+        if marker.startswith(MARKER) and marker[len(MARKER):] in ("native", "viper"):
+            kind = "native" if emit == "native" else marker[len(MARKER):]
+            lines[i] = line[: len(line) - len(line.lstrip())] + "@micropython." + kind
+    return "\n".join(lines)
+
+
+def load(path: str, emit: str) -> dict:
+    """Compile one source file with the given emitter into a namespace."""
+    with open(path) as f:
+        source = f.read()
+    namespace = {"__name__": "bench", "micropython": micropython}
+    exec(variant(source, emit), namespace)  # noqa: S102
+    return namespace
+
+
+class _Thresholds:
+    """Stand-in zone carrying the thresholds _is_presence reads."""
+
+    _min_mm = 30
+    _max_mm = 400
+
+
+def bench_is_presence(ns: dict, n: int) -> None:
+    """MirrorZone._is_presence over a sweep of distances (mm)."""
+    is_presence = ns["MirrorZone"]._is_presence
+    zone = _Thresholds()
+    for i in range(n):
+        is_presence(zone, i % 1200 - 100)
+
+
+def bench_presence_update(ns: dict, n: int) -> None:
+    """PresenceDetector.update cycling through all states."""
+    detector = ns["PresenceDetector"](activation_ms=300, timeout_ms=1000)
+    update = detector.update
+    for i in range(n):
+        update(i % 200 < 120, False, i * 20)
+
+
+def bench_result_mm(ns: dict, n: int) -> None:
+    """VL53L0X result block parsing."""
+    result_mm = ns["_result_mm"]
+    buf = bytearray(12)
+    buf[10] = 0x01
+    buf[11] = 0x2C
+    for _ in range(n):
+        result_mm(buf)
+
+
+def bench_echo_mm(ns: dict, n: int) -> None:
+    """Ultrasonic echo duration conversion."""
+    echo_mm = ns["_echo_mm"]
+    scale = ns["_echo_scale"](29.1)
+    for i in range(n):
+        echo_mm(i, scale)
+
+
+def bench_fade(ns: dict, n: int) -> None:
+    """LightController._fade_step over an n-step fade in and out."""
+    from config import PinConfig
+
+    light = ns["LightController"](pin=PinConfig.LED, fade_duration_ms=n, fade_steps=n)
+    step = light._fade_step
+    for fade in (light.on, light.off):
+        fade()
+        start = light._fade_start
+        for i in range(n):
+            step(start + i)
+
+
+CASES = (
+    ("main._is_presence", "main.py", bench_is_presence, 1),
+    ("presence.update", "core/presence.py", bench_presence_update, 1),
+    ("vl53l0x._result_mm", "hardware/sensors/vl53l0x.py", bench_result_mm, 1),
+    ("ultrasonic._echo_mm", "hardware/sensors/ultrasonic.py", bench_echo_mm, 1),
+    ("light fade step", "core/light.py", bench_fade, 2),
+)
+
+
+def run(iterations: int = ITERATIONS, write=print) -> dict:
+    """
+    Time every case under every emitter.
+
+    Args:
+        iterations: Calls (or fade steps) per measurement.
+        write: Callable receiving each report line.
+
+    Returns:
+        Dict of case name to tuple of microseconds per call, one per
+        emitter in EMITTERS order.
+    """
+    results = {}
+    write("{:<22}{:>10}{:>10}{:>10}{:>10}".format("function", *EMITTERS, "speed-up"))
+    for name, path, case, calls in CASES:
+        timings = []
+        for emit in EMITTERS:
+            ns = load(path, emit)
+            gc.collect()
+            start = ticks_us()
+            case(ns, iterations)
+            timings.append(ticks_diff(ticks_us(), start) / (iterations * calls))
+        results[name] = tuple(timings)
+        best = min(timings[1:])
+        speed_up = timings[0] / best if best else 0.0
+        write(
+            f"{name:<22}{timings[0]:>8.2f}us{timings[1]:>8.2f}us"
+            f"{timings[2]:>8.2f}us{speed_up:>9.1f}x"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    run()
@@ -3,11 +3,14 @@
 Build script for MicroPython deployment.
 
 Combines all source files into a single main.py for easy upload.
+Debug log calls are compiled out unless --debug-log is given. Hot
+functions marked "# emit: native" or "# emit: viper" get the matching
+@micropython decorator (see --emit).
 """
+import argparse
 import re
 from pathlib import Path
 
-
 SRC_DIR = Path(__file__).parent.parent / "src"
 BUILD_DIR = Path(__file__).parent.parent / "build"
 OUTPUT_FILE = BUILD_DIR / "main.py"
@@ -17,12 +20,23 @@ FILES_ORDER = [
     # Hardware - Sensors (portable to other projects)
     "hardware/sensors/base.py",
     "hardware/sensors/factory.py",
+    "hardware/sensors/health.py",
+    "hardware/sensors/ld2410.py",
     "hardware/sensors/ultrasonic.py",
     "hardware/sensors/vl53l0x.py",
     # Core - Application logic
+    "core/bootcache.py",
+    "core/events.py",
     "core/light.py",
+    "core/log.py",
+    "core/memory.py",
     "core/presence.py",
+    "core/tracking.py",
     "core/power.py",
+    "core/sampler.py",
+    "core/scheduler.py",
+    "core/telemetry.py",
+    "core/trace.py",
     # Main application
     "main.py",
 ]
@@ -36,6 +50,15 @@ IMPORTS_TO_REMOVE = [
     r"^import hardware\.sensors\.\w+.*$",
 ]
 
+# Single-line Logger.debug() calls (see core/log.py)
+DEBUG_LOG_CALL = re.compile(r"^(\s*)(?:self\.)?_?log\.debug\(.*\)\s*$", re.MULTILINE)
+
+# Code emitter markers on hot functions. The decorators are only
+# recognized by the compiler when written literally, so the build
+# inserts them instead of src/ importing them.
+EMIT_MARKER = re.compile(r"^([ \t]*)# emit: (native|viper)[ \t]*$", re.MULTILINE)
+EMITTERS = ("bytecode", "native", "viper")
+
 
 def read_file(path: Path) -> str:
     """Read file content."""
@@ -46,17 +69,51 @@ def remove_local_imports(content: str) -> str:
     """Remove imports of local modules."""
     lines = content.split("\n")
     filtered = []
+    in_import = False
     for line in lines:
+        if in_import:
+            # Continuation of a parenthesized import
+            in_import = not line.strip().startswith(")")
+            continue
         skip = False
         for pattern in IMPORTS_TO_REMOVE:
             if re.match(pattern, line.strip()):
                 skip = True
+                in_import = line.rstrip().endswith("(")
                 break
         if not skip:
             filtered.append(line)
     return "\n".join(filtered)
 
 
+def strip_debug_logs(content: str) -> str:
+    """Replace debug log calls with pass, keeping blocks valid."""
+    return DEBUG_LOG_CALL.sub(r"\1pass", content)
+
+
+def apply_emitters(content: str, emit: str) -> str:
+    """
+    Turn emitter markers into @micropython decorators.
+
+    Args:
+        content: Module source.
+        emit: "bytecode" keeps the markers as comments, "native" compiles
+            every marked function native, "viper" uses each marker's own
+            emitter.
+
+    Returns:
+        Source with decorators applied.
+    """
+    if emit == "bytecode":
+        return content
+
+    def decorator(match):
+        kind = "native" if emit == "native" else match.group(2)
+        return f"{match.group(1)}@micropython.{kind}"
+
+    return EMIT_MARKER.sub(decorator, content)
+
+
 def remove_module_docstring(content: str) -> str:
     """Remove module-level docstring."""
     content = re.sub(r'^"""[\s\S]*?"""\n', '', content)
@@ -64,8 +121,14 @@ def remove_module_docstring(content: str) -> str:
     return content
 
 
-def build() -> None:
-    """Combine all files into single main.py."""
+def build(debug_log: bool = False, emit: str = "native") -> None:
+    """
+    Combine all files into single main.py.
+
+    Args:
+        debug_log: Keep Logger.debug() calls in the output.
+        emit: Code emitter for marked hot functions (see EMITTERS).
+    """
     BUILD_DIR.mkdir(exist_ok=True)
     
     header = '''"""
@@ -86,6 +149,9 @@ Edit source files in src/ and run: uv run python scripts/build.py
         
         content = read_file(filepath)
         content = remove_local_imports(content)
+        if not debug_log:
+            content = strip_debug_logs(content)
+        content = apply_emitters(content, emit)
         
         if filename != "main.py":
             content = remove_module_docstring(content)
@@ -104,4 +170,13 @@ Edit source files in src/ and run: uv run python scripts/build.py
 
 
 if __name__ == "__main__":
-    build()
+    parser = argparse.ArgumentParser(description="Build combined main.py")
+    parser.add_argument("--debug-log", action="store_true", help="Keep debug log calls")
+    parser.add_argument(
+        "--emit",
+        choices=EMITTERS,
+        default="native",
+        help="Emitter for hot functions (default: native)",
+    )
+    args = parser.parse_args()
+    build(debug_log=args.debug_log, emit=args.emit)
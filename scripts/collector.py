@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Telemetry collector service.
+
+Receives telemetry batches from many mirrors concurrently over UDP,
+TCP or serial ports and appends them to columnar files:
+
+    <root>/<table>/device=<id>/date=<YYYY-MM-DD>/<column>.<type>
+
+Every column file is a raw little-endian array, so months of data can
+be memory-mapped and scanned without parsing (see read_column).
+
+Latency trace dumps ("@trace" console lines, see src/core/trace.py)
+arriving on a serial or TCP stream between telemetry messages land in
+the "traces" table. The lines carry no device ID: they are stored under
+the device of the telemetry on the same stream, and held until its
+first message arrives. Ticks are stored raw (trace_export.py undoes
+the wraparound).
+
+Usage:
+    uv run python scripts/collector.py --root data --udp 5005 --tcp 5006
+    uv run python scripts/collector.py --root data --serial /dev/ttyUSB0
+"""
+import argparse
+import asyncio
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Wire format - must match src/core/telemetry.py
+MAGIC = b"MT"
+VERSION = 1
+HEADER_FORMAT = "<2sBHHIBB"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+COUNTER_FORMAT = "<I"
+COUNTER_SIZE = struct.calcsize(COUNTER_FORMAT)
+RECORD_FORMAT = "<BBhI"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+# Trace dump line - must match src/core/trace.py
+TRACE_PREFIX = b"@trace "
+
+# Column type code (array module) -> file extension
+COLUMN_TYPES = {
+    "b": "i8",
+    "B": "u8",
+    "h": "i16",
+    "H": "u16",
+    "i": "i32",
+    "I": "u32",
+    "q": "i64",
+}
+EXTENSION_TYPES = {ext: code for code, ext in COLUMN_TYPES.items()}
+
+TABLES = {
+    "records": (
+        ("received_ms", "q"),
+        ("seq", "H"),
+        ("kind", "B"),
+        ("arg", "B"),
+        ("value", "h"),
+        ("ticks", "I"),
+    ),
+    "counters": (
+        ("received_ms", "q"),
+        ("seq", "H"),
+        ("index", "B"),
+        ("value", "I"),
+    ),
+    "traces": (
+        ("received_ms", "q"),
+        ("ticks_us", "I"),
+        ("point", "B"),
+        ("phase", "B"),
+        ("zone", "B"),
+    ),
+}
+
+
+@dataclass
+class Batch:
+    """One decoded telemetry message."""
+
+    device: int
+    seq: int
+    ticks: int
+    counters: tuple
+    records: list = field(default_factory=list)
+
+
+def message_size(header: bytes) -> int:
+    """
+    Return total message size from its header.
+
+    Args:
+        header: At least HEADER_SIZE bytes starting at the magic.
+
+    Raises:
+        ValueError: If magic or version do not match.
+    """
+    magic, version, _, _, _, n_counters, n_records = struct.unpack_from(
+        HEADER_FORMAT, header, 0,
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Bad telemetry header: {magic!r} v{version}")
+    return HEADER_SIZE + n_counters * COUNTER_SIZE + n_records * RECORD_SIZE
+
+
+def decode_batch(payload: bytes) -> Batch:
+    """
+    Decode one telemetry message.
+
+    Raises:
+        ValueError: If the payload is malformed or truncated.
+    """
+    if len(payload) < HEADER_SIZE:
+        raise ValueError(f"Truncated telemetry header ({len(payload)} bytes)")
+    size = message_size(payload)
+    if len(payload) != size:
+        raise ValueError(f"Telemetry size mismatch: {len(payload)} != {size}")
+
+    _, _, device, seq, ticks, n_counters, n_records = struct.unpack_from(
+        HEADER_FORMAT, payload, 0,
+    )
+    counters = struct.unpack_from(f"<{n_counters}I", payload, HEADER_SIZE)
+    offset = HEADER_SIZE + n_counters * COUNTER_SIZE
+    records = [
+        struct.unpack_from(RECORD_FORMAT, payload, offset + i * RECORD_SIZE)
+        for i in range(n_records)
+    ]
+    return Batch(device, seq, ticks, counters, records)
+
+
+class StreamDecoder:
+    """
+    Splits a byte stream (TCP, serial) into telemetry messages.
+
+    Garbage between messages (boot logs, REPL output) is skipped
+    by scanning for the next magic. Trace dump lines in the skipped
+    text are collected in traces.
+
+    Attributes:
+        device: Device ID of the last decoded message (None before).
+        traces: (ticks_us, point, phase, zone) tuples not yet stored.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with empty buffer."""
+        self._buffer = bytearray()
+        self._text = bytearray()
+        self.skipped = 0
+        self.device = None
+        self.traces = []
+
+    def feed(self, data: bytes) -> list:
+        """
+        Append data and return all complete messages.
+
+        Returns:
+            List of decoded Batch objects.
+        """
+        self._buffer += data
+        batches = []
+        while True:
+            start = self._buffer.find(MAGIC)
+            if start < 0:
+                # Keep a trailing partial magic byte
+                keep = 1 if self._buffer.endswith(MAGIC[:1]) else 0
+                self._skip(len(self._buffer) - keep)
+                break
+            if start:
+                self._skip(start)
+            if len(self._buffer) < HEADER_SIZE:
+                break
+            try:
+                size = message_size(self._buffer)
+            except ValueError:
+                self._skip(1)
+                continue
+            if len(self._buffer) < size:
+                break
+            batch = decode_batch(bytes(self._buffer[:size]))
+            del self._buffer[:size]
+            self.device = batch.device
+            batches.append(batch)
+        return batches
+
+    def _skip(self, count: int) -> None:
+        """Drop count leading bytes, keeping complete trace lines."""
+        self.skipped += count
+        self._text += self._buffer[:count]
+        del self._buffer[:count]
+        end = self._text.rfind(b"\n")
+        if end < 0:
+            return
+        for line in bytes(self._text[:end]).split(b"\n"):
+            if line.startswith(TRACE_PREFIX):
+                try:
+                    ticks, point, phase, zone = (int(f) for f in line.split()[1:])
+                except ValueError:
+                    continue
+                self.traces.append((ticks, point, phase, zone))
+        del self._text[:end + 1]
+
+
+class ColumnStore:
+    """
+    Append-only columnar storage partitioned by table, device and day.
+
+    All columns of a partition are appended together so they always
+    hold the same number of rows.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize store.
+
+        Args:
+            root: Directory holding all tables.
+        """
+        self._root = Path(root)
+        self._files = {}
+        self._day = None
+
+    def partition(self, table: str, device: int, day: str) -> Path:
+        """Return directory for one table/device/day partition."""
+        return self._root / table / f"device={device}" / f"date={day}"
+
+    def append(self, table: str, device: int, day: str, rows: dict) -> None:
+        """
+        Append rows to a partition.
+
+        Args:
+            table: Table name from TABLES.
+            device: Device identifier.
+            day: Partition date (YYYY-MM-DD).
+            rows: Mapping of column name to list of values.
+        """
+        if day != self._day:
+            # Day rollover: earlier partitions get no more rows
+            self.close()
+            self._day = day
+        directory = self.partition(table, device, day)
+        for name, code in TABLES[table]:
+            values = array(code, rows[name])
+            if sys.byteorder == "big":
+                values.byteswap()
+            self._file(directory / f"{name}.{COLUMN_TYPES[code]}").write(values.tobytes())
+
+    def flush(self) -> None:
+        """Flush all open column files."""
+        for handle in self._files.values():
+            handle.flush()
+
+    def close(self) -> None:
+        """Close all open column files."""
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+    def _file(self, path: Path):
+        """Return cached append handle for a column file."""
+        handle = self._files.get(path)
+        if handle is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(path, "ab")  # noqa: SIM115 - closed by close()
+            self._files[path] = handle
+        return handle
+
+
+def read_column(path: Path) -> memoryview:
+    """
+    Memory-map a column file.
+
+    Args:
+        path: Column file (type taken from its extension).
+
+    Returns:
+        Typed read-only memoryview over the file contents. Wrap with
+        numpy.frombuffer() for vectorized analysis.
+    """
+    path = Path(path)
+    code = EXTENSION_TYPES[path.suffix[1:]]
+    if path.stat().st_size == 0:
+        return memoryview(array(code))
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(code)
+
+
+class Collector:
+    """Decodes incoming telemetry and writes it to a ColumnStore."""
+
+    def __init__(self, store: ColumnStore, clock=None) -> None:
+        """
+        Initialize collector.
+
+        Args:
+            store: Destination column store.
+            clock: Callable returning an aware datetime (default: UTC now).
+        """
+        self._store = store
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self.messages = 0
+        self.records = 0
+        self.traces = 0
+        self.errors = 0
+
+    def handle_datagram(self, payload: bytes) -> None:
+        """Decode and store one datagram."""
+        try:
+            batch = decode_batch(payload)
+        except ValueError:
+            self.errors += 1
+            return
+        self.store(batch)
+
+    def store(self, batch: Batch) -> None:
+        """Append one decoded batch to its partitions."""
+        now = self._clock()
+        day = now.date().isoformat()
+        received_ms = int(now.timestamp() * 1000)
+
+        n = len(batch.records)
+        self._store.append("records", batch.device, day, {
+            "received_ms": [received_ms] * n,
+            "seq": [batch.seq] * n,
+            "kind": [r[0] for r in batch.records],
+            "arg": [r[1] for r in batch.records],
+            "value": [r[2] for r in batch.records],
+            "ticks": [r[3] for r in batch.records],
+        })
+        n = len(batch.counters)
+        self._store.append("counters", batch.device, day, {
+            "received_ms": [received_ms] * n,
+            "seq": [batch.seq] * n,
+            "index": list(range(n)),
+            "value": list(batch.counters),
+        })
+        self._store.flush()
+
+        self.messages += 1
+        self.records += len(batch.records)
+
+    def store_stream(self, decoder: StreamDecoder, batches: list) -> None:
+        """Store batches and trace lines decoded from one stream."""
+        for batch in batches:
+            self.store(batch)
+        if decoder.device is None or not decoder.traces:
+            return
+        now = self._clock()
+        traces = decoder.traces
+        self._store.append("traces", decoder.device, now.date().isoformat(), {
+            "received_ms": [int(now.timestamp() * 1000)] * len(traces),
+            "ticks_us": [t[0] for t in traces],
+            "point": [t[1] for t in traces],
+            "phase": [t[2] for t in traces],
+            "zone": [t[3] for t in traces],
+        })
+        self._store.flush()
+        self.traces += len(traces)
+        decoder.traces = []
+
+    async def start_udp(self, host: str, port: int):
+        """
+        Listen for telemetry datagrams.
+
+        Returns:
+            Datagram transport (close() to stop).
+        """
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(self), local_addr=(host, port),
+        )
+        return transport
+
+    async def start_tcp(self, host: str, port: int):
+        """
+        Accept telemetry streams from many devices.
+
+        Returns:
+            asyncio Server (close() to stop).
+        """
+        return await asyncio.start_server(self._handle_stream, host, port)
+
+    async def read_serial(self, port: str, baudrate: int = 115200) -> None:
+        """
+        Read telemetry stream from a serial port until cancelled.
+
+        Blocking reads run in a worker thread so many ports can be
+        collected concurrently.
+        """
+        import serial  # pyserial, installed with mpremote
+
+        connection = serial.Serial(port, baudrate, timeout=0.5)
+        decoder = StreamDecoder()
+        try:
+            while True:
+                data = await asyncio.to_thread(connection.read, 4096)
+                self.store_stream(decoder, decoder.feed(data))
+        finally:
+            connection.close()
+
+    async def _handle_stream(self, reader, writer) -> None:
+        """Decode one TCP connection until EOF."""
+        decoder = StreamDecoder()
+        try:
+            while data := await reader.read(4096):
+                self.store_stream(decoder, decoder.feed(data))
+        finally:
+            writer.close()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """Forwards datagrams to a Collector."""
+
+    def __init__(self, collector: Collector) -> None:
+        self._collector = collector
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._collector.handle_datagram(data)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run all configured listeners until interrupted."""
+    store = ColumnStore(Path(args.root))
+    collector = Collector(store)
+    tasks = []
+
+    if args.udp:
+        await collector.start_udp(args.host, args.udp)
+        print(f"UDP listening on {args.host}:{args.udp}")
+    if args.tcp:
+        server = await collector.start_tcp(args.host, args.tcp)
+        tasks.append(asyncio.create_task(server.serve_forever()))
+        print(f"TCP listening on {args.host}:{args.tcp}")
+    for port in args.serial:
+        tasks.append(asyncio.create_task(collector.read_serial(port, args.baudrate)))
+        print(f"Reading serial {port}")
+
+    try:
+        while True:
+            await asyncio.sleep(60)
+            print(f"messages={collector.messages} records={collector.records} "
+                  f"traces={collector.traces} errors={collector.errors}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        store.close()
+
+
+def main() -> None:
+    """Parse arguments and run collector."""
+    parser = argparse.ArgumentParser(description="Mirror telemetry collector")
+    parser.add_argument("--root", default="data", help="Output directory")
+    parser.add_argument("--host", default="0.0.0.0", help="Listen address")
+    parser.add_argument("--udp", type=int, default=0, help="UDP port")
+    parser.add_argument("--tcp", type=int, default=0, help="TCP port")
+    parser.add_argument("--serial", action="append", default=[], help="Serial port")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
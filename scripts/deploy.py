@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Incremental multi-device deploy.
+
+Hashes every module of the image, compares the hashes with a manifest
+stored on each device, and uploads only the files that changed. Files
+dropped from the image are removed from the device. Several ports are
+deployed concurrently, so deploy time follows the size of the change
+rather than devices times image size.
+
+Modes:
+    dev  - module tree (src/ layout, one file per module)
+    prod - single built file (build/main.py) plus boot.py
+
+Usage:
+    uv run python scripts/deploy.py /dev/ttyUSB0 /dev/ttyUSB1 /dev/ttyUSB2
+    uv run python scripts/deploy.py /dev/ttyUSB0 --mode prod
+"""
+import argparse
+import hashlib
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    from scripts.build import FILES_ORDER, OUTPUT_FILE, SRC_DIR, build
+except ImportError:
+    from build import FILES_ORDER, OUTPUT_FILE, SRC_DIR, build
+
+
+MANIFEST_PATH = ".deploy_manifest"
+HASH_LENGTH = 16
+
+# Files every image needs besides FILES_ORDER
+EXTRA_FILES = [
+    "boot.py",
+    "hardware/__init__.py",
+    "hardware/sensors/__init__.py",
+    "core/__init__.py",
+]
+
+
+def file_hash(path: Path) -> str:
+    """Return short content hash of a file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def dev_image(src_dir: Path = SRC_DIR) -> dict:
+    """Return {device path: local path} for the module tree."""
+    files = {}
+    for name in EXTRA_FILES + FILES_ORDER:
+        path = src_dir / name
+        if path.exists():
+            files[name] = path
+    return files
+
+
+def prod_image(src_dir: Path = SRC_DIR) -> dict:
+    """Build the combined file and return its image."""
+    build()
+    return {
+        "boot.py": src_dir / "boot.py",
+        "main.py": OUTPUT_FILE,
+    }
+
+
+def parse_manifest(text: str) -> dict:
+    """Parse manifest lines of '<hash> <path>' into {path: hash}."""
+    manifest = {}
+    for line in text.splitlines():
+        parts = line.split(" ", 1)
+        if len(parts) == 2:
+            manifest[parts[1]] = parts[0]
+    return manifest
+
+
+def format_manifest(manifest: dict) -> str:
+    """Serialize {path: hash} as manifest text."""
+    return "".join(f"{digest} {path}\n" for path, digest in sorted(manifest.items()))
+
+
+def plan(hashes: dict, manifest: dict) -> tuple:
+    """
+    Compare image hashes with a device manifest.
+
+    Returns:
+        (changed, stale): paths to upload and paths to remove.
+    """
+    changed = sorted(path for path, digest in hashes.items() if manifest.get(path) != digest)
+    stale = sorted(path for path in manifest if path not in hashes)
+    return changed, stale
+
+
+class MpremoteTransport:
+    """
+    Device filesystem access through the mpremote CLI.
+
+    Uploads are chained with '+' into one mpremote invocation, so the
+    board is connected (and soft-reset into raw REPL) once per deploy.
+    """
+
+    def __init__(self, port: str, command: tuple = ("mpremote",)) -> None:
+        """
+        Initialize transport.
+
+        Args:
+            port: Serial port of the device.
+            command: mpremote executable (e.g. ("uv", "run", "mpremote")).
+        """
+        self.port = port
+        self._command = list(command)
+
+    def read(self, path: str):
+        """Return device file contents as text, or None if missing."""
+        result = self._run(["fs", "cat", f":{path}"], check=False)
+        if result.returncode != 0:
+            return None
+        return result.stdout
+
+    def mkdir(self, path: str) -> None:
+        """Create device directory (existing directories are fine)."""
+        self._run(["fs", "mkdir", f":{path}"], check=False)
+
+    def put(self, files: list) -> None:
+        """Upload [(local path, device path), ...] in one session."""
+        args = []
+        for local, remote in files:
+            if args:
+                args.append("+")
+            args += ["fs", "cp", str(local), f":{remote}"]
+        if args:
+            self._run(args)
+
+    def remove(self, paths: list) -> None:
+        """Delete device files."""
+        args = []
+        for path in paths:
+            if args:
+                args.append("+")
+            args += ["fs", "rm", f":{path}"]
+        if args:
+            self._run(args, check=False)
+
+    def reset(self) -> None:
+        """Hard-reset the device."""
+        self._run(["reset"])
+
+    def _run(self, args: list, check: bool = True):
+        """Run mpremote against this port."""
+        return subprocess.run(
+            self._command + ["connect", self.port] + args,
+            capture_output=True,
+            text=True,
+            check=check,
+        )
+
+
+@dataclass
+class DeployResult:
+    """Outcome of deploying to one device."""
+
+    port: str
+    uploaded: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    unchanged: int = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the deploy completed."""
+        return not self.error
+
+
+def deploy_device(transport, files: dict, force: bool = False, reset: bool = True) -> DeployResult:
+    """
+    Bring one device up to date with an image.
+
+    The manifest is written last: if the deploy is interrupted the
+    device keeps its old manifest and the next run uploads again.
+
+    Args:
+        transport: Device filesystem access (see MpremoteTransport).
+        files: Image as {device path: local path}.
+        force: Ignore the device manifest and upload everything.
+        reset: Reset the device when something changed.
+    """
+    result = DeployResult(port=transport.port)
+    hashes = {path: file_hash(local) for path, local in files.items()}
+
+    try:
+        text = None if force else transport.read(MANIFEST_PATH)
+        manifest = parse_manifest(text) if text else {}
+        changed, stale = plan(hashes, manifest)
+        result.unchanged = len(hashes) - len(changed)
+        if not changed and not stale:
+            return result
+
+        known_dirs = {str(Path(path).parent) for path in manifest}
+        for directory in sorted({str(Path(path).parent) for path in changed}):
+            if directory != "." and directory not in known_dirs:
+                transport.mkdir(directory)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest_file = Path(tmp) / "manifest"
+            manifest_file.write_text(format_manifest(hashes))
+            uploads = [(files[path], path) for path in changed]
+            uploads.append((manifest_file, MANIFEST_PATH))
+            transport.put(uploads)
+        result.uploaded = changed
+
+        if stale:
+            transport.remove(stale)
+            result.removed = stale
+
+        if reset:
+            transport.reset()
+    except (OSError, subprocess.CalledProcessError) as e:
+        result.error = str(e)
+
+    return result
+
+
+def deploy(ports: list, files: dict, transport_factory=MpremoteTransport,
+           force: bool = False, reset: bool = True) -> list:
+    """
+    Deploy an image to several devices concurrently.
+
+    Args:
+        ports: Serial ports, one per device.
+        files: Image as {device path: local path}.
+        transport_factory: Callable returning a transport for a port.
+        force: Upload everything regardless of manifests.
+        reset: Reset devices that changed.
+
+    Returns:
+        DeployResult per port, in the order given.
+    """
+    if not ports:
+        return []
+    with ThreadPoolExecutor(max_workers=len(ports)) as pool:
+        futures = [
+            pool.submit(deploy_device, transport_factory(port), files, force, reset)
+            for port in ports
+        ]
+        return [future.result() for future in futures]
+
+
+def main() -> None:
+    """Parse arguments and deploy."""
+    parser = argparse.ArgumentParser(description="Incremental mirror deploy")
+    parser.add_argument("ports", nargs="+", help="Serial port per device")
+    parser.add_argument("--mode", choices=("dev", "prod"), default="dev")
+    parser.add_argument("--force", action="store_true", help="Upload all files")
+    parser.add_argument("--no-reset", action="store_true", help="Do not reset devices")
+    parser.add_argument("--mpremote", default="mpremote", help="mpremote command")
+    args = parser.parse_args()
+
+    files = prod_image() if args.mode == "prod" else dev_image()
+    command = tuple(args.mpremote.split())
+
+    results = deploy(
+        args.ports,
+        files,
+        transport_factory=lambda port: MpremoteTransport(port, command),
+        force=args.force,
+        reset=not args.no_reset,
+    )
+
+    failed = False
+    for result in results:
+        if result.ok:
+            print(
+                f"{result.port}: {len(result.uploaded)} uploaded, "
+                f"{len(result.removed)} removed, {result.unchanged} unchanged"
+            )
+        else:
+            failed = True
+            print(f"{result.port}: FAILED - {result.error}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Host-side hardware emulators.
+
+Register-level stand-ins for the peripherals the firmware talks to, so
+drivers run unmodified on CPython and their bus traffic can be counted.
+
+Runtime provides machine, time, micropython and esp32 on a virtual
+clock; peripheral emulators attach to it.
+
+Usage:
+    from scripts.emulator import Runtime, VL53L0XEmulator
+
+    runtime = Runtime()
+    runtime.install()  # before importing firmware modules
+    sensor = runtime.attach_i2c(VL53L0XEmulator(distance_mm=400))
+    radar = runtime.attach_uart(LD2410Emulator(distance_cm=120), uart_id=1)
+"""
+from .clock import VirtualClock
+from .ld2410 import LD2410Emulator, report_frame
+from .runtime import DeepSleep, Runtime
+from .vl53l0x import VL53L0XEmulator
+
+__all__ = [
+    "DeepSleep",
+    "LD2410Emulator",
+    "Runtime",
+    "VL53L0XEmulator",
+    "VirtualClock",
+    "report_frame",
+]
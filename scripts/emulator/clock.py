@@ -0,0 +1,111 @@
+"""
+Virtual clock.
+
+Microsecond clock that only moves when told to. Sleeps advance it
+instantly and run any alarms (timers, pin edges) that fall due on the
+way, in time order, so hours of device behaviour replay in seconds.
+
+Tick values wrap like MicroPython's (TICKS_PERIOD), so code that
+compares raw ticks instead of using ticks_diff fails here as well.
+"""
+import heapq
+
+TICKS_PERIOD = 1 << 30
+TICKS_MAX = TICKS_PERIOD - 1
+TICKS_HALF = TICKS_PERIOD // 2
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    """MicroPython time.ticks_add."""
+    return (ticks + delta) & TICKS_MAX
+
+
+def ticks_diff(end: int, start: int) -> int:
+    """MicroPython time.ticks_diff."""
+    return ((end - start + TICKS_HALF) & TICKS_MAX) - TICKS_HALF
+
+
+class Alarm:
+    """Callback scheduled on the virtual clock (see VirtualClock.call_at)."""
+
+    __slots__ = ("callback", "cancelled", "due_us", "seq")
+
+    def __init__(self, due_us: int, seq: int, callback) -> None:
+        self.due_us = due_us
+        self.seq = seq
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other) -> bool:
+        return (self.due_us, self.seq) < (other.due_us, other.seq)
+
+    def cancel(self) -> None:
+        """Prevent the alarm from firing."""
+        self.cancelled = True
+
+
+class VirtualClock:
+    """
+    Monotonic microsecond clock with alarms.
+
+    Attributes:
+        now_us: Microseconds since reset (never wraps).
+    """
+
+    def __init__(self) -> None:
+        """Initialize clock at zero."""
+        self.now_us = 0
+        self._alarms = []
+        self._seq = 0
+
+    def reset(self) -> None:
+        """Return to zero and drop all alarms."""
+        self.now_us = 0
+        self._alarms = []
+        self._seq = 0
+
+    @property
+    def now_ms(self) -> int:
+        """Milliseconds since reset (never wraps)."""
+        return self.now_us // 1000
+
+    def ticks_ms(self) -> int:
+        """MicroPython time.ticks_ms."""
+        return (self.now_us // 1000) & TICKS_MAX
+
+    def ticks_us(self) -> int:
+        """MicroPython time.ticks_us."""
+        return self.now_us & TICKS_MAX
+
+    def call_at(self, due_us: int, callback) -> Alarm:
+        """
+        Run callback() when the clock reaches due_us.
+
+        Returns:
+            Alarm handle (cancel() to drop it).
+        """
+        self._seq += 1
+        alarm = Alarm(max(due_us, self.now_us), self._seq, callback)
+        heapq.heappush(self._alarms, alarm)
+        return alarm
+
+    def next_alarm_us(self):
+        """Return due time of the next pending alarm, or None."""
+        while self._alarms and self._alarms[0].cancelled:
+            heapq.heappop(self._alarms)
+        return self._alarms[0].due_us if self._alarms else None
+
+    def advance_us(self, delta_us: int) -> None:
+        """Move time forward, firing alarms that fall due in order."""
+        self.advance_to_us(self.now_us + max(0, int(delta_us)))
+
+    def advance_to_us(self, target_us: int) -> None:
+        """Move time forward to target_us, firing alarms on the way."""
+        while True:
+            due = self.next_alarm_us()
+            if due is None or due > target_us:
+                break
+            alarm = heapq.heappop(self._alarms)
+            self.now_us = max(self.now_us, alarm.due_us)
+            alarm.callback()
+        self.now_us = max(self.now_us, target_us)
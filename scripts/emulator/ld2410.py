@@ -0,0 +1,114 @@
+"""
+LD2410 mmWave radar emulator.
+
+Streams report frames on an emulated UART (see Runtime.attach_uart),
+one every period_ms of virtual time, in basic or engineering mode.
+report_frame() builds single frames for hand-written or recorded
+byte streams.
+"""
+import struct
+
+HEADER = b"\xf4\xf3\xf2\xf1"
+TAIL = b"\xf8\xf7\xf6\xf5"
+GATES = 9
+
+
+def report_frame(
+    state: int,
+    moving_cm: int = 0,
+    moving_energy: int = 0,
+    still_cm: int = 0,
+    still_energy: int = 0,
+    detect_cm: int | None = None,
+    engineering: bool = False,
+) -> bytes:
+    """
+    Build one LD2410 report frame.
+
+    Args:
+        state: Target state bits (1 moving, 2 stationary).
+        moving_cm, still_cm: Target distances.
+        moving_energy, still_energy: Target energies (0-100).
+        detect_cm: Detection distance (default: nearest target).
+        engineering: Append per-gate energies (engineering mode).
+
+    Returns:
+        Complete frame including header, length and tail.
+    """
+    if detect_cm is None:
+        distances = [d for bit, d in ((1, moving_cm), (2, still_cm)) if state & bit]
+        detect_cm = min(distances) if distances else 0
+    data = struct.pack(
+        "<BBBHBHBH",
+        0x01 if engineering else 0x02, 0xAA, state,
+        moving_cm, moving_energy, still_cm, still_energy, detect_cm,
+    )
+    if engineering:
+        data += bytes((GATES - 1, GATES - 1))
+        data += bytes(moving_energy if state & 1 else 0 for _ in range(GATES))
+        data += bytes(still_energy if state & 2 else 0 for _ in range(GATES))
+        data += b"\x00\x00"  # Light sensor, OUT pin
+    data += b"\x55\x00"
+    return HEADER + struct.pack("<H", len(data)) + data + TAIL
+
+
+class LD2410Emulator:
+    """
+    Emulated LD2410 streaming reports on a UART.
+
+    Attributes:
+        clock: Callable returning milliseconds.
+        distance_cm: Target distance, None for an empty room, or a
+            callable(now_ms) returning either (scripted scenes).
+        moving: Report the target as moving instead of stationary.
+        engineering: Send engineering-mode frames.
+        period_ms: Time between reports.
+        frames: Reports sent.
+    """
+
+    def __init__(
+        self,
+        distance_cm=None,
+        moving: bool = False,
+        engineering: bool = False,
+        period_ms: int = 100,
+    ) -> None:
+        """
+        Initialize emulator.
+
+        Args:
+            distance_cm: Initial target distance (see attributes).
+            moving: Report a moving target.
+            engineering: Send engineering-mode frames.
+            period_ms: Report interval.
+        """
+        self.clock = lambda: 0
+        self.distance_cm = distance_cm
+        self.moving = moving
+        self.engineering = engineering
+        self.period_ms = period_ms
+        self.frames = 0
+        self._next_ms = None
+
+    def stream(self) -> bytes:
+        """Return the frames sent since the last call."""
+        now = self.clock()
+        if self._next_ms is None:
+            self._next_ms = now
+        data = b""
+        while self._next_ms <= now:
+            data += self.frame(self._next_ms)
+            self._next_ms += self.period_ms
+        return data
+
+    def frame(self, now_ms: int) -> bytes:
+        """Build the report for the scene at now_ms."""
+        distance = self.distance_cm
+        if callable(distance):
+            distance = distance(now_ms)
+        self.frames += 1
+        if distance is None:
+            return report_frame(0, engineering=self.engineering)
+        if self.moving:
+            return report_frame(1, distance, 60, engineering=self.engineering)
+        return report_frame(2, still_cm=distance, still_energy=40, engineering=self.engineering)
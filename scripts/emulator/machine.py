@@ -0,0 +1,484 @@
+"""
+Emulated machine module.
+
+Pin, PWM, Timer and I2C with real semantics on a Runtime's virtual
+clock. The classes here are bound to a runtime by Runtime, which
+subclasses them with a _runtime attribute; use runtime.machine.Pin
+(or `from machine import Pin` after runtime.install()).
+"""
+import errno
+
+
+class PinState:
+    """
+    Shared state of one GPIO; every Pin(id) object views the same state.
+
+    The level seen by the firmware comes from, in order: an external
+    drive (drive()), a connected source (connect()), the output latch
+    in OUT/OPEN_DRAIN mode, then the pull resistor. Pin hold (init(hold=
+    True)) freezes the output level until released; writes meanwhile
+    only reach the latch.
+    """
+
+    def __init__(self, runtime, pin_id) -> None:
+        self._runtime = runtime
+        self.id = pin_id
+        self.mode = None
+        self.pull = None
+        self.output = 0
+        self.held = None      # Output level frozen by Pin hold
+        self.driven = None
+        self.source = None
+        self.handler = None
+        self.trigger = 0
+        self.hard = False
+        self.writes = 0
+        self.pulse_us = None  # time_pulse_us() result: int or callable
+        self.watchers = []    # callables(level) run on every level change
+
+    @property
+    def level(self) -> int:
+        """Return current pin level."""
+        if self.driven is not None:
+            return self.driven
+        if self.source is not None:
+            return 1 if self.source() else 0
+        if self.mode in (Pin.OUT, Pin.OPEN_DRAIN):
+            return self.output if self.held is None else self.held
+        return 1 if self.pull == Pin.PULL_UP else 0
+
+    def drive(self, level: int) -> None:
+        """Drive pin from outside the MCU (fires pin IRQs on edges)."""
+        before = self.level
+        self.driven = 1 if level else 0
+        self._edge(before)
+
+    def release(self) -> None:
+        """Stop driving the pin externally."""
+        before = self.level
+        self.driven = None
+        self._edge(before)
+
+    def connect(self, source) -> None:
+        """Read the pin level from source() (e.g. a sensor's GPIO output)."""
+        self.source = source
+
+    def watch(self, callback) -> None:
+        """Call callback(level) whenever the level changes (e.g. XSHUT wiring)."""
+        self.watchers.append(callback)
+
+    def write(self, value: int) -> None:
+        """Set output latch from firmware."""
+        before = self.level
+        self.output = 1 if value else 0
+        self.writes += 1
+        self._edge(before)
+
+    def _edge(self, before: int) -> None:
+        """Fire IRQ handler if the level changed in a triggering direction."""
+        after = self.level
+        if after == before:
+            return
+        for watcher in self.watchers:
+            watcher(after)
+        if self.handler is None:
+            return
+        trigger = Pin.IRQ_RISING if after else Pin.IRQ_FALLING
+        if not self.trigger & trigger:
+            return
+        if self.hard:
+            self._runtime.irq(self.handler, self.view)
+        else:
+            # Soft IRQs run later, from the scheduler; the level may have moved on
+            self._runtime.soft_irq(self.handler, self.view)
+
+    @property
+    def view(self):
+        """Return a Pin object for this state (IRQ handler argument)."""
+        return self._runtime.machine.Pin(self.id)
+
+
+class Pin:
+    """machine.Pin."""
+
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_UP = 2
+    PULL_DOWN = 1
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+    WAKE_LOW = 4
+    WAKE_HIGH = 5
+
+    _runtime = None
+
+    def __init__(self, id, mode: int = -1, pull: int = -1, **kwargs) -> None:
+        self._state = self._runtime.pin(id)
+        self.init(mode, pull, **kwargs)
+
+    def init(
+        self,
+        mode: int = -1,
+        pull: int = -1,
+        *,
+        value=None,
+        hold: bool | None = None,
+        **kwargs,
+    ) -> None:
+        """Reconfigure pin (one edge for the combined level change)."""
+        state = self._state
+        before = state.level
+        if mode != -1 and mode is not None:
+            state.mode = mode
+        if pull != -1:
+            state.pull = pull
+        if value is not None:
+            state.output = 1 if value else 0
+            state.writes += 1
+        if hold is not None:
+            state.held = state.output if hold else None
+        state._edge(before)
+
+    def value(self, x=None):
+        """Read level, or set output latch."""
+        if x is None:
+            return self._state.level
+        self._state.write(x)
+        return None
+
+    __call__ = value
+
+    def on(self) -> None:
+        self._state.write(1)
+
+    def off(self) -> None:
+        self._state.write(0)
+
+    high = on
+    low = off
+
+    def irq(
+        self,
+        handler=None,
+        trigger: int = IRQ_FALLING | IRQ_RISING,
+        *,
+        hard: bool = False,
+        **kwargs,
+    ):
+        """Install edge interrupt handler."""
+        self._state.handler = handler
+        self._state.trigger = trigger if handler is not None else 0
+        self._state.hard = hard
+        return self
+
+    def __repr__(self) -> str:
+        return f"Pin({self._state.id})"
+
+
+class PWMTrace:
+    """
+    Duty history of one PWM output.
+
+    Attributes:
+        changes: [(time_us, duty_u16)] each time the duty changed.
+        writes: Duty writes issued, including redundant ones.
+        freq: Current frequency in Hz.
+        active: False after deinit().
+    """
+
+    def __init__(self, clock) -> None:
+        self._clock = clock
+        self.changes = [(clock.now_us, 0)]
+        self.writes = 0
+        self.freq = 0
+        self.active = True
+
+    @property
+    def duty(self) -> int:
+        """Return current duty (0-65535)."""
+        return self.changes[-1][1]
+
+    def set(self, duty_u16: int) -> None:
+        """Record a duty write."""
+        self.writes += 1
+        duty_u16 = max(0, min(65535, int(duty_u16)))
+        if duty_u16 != self.changes[-1][1]:
+            self.changes.append((self._clock.now_us, duty_u16))
+
+    def duty_at(self, time_us: int) -> int:
+        """Return duty in effect at time_us."""
+        duty = 0
+        for when, value in self.changes:
+            if when > time_us:
+                break
+            duty = value
+        return duty
+
+    def mean(self, start_us: int = 0, end_us: int | None = None) -> float:
+        """Return time-weighted mean duty over [start_us, end_us] as 0.0-1.0."""
+        if end_us is None:
+            end_us = self._clock.now_us
+        if end_us <= start_us:
+            return self.duty_at(start_us) / 65535
+        area = 0
+        for i, (when, value) in enumerate(self.changes):
+            until = self.changes[i + 1][0] if i + 1 < len(self.changes) else end_us
+            lo = max(when, start_us)
+            hi = min(until, end_us)
+            if hi > lo:
+                area += value * (hi - lo)
+        return area / (65535 * (end_us - start_us))
+
+
+class PWM:
+    """machine.PWM (duty history in runtime.pwm(pin))."""
+
+    _runtime = None
+
+    def __init__(self, dest, *, freq: int | None = None, duty: int | None = None,
+                 duty_u16: int | None = None, duty_ns: int | None = None, **kwargs) -> None:
+        pin_id = dest._state.id if isinstance(dest, Pin) else dest
+        self._trace = self._runtime.pwm(pin_id)
+        self._trace.active = True
+        self.init(freq=freq, duty=duty, duty_u16=duty_u16, duty_ns=duty_ns)
+
+    def init(self, *, freq: int | None = None, duty: int | None = None,
+             duty_u16: int | None = None, duty_ns: int | None = None, **kwargs) -> None:
+        """Reconfigure output."""
+        if freq is not None:
+            self._trace.freq = freq
+        if duty_u16 is not None:
+            self.duty_u16(duty_u16)
+        elif duty is not None:
+            self.duty(duty)
+        elif duty_ns is not None:
+            self.duty_ns(duty_ns)
+
+    def freq(self, value: int | None = None):
+        if value is None:
+            return self._trace.freq
+        self._trace.freq = value
+        return None
+
+    def duty_u16(self, value: int | None = None):
+        if value is None:
+            return self._trace.duty
+        self._trace.set(value)
+        return None
+
+    def duty(self, value: int | None = None):
+        """10-bit duty (ESP32 legacy API)."""
+        if value is None:
+            return self._trace.duty >> 6
+        self._trace.set(value * 65535 // 1023)
+        return None
+
+    def duty_ns(self, value: int | None = None):
+        period_ns = 1000000000 // (self._trace.freq or 1)
+        if value is None:
+            return self._trace.duty * period_ns // 65535
+        self._trace.set(value * 65535 // period_ns)
+        return None
+
+    def deinit(self) -> None:
+        self._trace.set(0)
+        self._trace.active = False
+
+
+class Timer:
+    """machine.Timer (callbacks run in IRQ context on the virtual clock)."""
+
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    _runtime = None
+
+    def __init__(self, id: int = -1, **kwargs) -> None:
+        self._id = id
+        self._alarm = None
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, *, mode: int = PERIODIC, period: int = -1, freq: float = -1,
+             callback=None, tick_hz: int = 1000) -> None:
+        """Start timer."""
+        self.deinit()
+        if freq > 0:
+            self._period_us = max(1, int(1000000 / freq))
+        else:
+            self._period_us = max(1, period * 1000000 // tick_hz)
+        self._mode = mode
+        self._callback = callback
+        clock = self._runtime.clock
+        self._alarm = clock.call_at(clock.now_us + self._period_us, self._fire)
+
+    def deinit(self) -> None:
+        """Stop timer."""
+        if self._alarm is not None:
+            self._alarm.cancel()
+            self._alarm = None
+
+    def _fire(self) -> None:
+        """Alarm handler: reschedule, then run callback as an IRQ."""
+        due = self._alarm.due_us
+        if self._mode == self.PERIODIC:
+            self._alarm = self._runtime.clock.call_at(due + self._period_us, self._fire)
+        else:
+            self._alarm = None
+        if self._callback is not None:
+            self._runtime.irq(self._callback, self)
+
+
+class I2C:
+    """
+    machine.I2C routing transactions to devices attached to the runtime.
+
+    Each transaction advances the clock by its bus time at freq.
+    Missing addresses raise OSError(ENODEV) like the real port. When
+    several devices answer one address, all receive writes and the
+    first attached one answers reads.
+    """
+
+    _runtime = None
+
+    def __init__(self, id: int = 0, *, scl=None, sda=None, freq: int = 400000, **kwargs) -> None:
+        self._devices = self._runtime.i2c_bus(id)
+        self._freq = freq
+
+    def scan(self) -> list:
+        return sorted({
+            device.address for device in self._devices if self._answers(device)
+        })
+
+    def readfrom_mem(self, addr: int, memaddr: int, nbytes: int, **kwargs) -> bytes:
+        data = self._responders(addr)[0].readfrom_mem(addr, memaddr, nbytes)
+        self._bus_time(nbytes, read=True)
+        return data
+
+    def readfrom_mem_into(self, addr: int, memaddr: int, buf, **kwargs) -> None:
+        self._responders(addr)[0].readfrom_mem_into(addr, memaddr, buf)
+        self._bus_time(len(buf), read=True)
+
+    def writeto_mem(self, addr: int, memaddr: int, buf, **kwargs) -> None:
+        for device in self._responders(addr):
+            device.writeto_mem(addr, memaddr, buf)
+        self._bus_time(len(buf), read=False)
+
+    @staticmethod
+    def _answers(device) -> bool:
+        """Return True if device is on the bus (present and powered)."""
+        return getattr(device, "present", True) and getattr(device, "powered", True)
+
+    def _responders(self, addr: int) -> list:
+        devices = [
+            device for device in self._devices
+            if device.address == addr and self._answers(device)
+        ]
+        if not devices:
+            # Absent or unpowered device: it counts and rejects the transaction
+            for device in self._devices:
+                if device.address == addr:
+                    return [device]
+            self._bus_time(0, read=False)
+            raise OSError(errno.ENODEV)
+        return devices
+
+    def _bus_time(self, nbytes: int, read: bool) -> None:
+        """Advance clock by transfer time (9 clocks per byte)."""
+        frames = 2 + nbytes + (1 if read else 0)  # address, register, data
+        self._runtime.clock.advance_us(frames * 9 * 1000000 // self._freq)
+
+
+SoftI2C = I2C
+
+
+class UARTState:
+    """
+    Shared state of one UART: receive FIFO and transmitted bytes.
+
+    A device attached with Runtime.attach_uart() is polled for its
+    stream whenever the firmware looks at the FIFO. Bytes beyond
+    rxbuf are dropped and counted, like the driver's ring buffer;
+    bytes sent while the CPU is in light sleep are lost.
+    """
+
+    def __init__(self) -> None:
+        self.rx = bytearray()
+        self.tx = bytearray()
+        self.rxbuf = 256
+        self.baudrate = None
+        self.overruns = 0
+        self.lost = 0
+        self.device = None
+
+    def feed(self, data) -> None:
+        """Receive bytes from the remote side."""
+        room = max(0, self.rxbuf - len(self.rx))
+        self.rx.extend(data[:room])
+        self.overruns += max(0, len(data) - room)
+
+    def poll(self) -> None:
+        """Pull pending bytes from the attached device."""
+        if self.device is not None:
+            self.feed(self.device.stream())
+
+    def drop(self) -> None:
+        """Discard what the device sent while the receiver was off."""
+        if self.device is not None:
+            self.lost += len(self.device.stream())
+
+
+class UART:
+    """machine.UART on a shared receive FIFO (see Runtime.uart)."""
+
+    _runtime = None
+
+    def __init__(self, id: int, baudrate: int = 115200, *, rxbuf: int = 256, **kwargs) -> None:
+        self._state = self._runtime.uart(id)
+        self._state.baudrate = baudrate
+        self._state.rxbuf = rxbuf
+
+    def any(self) -> int:
+        self._state.poll()
+        return len(self._state.rx)
+
+    def readinto(self, buf, nbytes: int | None = None):
+        state = self._state
+        state.poll()
+        count = min(len(buf) if nbytes is None else nbytes, len(state.rx))
+        if not count:
+            return None  # Timeout without data
+        buf[:count] = state.rx[:count]
+        del state.rx[:count]
+        return count
+
+    def read(self, nbytes: int | None = None):
+        state = self._state
+        state.poll()
+        count = len(state.rx) if nbytes is None else min(nbytes, len(state.rx))
+        if not count:
+            return None
+        data = bytes(state.rx[:count])
+        del state.rx[:count]
+        return data
+
+    def write(self, buf) -> int:
+        self._state.tx.extend(buf)
+        return len(buf)
+
+    def deinit(self) -> None:
+        pass
+
+
+class WDT:
+    """machine.WDT (records feeds; never resets)."""
+
+    _runtime = None
+
+    def __init__(self, id: int = 0, timeout: int = 5000) -> None:
+        self.timeout = timeout
+        self.feeds = 0
+
+    def feed(self) -> None:
+        self.feeds += 1
@@ -0,0 +1,384 @@
+"""
+Virtual MicroPython runtime.
+
+Builds machine, time, micropython and esp32 modules on one virtual
+clock and installs them in sys.modules, so unmodified firmware runs on
+CPython:
+
+    runtime = Runtime()
+    runtime.install()
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=400))
+
+    from main import MirrorLightApp, create_sensor
+    app = MirrorLightApp(create_sensor())
+    while runtime.clock.now_ms < 3600 * 1000:
+        app.step()
+
+sleep_ms()/lightsleep() return immediately after advancing the clock;
+Timer and Pin IRQ callbacks fire at their virtual due time, followed
+by any callbacks queued with micropython.schedule().
+"""
+import sys
+import time as _host_time
+import types
+
+from . import machine as _machine
+from .clock import VirtualClock, ticks_add, ticks_diff
+
+
+class DeepSleep(Exception):
+    """Raised by machine.deepsleep(): the device would reset."""
+
+
+class _TimeModule(types.ModuleType):
+    """time module; names MicroPython lacks fall through to the host."""
+
+    def __getattr__(self, name):
+        return getattr(_host_time, name)
+
+
+class Runtime:
+    """
+    Emulated MicroPython environment on a virtual clock.
+
+    Attributes:
+        clock: VirtualClock shared by every emulated module.
+        machine, time, micropython, esp32: Emulated modules.
+        light_sleeps: Number of machine.lightsleep() calls.
+        light_sleep_us: Virtual time spent in light sleep.
+        wake_resolution_us: Pin check interval while light-sleeping
+            with an ext0 wake source.
+        soft_irq_latency_us: Delay before a soft (hard=False) pin IRQ
+            handler runs; reset to 0 by reset().
+    """
+
+    SCHEDULE_DEPTH = 4  # MicroPython default MICROPY_SCHEDULER_DEPTH
+    MODULES = ("machine", "time", "micropython", "esp32")
+
+    def __init__(self, wake_resolution_us: int = 1000) -> None:
+        """
+        Initialize runtime and build its modules.
+
+        Args:
+            wake_resolution_us: Pin check interval for ext0 wake.
+        """
+        self.clock = VirtualClock()
+        self.wake_resolution_us = wake_resolution_us
+        self._saved = {}
+        self._reset_state()
+
+        self.machine = self._build_machine()
+        self.time = self._build_time()
+        self.micropython = self._build_micropython()
+        self.esp32 = self._build_esp32()
+
+    # Setup
+
+    def install(self) -> None:
+        """Register emulated modules in sys.modules."""
+        for name in self.MODULES:
+            self._saved.setdefault(name, sys.modules.get(name))
+            sys.modules[name] = getattr(self, name)
+
+    def uninstall(self) -> None:
+        """Restore the modules replaced by install()."""
+        for name, module in self._saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        self._saved = {}
+
+    def reset(self) -> None:
+        """Power-cycle: clock to zero, pins, buses and PWM cleared."""
+        self.clock.reset()
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._pins = {}
+        self._pwm = {}
+        self._i2c = {}
+        self._uarts = {}
+        self._scheduled = []
+        self._in_irq = False
+        self._ext0 = None
+        self._deep_sleep_hold = False
+        self.light_sleeps = 0
+        self.light_sleep_us = 0
+        self.deep_sleeps = 0
+        self.soft_irq_latency_us = 0
+
+    # Hardware access for tests and simulations
+
+    def pin(self, pin_id):
+        """Return shared state of a GPIO (drive/connect/level)."""
+        state = self._pins.get(pin_id)
+        if state is None:
+            state = self._pins[pin_id] = _machine.PinState(self, pin_id)
+        return state
+
+    def pwm(self, pin_id):
+        """Return duty history of a PWM output."""
+        trace = self._pwm.get(pin_id)
+        if trace is None:
+            trace = self._pwm[pin_id] = _machine.PWMTrace(self.clock)
+        return trace
+
+    def uart(self, uart_id: int):
+        """Return shared state of a UART (feed()/rx/tx)."""
+        state = self._uarts.get(uart_id)
+        if state is None:
+            state = self._uarts[uart_id] = _machine.UARTState()
+        return state
+
+    def i2c_bus(self, bus_id: int) -> list:
+        """Return devices attached to an I2C bus."""
+        return self._i2c.setdefault(bus_id, [])
+
+    def attach_i2c(self, device, bus: int = 0):
+        """
+        Put a device on an I2C bus.
+
+        The device needs an address attribute and the machine.I2C
+        memory methods; its clock attribute (if any) is set to this
+        runtime's monotonic millisecond clock. Transactions are routed
+        by the device's current address, so it may change at run time.
+        """
+        if hasattr(device, "clock"):
+            device.clock = self._monotonic_ms
+        self.i2c_bus(bus).append(device)
+        return device
+
+    def attach_uart(self, device, uart_id: int = 1):
+        """
+        Connect a streaming device to a UART.
+
+        The device needs a stream() method returning the bytes it sent
+        since the last call; its clock attribute (if any) is set to
+        this runtime's monotonic millisecond clock.
+        """
+        if hasattr(device, "clock"):
+            device.clock = self._monotonic_ms
+        self.uart(uart_id).device = device
+        return device
+
+    def connect_echo(self, trigger_id, echo_id, delay_us: int = 450) -> None:
+        """
+        Wire an ultrasonic module: a trigger pulse produces an echo pulse.
+
+        After each falling trigger edge the echo pin goes high after
+        delay_us (the burst time of the module) and low again after the
+        echo pin's pulse_us (int or callable). With pulse_us None there
+        is no echo, as with nothing in range.
+        """
+        echo = self.pin(echo_id)
+
+        def on_trigger(level: int) -> None:
+            if level or echo.pulse_us is None:
+                return
+            duration = echo.pulse_us() if callable(echo.pulse_us) else echo.pulse_us
+            rise_us = self.clock.now_us + delay_us
+            self.clock.call_at(rise_us, lambda: echo.drive(1))
+            self.clock.call_at(rise_us + duration, echo.release)
+
+        self.pin(trigger_id).watch(on_trigger)
+
+    def advance(self, ms: int) -> None:
+        """Let ms of virtual time pass (fires due callbacks)."""
+        self._sleep_us(ms * 1000)
+
+    # IRQ and scheduler
+
+    def irq(self, handler, arg) -> None:
+        """Run handler(arg) in IRQ context, then pending scheduled calls."""
+        nested = self._in_irq
+        self._in_irq = True
+        try:
+            handler(arg)
+        finally:
+            self._in_irq = nested
+        if not nested:
+            self._run_scheduled()
+
+    def soft_irq(self, handler, arg) -> None:
+        """Run a soft IRQ handler soft_irq_latency_us after its event."""
+        if not self.soft_irq_latency_us:
+            self.irq(handler, arg)
+            return
+        due = self.clock.now_us + self.soft_irq_latency_us
+        self.clock.call_at(due, lambda: self.irq(handler, arg))
+
+    def _schedule(self, func, arg) -> None:
+        if len(self._scheduled) >= self.SCHEDULE_DEPTH:
+            raise RuntimeError("schedule queue full")
+        self._scheduled.append((func, arg))
+
+    def _run_scheduled(self) -> None:
+        while self._scheduled and not self._in_irq:
+            func, arg = self._scheduled.pop(0)
+            func(arg)
+
+    # Time
+
+    def _monotonic_ms(self) -> int:
+        return self.clock.now_ms
+
+    def _sleep_us(self, duration_us: int) -> None:
+        self._run_scheduled()
+        self.clock.advance_us(duration_us)
+        self._run_scheduled()
+
+    def _light_sleep(self, time_ms: int | None = None) -> None:
+        self.light_sleeps += 1
+        # The UART is clocked off in light sleep: what arrives meanwhile is lost
+        for state in self._uarts.values():
+            state.poll()
+        start = self.clock.now_us
+        if time_ms is None:
+            time_ms = 0x7FFFFFFF
+        end = start + time_ms * 1000
+        if self._ext0 is None:
+            self._sleep_us(end - start)
+        else:
+            pin, level = self._ext0
+            while self.clock.now_us < end and pin.level != level:
+                step = min(self.wake_resolution_us, end - self.clock.now_us)
+                self._sleep_us(step)
+        self.light_sleep_us += self.clock.now_us - start
+        for state in self._uarts.values():
+            state.drop()
+
+    def _float_outputs(self) -> None:
+        """
+        Release outputs as deep sleep does: pulls take over the level.
+
+        Only pins held with Pin hold while esp32.gpio_deep_sleep_hold
+        is enabled keep their level (the rule for digital GPIOs).
+        """
+        for state in self._pins.values():
+            if state.mode not in (_machine.Pin.OUT, _machine.Pin.OPEN_DRAIN):
+                continue
+            if state.held is not None and self._deep_sleep_hold:
+                continue
+            before = state.level
+            state.mode = None
+            state._edge(before)
+
+    def _idle(self) -> None:
+        """Wait for the next interrupt (or 1ms if none is pending)."""
+        due = self.clock.next_alarm_us()
+        if due is None:
+            due = self.clock.now_us + 1000
+        self._sleep_us(due - self.clock.now_us)
+
+    # Module builders
+
+    def _bind(self, cls):
+        return type(cls.__name__, (cls,), {"_runtime": self})
+
+    def _build_machine(self) -> types.ModuleType:
+        runtime = self
+        module = types.ModuleType("machine")
+        module.Pin = self._bind(_machine.Pin)
+        module.PWM = self._bind(_machine.PWM)
+        module.Timer = self._bind(_machine.Timer)
+        module.I2C = self._bind(_machine.I2C)
+        module.SoftI2C = module.I2C
+        module.WDT = self._bind(_machine.WDT)
+        module.UART = self._bind(_machine.UART)
+
+        module.PWRON_RESET = 1
+        module.HARD_RESET = 2
+        module.WDT_RESET = 3
+        module.DEEPSLEEP_RESET = 4
+        module.SOFT_RESET = 5
+
+        def time_pulse_us(pin, pulse_level: int, timeout_us: int = 1000000) -> int:
+            """Return pin.pulse_us set on the pin state (-2/-1 on timeouts)."""
+            duration = pin._state.pulse_us
+            if duration is None:
+                runtime._sleep_us(timeout_us)
+                return -2
+            if callable(duration):
+                duration = duration()
+            if duration > timeout_us:
+                runtime._sleep_us(timeout_us)
+                return -1
+            runtime._sleep_us(duration)
+            return duration
+
+        def lightsleep(time_ms: int | None = None) -> None:
+            runtime._light_sleep(time_ms)
+
+        def deepsleep(time_ms: int | None = None) -> None:
+            runtime.deep_sleeps += 1
+            runtime._float_outputs()
+            raise DeepSleep(time_ms)
+
+        module.time_pulse_us = time_pulse_us
+        module.lightsleep = lightsleep
+        module.deepsleep = deepsleep
+        module.idle = self._idle
+        module.freq = lambda hz=None: 160000000 if hz is None else None
+        module.unique_id = lambda: b"\x24\x0a\xc4\x00\x00\x01"
+        module.reset_cause = lambda: module.PWRON_RESET
+        module.disable_irq = lambda: 0
+        module.enable_irq = lambda state=0: None
+        return module
+
+    def _build_time(self) -> types.ModuleType:
+        runtime = self
+        clock = self.clock
+        module = _TimeModule("time")
+
+        def ticks_ms() -> int:
+            runtime._run_scheduled()
+            return clock.ticks_ms()
+
+        def ticks_us() -> int:
+            runtime._run_scheduled()
+            return clock.ticks_us()
+
+        module.ticks_ms = ticks_ms
+        module.ticks_us = ticks_us
+        module.ticks_cpu = ticks_us
+        module.ticks_add = ticks_add
+        module.ticks_diff = ticks_diff
+        module.sleep = lambda seconds: runtime._sleep_us(int(seconds * 1000000))
+        module.sleep_ms = lambda ms: runtime._sleep_us(ms * 1000)
+        module.sleep_us = runtime._sleep_us
+        module.time = lambda: clock.now_us // 1000000
+        module.time_ns = lambda: clock.now_us * 1000
+        return module
+
+    def _build_micropython(self) -> types.ModuleType:
+        module = types.ModuleType("micropython")
+        module.schedule = self._schedule
+        module.const = lambda value: value
+        module.native = lambda func: func
+        module.viper = lambda func: func
+        module.alloc_emergency_exception_buf = lambda size: None
+        module.opt_level = lambda level=None: 0 if level is None else None
+        module.mem_info = lambda verbose=None: None
+        module.heap_lock = lambda: 0
+        module.heap_unlock = lambda: 0
+        module.kbd_intr = lambda char: None
+        return module
+
+    def _build_esp32(self) -> types.ModuleType:
+        runtime = self
+        module = types.ModuleType("esp32")
+        module.WAKEUP_ALL_LOW = False
+        module.WAKEUP_ANY_HIGH = True
+
+        def wake_on_ext0(pin, level: bool = False) -> None:
+            runtime._ext0 = None if pin is None else (pin._state, 1 if level else 0)
+
+        def gpio_deep_sleep_hold(enable: bool) -> None:
+            runtime._deep_sleep_hold = bool(enable)
+
+        module.wake_on_ext0 = wake_on_ext0
+        module.gpio_deep_sleep_hold = gpio_deep_sleep_hold
+        module.wake_on_ext1 = lambda pins, level=False: None
+        module.raw_temperature = lambda: 120
+        return module
@@ -0,0 +1,306 @@
+"""
+VL53L0X register-level emulator.
+
+Drop-in replacement for machine.I2C with one VL53L0X on the bus.
+Emulates the registers the driver uses:
+
+    0x00  SYSRANGE_START              single-shot, back-to-back, timed
+    0x04  INTERMEASUREMENT_PERIOD     timed-mode period (x OSC_CALIBRATE)
+    0x0A  INTERRUPT_CONFIG_GPIO       new-sample / level-low / level-high
+    0x0B  INTERRUPT_CLEAR
+    0x0C  THRESH_HIGH, 0x0E THRESH_LOW (2mm units)
+    0x13  RESULT_INTERRUPT_STATUS
+    0x14  RESULT_RANGE_STATUS block   range in bytes 10-11 (mm)
+    0x84  GPIO_HV_MUX_ACTIVE_HIGH     GPIO1 polarity
+    0x8A  I2C_SLAVE_DEVICE_ADDRESS    address change (lost on shutdown)
+    0xC0  MODEL_ID
+    0xFF  page select (page 1 writes do not touch page 0)
+
+Conversions complete conversion_ms after they start, measured on an
+injectable millisecond clock, so with the test time mock a measure()
+costs exactly the virtual time the real part would take. Every bus
+transaction and payload byte is counted.
+
+set_xshut() emulates the shutdown pin: low powers the part down,
+high boots it with power-on registers at the default address after
+BOOT_MS. Wire it to a runtime pin with runtime.pin(n).watch().
+"""
+import errno
+
+
+class VL53L0XEmulator:
+    """
+    Emulated VL53L0X behind a machine.I2C interface.
+
+    Attributes:
+        clock: Callable returning milliseconds.
+        distance_mm: Range reported by the next completed conversion,
+            or a callable(now_ms) returning it (scripted scenes).
+        conversion_ms: Time from start to result ready.
+        stalled: When True, conversions never complete (ranging timeout).
+        present: When False, every transaction fails with ENODEV.
+        powered: False while XSHUT is low.
+        power_cycles: Number of boots from XSHUT.
+        transactions: Number of I2C transactions.
+        bytes_read: Payload bytes read.
+        bytes_written: Payload bytes written.
+        conversions: Completed ranging operations.
+    """
+
+    ADDRESS = 0x29
+    OUT_OF_RANGE_MM = 8190
+    BOOT_MS = 2  # XSHUT high to I2C ready
+
+    _SYSRANGE_START = 0x00
+    _INTERMEASUREMENT_PERIOD = 0x04
+    _INTERRUPT_CONFIG_GPIO = 0x0A
+    _INTERRUPT_CLEAR = 0x0B
+    _THRESH_HIGH = 0x0C
+    _THRESH_LOW = 0x0E
+    _RESULT_INTERRUPT_STATUS = 0x13
+    _RESULT_RANGE_STATUS = 0x14
+    _RESULT_RANGE_MM = 0x1E
+    _GPIO_HV_MUX_ACTIVE_HIGH = 0x84
+    _I2C_SLAVE_DEVICE_ADDRESS = 0x8A
+    _MODEL_ID = 0xC0
+    _OSC_CALIBRATE_VAL = 0xF8
+    _PAGE_SELECT = 0xFF
+
+    _GPIO_LEVEL_LOW = 0x01
+    _GPIO_LEVEL_HIGH = 0x02
+    _GPIO_OUT_OF_WINDOW = 0x03
+    _GPIO_NEW_SAMPLE = 0x04
+
+    _RANGE_STATUS_VALID = 11 << 3
+
+    def __init__(
+        self,
+        clock=None,
+        distance_mm: int = 500,
+        conversion_ms: int = 33,
+        address: int = ADDRESS,
+        osc_calibrate: int = 0,
+    ) -> None:
+        """
+        Initialize emulator with power-on register values.
+
+        Args:
+            clock: Callable returning milliseconds (default time.ticks_ms).
+            distance_mm: Initial target range.
+            conversion_ms: Ranging time per sample.
+            address: I2C address the part answers on.
+            osc_calibrate: OSC_CALIBRATE_VAL register contents.
+        """
+        if clock is None:
+            import time
+            clock = time.ticks_ms
+        self.clock = clock
+        self.address = address
+        self.distance_mm = distance_mm
+        self.conversion_ms = conversion_ms
+        self.stalled = False
+        self.present = True
+        self.powered = True
+        self.power_cycles = 0
+        self._osc_calibrate = osc_calibrate
+        self._ready_at = None
+        self._off_since = 0
+        self._off_ms = 0
+
+        self._power_on_reset()
+        self._failures = 0
+        self._failure_errno = errno.EIO
+
+        self.transactions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.conversions = 0
+
+    def _power_on_reset(self) -> None:
+        """Load power-on register values and stop ranging."""
+        self._regs = bytearray(256)
+        self._page1 = bytearray(256)
+        self._regs[self._MODEL_ID] = 0xEE
+        self._regs[self._MODEL_ID + 1] = 0xAA
+        self._regs[self._MODEL_ID + 2] = 0x10
+        self._regs[self._INTERRUPT_CONFIG_GPIO] = self._GPIO_NEW_SAMPLE
+        self._regs[self._GPIO_HV_MUX_ACTIVE_HIGH] = 0x11
+        self._regs[self._OSC_CALIBRATE_VAL:self._OSC_CALIBRATE_VAL + 2] = (
+            self._osc_calibrate.to_bytes(2, "big")
+        )
+        self._timed = False
+        self._next_sample_at = None
+        self._interrupt = False
+
+    # machine.I2C interface
+
+    def scan(self) -> list:
+        """Return addresses that acknowledge."""
+        return [self.address] if self.present and self.powered else []
+
+    def readfrom_mem(self, addr: int, memaddr: int, nbytes: int) -> bytes:
+        """Read nbytes starting at register memaddr."""
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(addr, memaddr, buf)
+        return bytes(buf)
+
+    def readfrom_mem_into(self, addr: int, memaddr: int, buf) -> None:
+        """Read len(buf) bytes starting at register memaddr into buf."""
+        self._begin(addr)
+        regs = self._page()
+        for i in range(len(buf)):
+            buf[i] = regs[(memaddr + i) & 0xFF]
+        self.bytes_read += len(buf)
+
+    def writeto_mem(self, addr: int, memaddr: int, buf) -> None:
+        """Write buf starting at register memaddr."""
+        self._begin(addr)
+        self.bytes_written += len(buf)
+        paged = self._regs[self._PAGE_SELECT] == 0x01 and memaddr != self._PAGE_SELECT
+        regs = self._page1 if paged else self._regs
+        for i, value in enumerate(buf):
+            regs[(memaddr + i) & 0xFF] = value
+        if paged:
+            return
+        if memaddr == self._SYSRANGE_START:
+            self._start(buf[0])
+        elif memaddr == self._I2C_SLAVE_DEVICE_ADDRESS:
+            self.address = buf[0] & 0x7F
+        elif memaddr == self._INTERRUPT_CLEAR and buf[0] & 0x01:
+            self._interrupt = False
+            self._regs[self._RESULT_INTERRUPT_STATUS] = 0
+
+    # Test controls
+
+    def set_xshut(self, level: int) -> None:
+        """Drive the XSHUT pin (low = shutdown, rising edge = boot)."""
+        now = self.clock()
+        if not level and self.powered:
+            self.powered = False
+            self._off_since = now
+            self._power_on_reset()
+        elif level and not self.powered:
+            self.powered = True
+            self.power_cycles += 1
+            self._off_ms += now - self._off_since
+            self._ready_at = now + self.BOOT_MS
+            self.address = self.ADDRESS
+
+    @property
+    def off_ms(self) -> int:
+        """Return total time spent in shutdown."""
+        if self.powered:
+            return self._off_ms
+        return self._off_ms + self.clock() - self._off_since
+
+    def fail_next(self, count: int = 1, code: int = errno.EIO) -> None:
+        """Make the next count transactions raise OSError(code)."""
+        self._failures = count
+        self._failure_errno = code
+
+    def reset_counters(self) -> None:
+        """Clear transaction and byte counters."""
+        self.transactions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.conversions = 0
+
+    @property
+    def ranging(self) -> bool:
+        """Return True while a conversion or timed ranging is active."""
+        return self._next_sample_at is not None
+
+    @property
+    def gpio1(self) -> int:
+        """Return GPIO1 pin level (interrupt output)."""
+        self._update()
+        active_high = self._regs[self._GPIO_HV_MUX_ACTIVE_HIGH] & 0x10
+        if self._interrupt:
+            return 1 if active_high else 0
+        return 0 if active_high else 1
+
+    # Internals
+
+    def _begin(self, addr: int) -> None:
+        """Account for a transaction and apply injected errors."""
+        self.transactions += 1
+        if not self.present or not self.powered or addr != self.address:
+            raise OSError(errno.ENODEV)
+        if self._ready_at is not None and self.clock() < self._ready_at:
+            raise OSError(errno.ENODEV)  # Still booting
+        if self._failures:
+            self._failures -= 1
+            raise OSError(self._failure_errno)
+        self._update()
+
+    def _page(self) -> bytearray:
+        """Return register page currently selected for reads."""
+        return self._page1 if self._regs[self._PAGE_SELECT] == 0x01 else self._regs
+
+    def _start(self, value: int) -> None:
+        """Handle a SYSRANGE_START write."""
+        self._regs[self._SYSRANGE_START] = value & ~0x01
+        if value & 0x06:
+            # Back-to-back (0x02) or timed (0x04) continuous ranging
+            self._timed = True
+            self._next_sample_at = self.clock() + self.conversion_ms
+        elif value & 0x01:
+            if self._timed:
+                # Single-shot mode write stops continuous ranging
+                self._timed = False
+                self._next_sample_at = None
+            else:
+                self._next_sample_at = self.clock() + self.conversion_ms
+
+    def _period_ms(self) -> int:
+        """Return timed-mode sample interval."""
+        period = int.from_bytes(
+            self._regs[self._INTERMEASUREMENT_PERIOD:self._INTERMEASUREMENT_PERIOD + 4],
+            "big",
+        )
+        osc = int.from_bytes(
+            self._regs[self._OSC_CALIBRATE_VAL:self._OSC_CALIBRATE_VAL + 2], "big"
+        )
+        if osc:
+            period //= osc
+        return max(period, self.conversion_ms, 1)
+
+    def _update(self) -> None:
+        """Complete conversions that are due by now."""
+        if self._next_sample_at is None or self.stalled:
+            return
+        now = self.clock()
+        while self._next_sample_at is not None and now >= self._next_sample_at:
+            self._complete()
+            if self._timed:
+                self._next_sample_at += self._period_ms()
+            else:
+                self._next_sample_at = None
+
+    def _complete(self) -> None:
+        """Latch a ranging result and raise the interrupt if configured."""
+        distance = self.distance_mm
+        if callable(distance):
+            distance = distance(self.clock())
+        distance = max(0, min(int(distance), self.OUT_OF_RANGE_MM))
+        self.conversions += 1
+        self._regs[self._RESULT_RANGE_STATUS] = self._RANGE_STATUS_VALID
+        self._regs[self._RESULT_RANGE_MM:self._RESULT_RANGE_MM + 2] = distance.to_bytes(2, "big")
+
+        function = self._regs[self._INTERRUPT_CONFIG_GPIO] & 0x07
+        low = int.from_bytes(self._regs[self._THRESH_LOW:self._THRESH_LOW + 2], "big") * 2
+        high = int.from_bytes(self._regs[self._THRESH_HIGH:self._THRESH_HIGH + 2], "big") * 2
+        if function == self._GPIO_NEW_SAMPLE:
+            fire = True
+        elif function == self._GPIO_LEVEL_LOW:
+            fire = distance < low
+        elif function == self._GPIO_LEVEL_HIGH:
+            fire = distance > high
+        elif function == self._GPIO_OUT_OF_WINDOW:
+            fire = distance < low or distance > high
+        else:
+            fire = False
+
+        if fire:
+            self._interrupt = True
+            self._regs[self._RESULT_INTERRUPT_STATUS] = function
@@ -2,125 +2,167 @@
 """
 Simulator for testing without ESP32.
 
-Mocks hardware modules and simulates sensor readings.
+Runs the real firmware (src/main.py) on the emulated MicroPython
+runtime, with a VL53L0X emulator fed by a scripted scene of visits and
+walk-bys. Virtual time is fast-forwarded: an hour takes seconds.
+
+Usage:
+    uv run python scripts/simulate.py
+    uv run python scripts/simulate.py --hours 24 --visits 40 --seed 7
+    uv run python scripts/simulate.py --verbose   # firmware output
 """
+import argparse
+import contextlib
+import os
+import random
 import sys
 import time
-import random
-from unittest.mock import MagicMock
-
-sys.path.insert(0, str(__file__).replace("scripts/simulate.py", "src"))
-
-machine_mock = MagicMock()
-machine_mock.Pin = MagicMock
-machine_mock.time_pulse_us = MagicMock(return_value=1000)
-machine_mock.lightsleep = MagicMock()
-machine_mock.deepsleep = MagicMock()
-sys.modules["machine"] = machine_mock
-
-
-class SimulatedSensor:
-    """Simulates ultrasonic sensor readings."""
-
-    def __init__(self) -> None:
-        self._base_distance = 100.0
-        self._presence = False
-
-    def measure(self) -> float:
-        """Return simulated distance."""
-        if self._presence:
-            return random.uniform(15.0, 25.0)
-        return random.uniform(80.0, 120.0)
-
-    def set_presence(self, present: bool) -> None:
-        """Simulate presence or absence."""
-        self._presence = present
-
-
-class SimulatedLight:
-    """Simulates LED output."""
-
-    def __init__(self) -> None:
-        self._is_on = False
-
-    @property
-    def is_on(self) -> bool:
-        return self._is_on
-
-    def on(self) -> None:
-        if not self._is_on:
-            print("💡 LED ON")
-            self._is_on = True
-
-    def off(self) -> None:
-        if self._is_on:
-            print("   LED OFF")
-            self._is_on = False
-
-
-def run_simulation() -> None:
-    """Run interactive simulation."""
-    from lib.presence import PresenceDetector
-
-    sensor = SimulatedSensor()
-    light = SimulatedLight()
-
-    detector = PresenceDetector(
-        activation_ms=1500,
-        timeout_ms=5000,
-        on_activate=light.on,
-        on_deactivate=light.off,
-    )
-
+from pathlib import Path
+
+try:
+    from emulator import Runtime, VL53L0XEmulator
+except ImportError:
+    from scripts.emulator import Runtime, VL53L0XEmulator
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+EMPTY_ROOM_MM = 8190      # Nothing in range
+WALK_BY_MM = 900          # Someone passing behind
+APPROACH_FROM_MM = 1500   # Where visitors enter the sensor's view
+WALK_MS = 2000            # Time to walk up to / away from the mirror
+XSHUT_PIN = 10            # Sensor power pin for --sensor-power
+
+
+class Scene:
+    """
+    Scripted target distance over time.
+
+    Visits walk up to the mirror, stay, and walk away. Walk-bys pass
+    at a distance and should never switch the light on.
+    """
+
+    def __init__(self, duration_ms: int, visits: int, walk_bys: int, seed: int) -> None:
+        """
+        Generate random, non-overlapping visits and walk-bys.
+
+        Args:
+            duration_ms: Scene length.
+            visits: Number of visits.
+            walk_bys: Number of walk-bys.
+            seed: Random seed.
+        """
+        rng = random.Random(seed)
+        self.visits = []
+        self.walk_bys = []
+        slot_ms = duration_ms // max(1, visits + walk_bys)
+        kinds = ["visit"] * visits + ["walk_by"] * walk_bys
+        rng.shuffle(kinds)
+        for i, kind in enumerate(kinds):
+            start = i * slot_ms + rng.randrange(max(1, slot_ms // 2))
+            if kind == "visit":
+                stay = rng.randrange(10000, min(180000, max(10001, slot_ms // 2)))
+                distance = rng.randrange(150, 350)
+                self.visits.append((start, stay, distance))
+            else:
+                self.walk_bys.append((start, rng.randrange(800, 2500)))
+
+    def distance_mm(self, now_ms: int) -> int:
+        """Return target distance at now_ms."""
+        for start, stay, distance in self.visits:
+            if start <= now_ms < start + 2 * WALK_MS + stay:
+                t = now_ms - start
+                if t < WALK_MS:
+                    return APPROACH_FROM_MM - (APPROACH_FROM_MM - distance) * t // WALK_MS
+                if t < WALK_MS + stay:
+                    return distance
+                t -= WALK_MS + stay
+                return distance + (APPROACH_FROM_MM - distance) * t // WALK_MS
+        for start, length in self.walk_bys:
+            if start <= now_ms < start + length:
+                return WALK_BY_MM
+        return EMPTY_ROOM_MM
+
+
+def format_ms(ms: int) -> str:
+    """Format virtual time as hh:mm:ss.mmm."""
+    seconds, ms = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
+
+
+def run_simulation(args: argparse.Namespace) -> None:
+    """Run the firmware against a scene and print a timeline and summary."""
+    runtime = Runtime()
+    runtime.install()
+    sys.path.insert(0, str(SRC_DIR))
+
+    from config import PinConfig, PowerConfig
+    from main import MirrorLightApp, create_sensor
+
+    PowerConfig.USE_THRESHOLD_WAKE = args.threshold_wake
+    if args.sensor_power:
+        PinConfig.SENSOR_POWER = XSHUT_PIN
+
+    duration_ms = int(args.hours * 3600 * 1000)
+    scene = Scene(duration_ms, args.visits, args.walk_bys, args.seed)
+    sensor = runtime.attach_i2c(VL53L0XEmulator(distance_mm=scene.distance_mm))
+    runtime.pin(PinConfig.SENSOR_INT).connect(lambda: sensor.gpio1)
+    if args.sensor_power:
+        runtime.pin(XSHUT_PIN).pull = runtime.machine.Pin.PULL_UP  # Breakout pull-up
+        runtime.pin(XSHUT_PIN).watch(sensor.set_xshut)
+
+    started = time.perf_counter()
+    with (
+        open(os.devnull, "w") as devnull,
+        contextlib.redirect_stdout(sys.stdout if args.verbose else devnull),
+    ):
+        app = MirrorLightApp(create_sensor())
+        while runtime.clock.now_ms < duration_ms:
+            app.step()
+    wall_s = time.perf_counter() - started
+
+    led = runtime.pwm(PinConfig.LED)
     print("=" * 50)
     print("Mirror Light Simulator")
     print("=" * 50)
-    print("Commands:")
-    print("  p = Toggle presence (simulate someone approaching)")
-    print("  q = Quit")
-    print("=" * 50)
-    print()
-
-    presence = False
-
-    import threading
-    import select
-
-    stop_event = threading.Event()
-
-    def input_thread():
-        nonlocal presence
-        while not stop_event.is_set():
-            if sys.stdin in select.select([sys.stdin], [], [], 0.1)[0]:
-                cmd = sys.stdin.readline().strip().lower()
-                if cmd == "p":
-                    presence = not presence
-                    status = "PRESENT" if presence else "AWAY"
-                    print(f"\n>>> Simulating: {status}\n")
-                    sensor.set_presence(presence)
-                elif cmd == "q":
-                    stop_event.set()
-
-    input_handler = threading.Thread(target=input_thread, daemon=True)
-    input_handler.start()
-
-    try:
-        while not stop_event.is_set():
-            distance = sensor.measure()
-            is_present = distance < 30.0
-
-            detector.update(is_present)
-
-            status = f"Distance: {distance:5.1f}cm | State: {detector.state:10} | Light: {'ON ' if light.is_on else 'OFF'}"
-            print(f"\r{status}", end="", flush=True)
-
-            time.sleep(0.15)
-
-    except KeyboardInterrupt:
-        pass
-
-    print("\n\nSimulation ended.")
+    timeline = []
+    for start, stay, distance in scene.visits:
+        timeline.append((start, f"visit    {distance / 10:.0f}cm for {stay / 1000:.0f}s"))
+    for start, length in scene.walk_bys:
+        timeline.append((start, f"walk-by  {length}ms"))
+    activations = 0
+    for when_us, duty in led.changes[1:]:
+        if duty in (0, 65535):
+            activations += duty == 65535
+            timeline.append((when_us // 1000, f"  LED {'ON' if duty else 'OFF'}"))
+    for when_ms, text in sorted(timeline):
+        print(f"{format_ms(when_ms)}  {text}")
+    print("-" * 50)
+    print(f"Simulated:    {format_ms(runtime.clock.now_ms)} in {wall_s:.2f}s "
+          f"({runtime.clock.now_ms / 1000 / max(wall_s, 1e-9):.0f}x)")
+    print(f"Visits:       {len(scene.visits)} (walk-bys: {len(scene.walk_bys)})")
+    print(f"Activations:  {activations}")
+    print(f"LED duty:     {led.mean() * 100:.2f}% mean")
+    print(f"Light sleep:  {100 * runtime.light_sleep_us / max(1, runtime.clock.now_us):.1f}%")
+    print(f"Sensor:       {sensor.conversions} conversions, {sensor.transactions} I2C transactions")
+    print(f"Sensor off:   {100 * sensor.off_ms / max(1, runtime.clock.now_ms):.1f}% "
+          f"({sensor.power_cycles} power cycles)")
+    print(f"Jitter:       max {app.scheduler.max_jitter_us}us, missed {app.scheduler.missed}")
+
+
+def main() -> None:
+    """Parse arguments and run simulation."""
+    parser = argparse.ArgumentParser(description="Mirror light simulator")
+    parser.add_argument("--hours", type=float, default=1.0, help="Virtual duration")
+    parser.add_argument("--visits", type=int, default=6)
+    parser.add_argument("--walk-bys", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--threshold-wake", action="store_true", help="Sleep on sensor IRQ")
+    parser.add_argument("--sensor-power", action="store_true", help="Gate sensor via XSHUT")
+    parser.add_argument("--verbose", action="store_true", help="Show firmware output")
+    run_simulation(parser.parse_args())
 
 
 if __name__ == "__main__":
-    run_simulation()
+    main()
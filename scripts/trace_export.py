@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Convert latency trace dumps to Chrome trace / Perfetto JSON.
+
+With TraceConfig.ENABLED the firmware prints "@trace" lines after each
+activation (see src/core/trace.py). Capture the console, then convert:
+
+    uv run mpremote connect /dev/ttyUSB0 repl --capture capture.log
+    uv run python scripts/trace_export.py capture.log -o trace.json
+
+Open trace.json in https://ui.perfetto.dev or chrome://tracing. Each
+zone gets a track with its spans, plus a latency track with one slice
+per activation, from the start of the sensor conversion that first saw
+the person to the light at full brightness. A summary of the latency
+breakdown is printed to stdout.
+"""
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Dump format - must match src/core/trace.py
+DUMP_PREFIX = "@trace"
+POINTS = ("sensor", "filter", "enter", "dwell", "activate", "dispatch", "fade")
+PHASES = ("B", "E", "i")
+SENSOR, FILTER, ENTER, DWELL, ACTIVATE, DISPATCH, FADE = range(len(POINTS))
+BEGIN, END, INSTANT = range(len(PHASES))
+
+TICKS_PERIOD = 1 << 30  # MicroPython ticks_us wraps at this period
+LATENCY_TRACK = 100     # Latency track id is this plus the zone index
+
+
+@dataclass
+class TraceRecord:
+    """One trace point on an unwrapped microsecond timeline."""
+
+    us: int
+    point: int
+    phase: int
+    zone: int
+
+
+def parse_dump(lines) -> list:
+    """
+    Extract trace records from captured console lines.
+
+    Other output (log lines, REPL) is ignored. Tick wraparound is undone
+    so timestamps increase monotonically; successive dumps continue the
+    same timeline.
+
+    Raises:
+        ValueError: If a trace line is malformed.
+    """
+    records = []
+    last_raw = None
+    offset = 0
+    for line in lines:
+        fields = line.split()
+        if not fields or fields[0] != DUMP_PREFIX:
+            continue
+        if len(fields) != 5:
+            raise ValueError(f"Malformed trace line: {line.strip()!r}")
+        raw, point, phase, zone = (int(field) for field in fields[1:])
+        if point >= len(POINTS) or phase >= len(PHASES):
+            raise ValueError(f"Unknown trace point or phase: {line.strip()!r}")
+        if last_raw is not None and raw < last_raw:
+            offset += TICKS_PERIOD
+        last_raw = raw
+        records.append(TraceRecord(raw + offset, point, phase, zone))
+    return records
+
+
+def chrome_events(records: list) -> list:
+    """
+    Convert records to Chrome trace events.
+
+    Span ends whose beginning was overwritten on the device, and spans
+    still open at the end of the dump, are dropped.
+    """
+    events = []
+    for zone in sorted({record.zone for record in records}):
+        events.append(_thread_name(zone, f"zone {zone}"))
+        events.append(_thread_name(LATENCY_TRACK + zone, f"zone {zone} latency"))
+
+    open_spans = {}
+    for record in records:
+        key = (record.zone, record.point)
+        event = {
+            "name": POINTS[record.point],
+            "cat": "mirror",
+            "ph": PHASES[record.phase],
+            "ts": record.us,
+            "pid": 0,
+            "tid": record.zone,
+        }
+        if record.phase == BEGIN:
+            open_spans.setdefault(key, []).append(len(events))
+        elif record.phase == END:
+            if not open_spans.get(key):
+                continue
+            open_spans[key].pop()
+        else:
+            event["s"] = "t"
+        events.append(event)
+
+    unmatched = {index for stack in open_spans.values() for index in stack}
+    events = [event for index, event in enumerate(events) if index not in unmatched]
+
+    for latency in activation_latencies(records):
+        events.append({
+            "name": "latency",
+            "cat": "mirror",
+            "ph": "X",
+            "ts": latency["start_us"],
+            "dur": latency["end_us"] - latency["start_us"],
+            "pid": 0,
+            "tid": LATENCY_TRACK + latency["zone"],
+            "args": {key: value for key, value in latency.items() if key.endswith("_ms")},
+        })
+    return events
+
+
+def activation_latencies(records: list) -> list:
+    """
+    Break down each complete activation.
+
+    An activation runs from the begin of the sensor conversion that
+    produced the ENTER sample to the end of the following fade.
+
+    Returns:
+        One dict per activation with zone, start_us, end_us and the
+        total_ms, sensor_ms, filter_ms, dwell_ms, dispatch_ms and
+        fade_ms durations.
+    """
+    latencies = []
+    zones = {}
+    for record in records:
+        zone = zones.setdefault(record.zone, {})
+        point, phase, us = record.point, record.phase, record.us
+        if point in (SENSOR, FILTER) and phase != INSTANT:
+            zone[(point, phase)] = us
+        elif point == ENTER:
+            spans = {p: (zone.get((p, BEGIN)), zone.get((p, END))) for p in (SENSOR, FILTER)}
+            zone.clear()
+            zone["enter"] = us
+            for p, (begin, end) in spans.items():
+                if begin is not None and end is not None and begin <= end <= us:
+                    zone[p] = (begin, end)
+        elif point == ACTIVATE and "enter" in zone:
+            zone["activate"] = us
+        elif point == FADE and phase == BEGIN and "activate" in zone:
+            zone["fade_begin"] = us
+        elif point == FADE and phase == END and "fade_begin" in zone:
+            latencies.append(_latency(record.zone, zone, us))
+            zone.clear()
+    return latencies
+
+
+def _latency(zone_index: int, zone: dict, fade_end_us: int) -> dict:
+    """Build one latency breakdown from collected timestamps."""
+    sensor = zone.get(SENSOR, (zone["enter"], zone["enter"]))
+    filtering = zone.get(FILTER, (zone["enter"], zone["enter"]))
+    return {
+        "zone": zone_index,
+        "start_us": sensor[0],
+        "end_us": fade_end_us,
+        "total_ms": (fade_end_us - sensor[0]) / 1000,
+        "sensor_ms": (sensor[1] - sensor[0]) / 1000,
+        "filter_ms": (filtering[1] - filtering[0]) / 1000,
+        "dwell_ms": (zone["activate"] - zone["enter"]) / 1000,
+        "dispatch_ms": (zone["fade_begin"] - zone["activate"]) / 1000,
+        "fade_ms": (fade_end_us - zone["fade_begin"]) / 1000,
+    }
+
+
+def _thread_name(tid: int, name: str) -> dict:
+    """Chrome trace metadata event naming a track."""
+    return {"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": name}}
+
+
+def export(lines, output: Path) -> list:
+    """
+    Convert captured lines and write the JSON trace.
+
+    Returns:
+        Activation latencies (see activation_latencies).
+    """
+    records = parse_dump(lines)
+    trace = {"traceEvents": chrome_events(records), "displayTimeUnit": "ms"}
+    output.write_text(json.dumps(trace))
+    return activation_latencies(records)
+
+
+def main() -> None:
+    """Parse arguments, export trace and print latency summary."""
+    parser = argparse.ArgumentParser(description="Convert trace dumps to Chrome trace JSON")
+    parser.add_argument("capture", help="Captured console output ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="trace.json", help="JSON output file")
+    args = parser.parse_args()
+
+    if args.capture == "-":
+        latencies = export(sys.stdin, Path(args.output))
+    else:
+        with open(args.capture, errors="replace") as capture:
+            latencies = export(capture, Path(args.output))
+
+    for latency in latencies:
+        print(
+            f"zone {latency['zone']}: {latency['total_ms']:.1f}ms "
+            f"(sensor {latency['sensor_ms']:.1f}, filter {latency['filter_ms']:.1f}, "
+            f"dwell {latency['dwell_ms']:.1f}, dispatch {latency['dispatch_ms']:.1f}, "
+            f"fade {latency['fade_ms']:.1f})"
+        )
+    print(f"Wrote {args.output} ({len(latencies)} activations)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@
 #
 # Modes:
 #   Development mode - uploads full folder structure
-#   Production mode  - upload single built file (build/main.py)
+#   Production mode  - build and upload single file (build/main.py)
 
 set -e
 
@@ -14,11 +14,9 @@ MODE="${2:-dev}"
 echo "Uploading to ESP32 on $PORT (mode: $MODE)..."
 
 if [ "$MODE" = "prod" ]; then
-    # Production: single file deployment
-    if [ ! -f "build/main.py" ]; then
-        echo "Error: build/main.py not found. Run: uv run python scripts/build.py"
-        exit 1
-    fi
+    # Production: single file deployment, rebuilt so it matches src/
+    echo "Building build/main.py..."
+    uv run python scripts/build.py
     uv run mpremote connect "$PORT" cp build/main.py :main.py
     uv run mpremote connect "$PORT" cp src/boot.py :boot.py
 else
@@ -37,14 +35,25 @@ else
     uv run mpremote connect "$PORT" cp src/hardware/sensors/__init__.py :hardware/sensors/__init__.py
     uv run mpremote connect "$PORT" cp src/hardware/sensors/base.py :hardware/sensors/base.py
     uv run mpremote connect "$PORT" cp src/hardware/sensors/factory.py :hardware/sensors/factory.py
+    uv run mpremote connect "$PORT" cp src/hardware/sensors/health.py :hardware/sensors/health.py
+    uv run mpremote connect "$PORT" cp src/hardware/sensors/ld2410.py :hardware/sensors/ld2410.py
     uv run mpremote connect "$PORT" cp src/hardware/sensors/ultrasonic.py :hardware/sensors/ultrasonic.py
     uv run mpremote connect "$PORT" cp src/hardware/sensors/vl53l0x.py :hardware/sensors/vl53l0x.py
     
     echo "Uploading core..."
     uv run mpremote connect "$PORT" cp src/core/__init__.py :core/__init__.py
+    uv run mpremote connect "$PORT" cp src/core/events.py :core/events.py
     uv run mpremote connect "$PORT" cp src/core/light.py :core/light.py
+    uv run mpremote connect "$PORT" cp src/core/log.py :core/log.py
+    uv run mpremote connect "$PORT" cp src/core/memory.py :core/memory.py
     uv run mpremote connect "$PORT" cp src/core/presence.py :core/presence.py
+    uv run mpremote connect "$PORT" cp src/core/tracking.py :core/tracking.py
     uv run mpremote connect "$PORT" cp src/core/power.py :core/power.py
+    uv run mpremote connect "$PORT" cp src/core/sampler.py :core/sampler.py
+    uv run mpremote connect "$PORT" cp src/core/scheduler.py :core/scheduler.py
+    uv run mpremote connect "$PORT" cp src/core/bootcache.py :core/bootcache.py
+    uv run mpremote connect "$PORT" cp src/core/telemetry.py :core/telemetry.py
+    uv run mpremote connect "$PORT" cp src/core/trace.py :core/trace.py
     
     echo "Uploading main.py..."
     uv run mpremote connect "$PORT" cp src/main.py :main.py
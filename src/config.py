@@ -11,11 +11,23 @@ class PinConfig:
     # VL53L0X I2C pins
     SDA: int = 8
     SCL: int = 9
+    SENSOR_INT: int = 7  # VL53L0X GPIO1 (must be an RTC GPIO for wake)
 
     # Ultrasonic sensor pins (legacy/prototype)
     TRIGGER: int = 13
     ECHO: int = 12
 
+    # LD2410 mmWave radar (UART2 default pins)
+    RADAR_UART: int = 2
+    RADAR_TX: int = 17  # MCU TX -> radar RX
+    RADAR_RX: int = 16  # Radar TX -> MCU RX
+
+    # Sensor power switch: VL53L0X XSHUT or ultrasonic supply MOSFET
+    SENSOR_POWER: int = None  # None = always powered
+
+    # PIR motion sensor output, active high (must be an RTC GPIO for wake)
+    PIR: int = None  # None = no PIR fitted
+
     # Output
     LED: int = 4
 
@@ -23,7 +35,7 @@ class PinConfig:
 class SensorConfig:
     """Sensor parameters."""
 
-    # Sensor type: "vl53l0x" or "ultrasonic"
+    # Sensor type: "vl53l0x", "ultrasonic" or "ld2410"
     SENSOR_TYPE: str = "vl53l0x"
 
     MAX_DISTANCE_CM: float = 40.0
@@ -32,14 +44,62 @@ class SensorConfig:
     # Ultrasonic specific
     TIMEOUT_US: int = 30000
     SOUND_SPEED_DIVISOR: float = 29.1
+    POWER_UP_MS: int = 50  # Settling after supply switch-on (SENSOR_POWER)
+
+    # VL53L0X specific
+    RANGING_TIMEOUT_MS: int = 100  # Typical ranging takes ~30ms
+
+    # LD2410 specific (presence comes from the radar, not the distance range)
+    RADAR_RANGE_CM: float = 150.0  # Ignore targets farther away
+    RADAR_STALE_MS: int = 1000     # No report for this long is a fault
+
+    # Sample-and-hold: read() reuses a sample younger than this.
+    # Keep below TimingConfig.POLL_INTERVAL_MS so each period measures.
+    MAX_AGE_MS: int = 50
+
+    # Fault recovery
+    FAILURE_THRESHOLD: int = 3     # Consecutive faults before backoff
+    BACKOFF_MIN_MS: int = 500      # First retry delay
+    BACKOFF_MAX_MS: int = 30000    # Retry delay cap (doubles each miss)
 
 
 class TimingConfig:
     """Timing parameters for activation and timeout."""
 
     ACTIVATION_MS: int = 1000  # 1 second of sustained presence
+    APPROACH_ACTIVATION_MS: int = 300  # Dwell when walking up to the mirror
     TIMEOUT_MS: int = 3000     # Reduced: quicker off (fade compensates)
-    POLL_INTERVAL_MS: int = 100
+    POLL_INTERVAL_MS: int = 100  # Sample period (absolute deadlines)
+
+    # Adaptive timeout: start at TIMEOUT_MS, then learn from drop-out gaps
+    ADAPTIVE_TIMEOUT: bool = True
+    MIN_TIMEOUT_MS: int = 1500     # Learned timeout bounds
+    MAX_TIMEOUT_MS: int = 10000
+    FLAP_RATE: float = 0.05        # Target off/on re-triggers per session
+    FLAP_WINDOW_MS: int = 20000    # Return within this after OFF is a flap
+
+
+class TrackingConfig:
+    """Approach detection (alpha-beta filter on distance)."""
+
+    ENABLED: bool = True
+    ALPHA: float = 0.5               # Position correction gain
+    BETA: float = 0.1                # Velocity correction gain
+    TRACK_RANGE_CM: float = 150.0    # Track targets up to this distance
+    APPROACH_SPEED_CM_S: float = 15.0  # Minimum inbound speed
+    MIN_TRAVEL_CM: float = 15.0      # Minimum inbound travel (rejects walk-bys)
+    MIN_SAMPLES: int = 3             # Samples before a track is trusted
+
+
+class SamplingConfig:
+    """Sensor sampling thread (dual-core parts only)."""
+
+    USE_THREAD: bool = False  # Sample on a worker thread; disables light sleep
+    USE_TIMER: bool = False   # Pace main loop with machine.Timer (no light sleep)
+    TIMER_ID: int = 0
+    PERIOD_MS: int = 100      # Fixed sampling period
+    BUFFER_SIZE: int = 16     # Samples buffered between main loop passes
+    SPLIT_PHASE: bool = True  # Start conversion, idle, then collect (no busy poll)
 
 
 class LightConfig:
@@ -50,9 +110,91 @@ class LightConfig:
     FADE_STEPS: int = 50            # Smoothness (more = smoother)
     PWM_FREQ: int = 1000            # PWM frequency in Hz
 
+    # Brightness follows distance (brighter when closer)
+    TRACK_DISTANCE: bool = False
+    NEAR_CM: float = 15.0           # Full brightness at or below this
+    MIN_BRIGHTNESS_PERCENT: int = 40  # Brightness at MAX_DISTANCE_CM
+    SLEW_PERCENT_PER_S: int = 50    # Brightness rate limit
+    MIN_STEP_PERCENT: int = 2       # Smaller changes are not written
+
+
+class MemoryConfig:
+    """Garbage collection policy."""
+
+    GC_THRESHOLD_BYTES: int = 32768   # Safety net: auto-collect after this much
+    GC_IDLE_COLLECT_BYTES: int = 4096  # Collect in IDLE window after this much
+
+
+class TelemetryConfig:
+    """Optional telemetry publishing (requires WiFi)."""
+
+    ENABLED: bool = False
+    TRANSPORT: str = "udp"         # "udp" or "mqtt"
+    WIFI_SSID: str = ""
+    WIFI_PASSWORD: str = ""
+    HOST: str = "192.168.1.10"     # Collector or MQTT broker (IP: lookups block)
+    PORT: int = 5005               # 1883 for MQTT
+    TOPIC: str = "mirror/telemetry"
+    DEVICE_ID: int = 1             # Unique per mirror
+    INTERVAL_MS: int = 30000       # At most one message per interval
+    QUEUE_SIZE: int = 64           # Records kept; oldest dropped when full
+    DISTANCE_EVERY: int = 50       # Record one distance per N samples
+
+
+class ZoneConfig:
+    """Several mirrors driven by one board."""
+
+    # One dict per mirror; empty runs a single mirror from PinConfig.
+    # Keys: "led" (required), then "address" for a VL53L0X on the shared
+    # I2C bus (distinct per sensor) or "i2c" (bus ID, 0 or 1) with its
+    # own "sda"/"scl" pins, or "trigger"/"echo" for ultrasonic sensors;
+    # "power" for a power pin (XSHUT lets sensors start at the default
+    # address, so a readdressed sensor on a shared bus needs one; a
+    # sensor keeping 0x29 is powered up last). Example:
+    #   ZONES = ({"led": 4, "address": 0x29, "power": 10},
+    #            {"led": 5, "address": 0x30, "power": 11})
+    ZONES: tuple = ()
+
+
+class LogConfig:
+    """Ring-buffered console logging."""
+
+    LEVEL: int = 1        # 0 debug, 1 info, 2 warning, 3 error, 4 off
+    CAPACITY: int = 32    # Records kept until flushed; oldest overwritten
+    FLUSH_BATCH: int = 8  # Max lines written per idle loop iteration
+
+
+class TraceConfig:
+    """Latency tracing (scripts/trace_export.py converts the dumps)."""
+
+    ENABLED: bool = False  # Stamp trace points and dump them in idle windows
+    CAPACITY: int = 256    # Records kept; oldest overwritten
+
+
+class BootConfig:
+    """Boot sequence."""
+
+    FAST_BOOT: bool = True  # Sample first; config print, WiFi, PWM setup after
+    CACHE_PATH: str = "/bootcache.json"  # Calibration reused on warm boots
+
 
 class PowerConfig:
     """Power management settings."""
 
     USE_LIGHT_SLEEP: bool = True  # Saves ~60% power, disables REPL
-    SLEEP_DURATION_MS: int = 100  # Match poll interval
+
+    # Threshold wake (VL53L0X only, needs SENSOR_INT wired)
+    USE_THRESHOLD_WAKE: bool = False
+    WAKE_MARGIN_CM: float = 20.0   # Wake this far beyond MAX_DISTANCE_CM
+    WAKE_PERIOD_MS: int = 100      # Sensor autonomous ranging interval
+    WAKE_TIMEOUT_MS: int = 60000   # Wake anyway for housekeeping
+
+    # PIR wake (needs PinConfig.PIR wired): sleep with the sensor off
+    # until the PIR fires, then range to confirm and track presence
+    USE_PIR_WAKE: bool = False
+    PIR_CONFIRM_MS: int = 3000     # Ranging kept after a wake or PIR motion
+    PIR_DEEP_SLEEP: bool = False   # Deep sleep between wakes (reboots on wake)
+
+    # Sensor power gating (needs PinConfig.SENSOR_POWER or zone "power")
+    SENSOR_OFF_AFTER_MS: int = 10000  # Empty-room time before gating starts
+    SENSOR_MIN_OFF_MS: int = 20       # Shorter sleeps keep the sensor on
@@ -6,15 +6,60 @@ Independent of hardware implementation details.
 
 Modules:
     light: LED/relay output control.
-    presence: State machine for presence detection.
+    presence: State machine for presence detection, adaptive timeout.
     power: Power management and sleep modes.
+    events: Deferred event queue and dispatcher.
+    memory: Idle-window garbage collection policy.
+    telemetry: Optional batched telemetry publisher.
+    tracking: Approach velocity tracker.
+    sampler: Threaded fixed-rate sensor sampling.
+    scheduler: Fixed-period loop scheduling with jitter statistics.
+    bootcache: Warm boot calibration cache.
+    log: Ring-buffered leveled logger.
+    trace: ticks_us latency tracer.
 """
+from core.bootcache import BootCache
+from core.events import Event, EventDispatcher, EventQueue
 from core.light import LightController
-from core.presence import PresenceDetector
+from core.log import Logger, LogLevel, LogMessage
+from core.memory import GCPolicy
 from core.power import PowerManager
+from core.presence import Histogram, PresenceDetector
+from core.sampler import SampleRing, ThreadedSampler
+from core.scheduler import SampleScheduler
+from core.telemetry import (
+    Counter,
+    MQTTTransport,
+    RecordKind,
+    TelemetryPublisher,
+    UDPTransport,
+)
+from core.trace import TracePhase, TracePoint, Tracer
+from core.tracking import ApproachTracker
 
 __all__ = [
+    "BootCache",
+    "Event",
+    "EventQueue",
+    "EventDispatcher",
     "LightController",
+    "Logger",
+    "LogLevel",
+    "LogMessage",
+    "GCPolicy",
+    "Histogram",
     "PresenceDetector",
     "PowerManager",
+    "SampleRing",
+    "ThreadedSampler",
+    "SampleScheduler",
+    "Tracer",
+    "TracePoint",
+    "TracePhase",
+    "ApproachTracker",
+    "Counter",
+    "RecordKind",
+    "TelemetryPublisher",
+    "UDPTransport",
+    "MQTTTransport",
 ]
@@ -0,0 +1,104 @@
+"""
+Warm boot cache module.
+
+Persists sensor calibration and the hardware fingerprint it was
+detected under, so a warm boot (soft reset, watchdog, deep-sleep
+wake) can skip sensor detection and initialization. A power-on reset
+always runs the full sequence because the sensor lost its state too.
+"""
+import json
+
+import machine
+
+BOOT_CACHE_VERSION = 1
+
+# Resets that leave external sensors powered and configured
+_WARM_RESETS = tuple(
+    getattr(machine, name)
+    for name in ("SOFT_RESET", "DEEPSLEEP_RESET", "WDT_RESET")
+    if hasattr(machine, name)
+)
+
+
+class BootCache:
+    """
+    Small JSON file in flash holding the last known-good calibration.
+
+    The file is only rewritten when its contents change, so steady
+    reboots do not wear flash.
+
+    Attributes:
+        hit: True if load() returned a cached calibration.
+    """
+
+    def __init__(self, path: str = "/bootcache.json") -> None:
+        """
+        Initialize cache.
+
+        Args:
+            path: Flash file holding the cache.
+        """
+        self._path = path
+        self._stored = None
+        self.hit = False
+
+    @staticmethod
+    def warm_boot() -> bool:
+        """Return True if the last reset kept sensors powered."""
+        return machine.reset_cause() in _WARM_RESETS
+
+    def load(self, fingerprint: str):
+        """
+        Return cached calibration for fingerprint.
+
+        Args:
+            fingerprint: Identifies configured hardware (type, pins).
+
+        Returns:
+            Calibration dict, or None on cold boot, mismatch or a
+            missing/corrupt cache.
+        """
+        self._stored = self._read()
+        self.hit = False
+        if not self.warm_boot() or self._stored is None:
+            return None
+        if self._stored.get("version") != BOOT_CACHE_VERSION:
+            return None
+        if self._stored.get("fingerprint") != fingerprint:
+            return None
+        self.hit = True
+        return self._stored.get("calibration")
+
+    def save(self, fingerprint: str, calibration) -> bool:
+        """
+        Store calibration if it differs from the cached one.
+
+        Returns:
+            True if the file was written.
+        """
+        if calibration is None:
+            return False
+        entry = {
+            "version": BOOT_CACHE_VERSION,
+            "fingerprint": fingerprint,
+            "calibration": calibration,
+        }
+        if self._stored is None:
+            self._stored = self._read()
+        if entry == self._stored:
+            return False
+        try:
+            with open(self._path, "w") as f:
+                json.dump(entry, f)
+        except OSError:
+            return False
+        self._stored = entry
+        return True
+
+    def _read(self):
+        """Return parsed cache file, or None."""
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,161 @@
+"""
+Deferred event queue module.
+
+Decouples state machine transitions from slow consumers (fades, UART)
+so they never run inside the sensor sampling path.
+"""
+try:
+    import micropython
+except ImportError:
+    micropython = None
+
+
+class Event:
+    """Enum-like class for event identifiers (fit in one byte)."""
+
+    NONE = 0
+    PRESENCE_START = 1
+    PRESENCE_END = 2
+
+
+class EventQueue:
+    """
+    Fixed-capacity FIFO of small integer events.
+
+    Storage is preallocated and the queue is single-producer /
+    single-consumer: post() only moves the tail, pop() only moves
+    the head. Posting never allocates, so it is safe from hard IRQ
+    handlers and micropython.schedule callbacks.
+
+    Attributes:
+        dropped: Number of events rejected because the queue was full.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        """
+        Initialize event queue.
+
+        Args:
+            capacity: Maximum number of pending events.
+        """
+        # One slot stays empty to tell "full" from "empty" without a counter
+        self._size = capacity + 1
+        self._buffer = bytearray(self._size)
+        self._head = 0
+        self._tail = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return number of pending events."""
+        return (self._tail - self._head) % self._size
+
+    def post(self, event: int) -> bool:
+        """
+        Append event to the queue.
+
+        Args:
+            event: Event identifier (0-255).
+
+        Returns:
+            True if queued, False if the queue was full.
+        """
+        next_tail = (self._tail + 1) % self._size
+        if next_tail == self._head:
+            self.dropped += 1
+            return False
+
+        self._buffer[self._tail] = event
+        self._tail = next_tail
+        return True
+
+    def pop(self) -> int:
+        """
+        Remove and return the oldest event.
+
+        Returns:
+            Event identifier, or Event.NONE if the queue is empty.
+        """
+        if self._head == self._tail:
+            return Event.NONE
+
+        event = self._buffer[self._head]
+        self._head = (self._head + 1) % self._size
+        return event
+
+    def clear(self) -> None:
+        """Discard all pending events."""
+        self._head = self._tail
+
+
+class EventDispatcher:
+    """
+    Drains an EventQueue and invokes subscribed handlers.
+
+    Call dispatch() from the main loop outside the sampling path,
+    or schedule() from an IRQ to run it via micropython.schedule.
+    """
+
+    def __init__(self, queue: EventQueue) -> None:
+        """
+        Initialize dispatcher.
+
+        Args:
+            queue: Event queue to drain.
+        """
+        self._queue = queue
+        self._handlers = {}
+        # Bound method cached once: creating it inside an IRQ would allocate
+        self._scheduled_ref = self._run_scheduled
+
+    def subscribe(self, event: int, handler) -> None:
+        """
+        Register handler for an event.
+
+        Args:
+            event: Event identifier.
+            handler: Callable taking no arguments.
+        """
+        self._handlers[event] = handler
+
+    def dispatch(self, limit: int = 0) -> int:
+        """
+        Invoke handlers for pending events in FIFO order.
+
+        Args:
+            limit: Maximum number of events to process (0 = all).
+
+        Returns:
+            Number of events processed.
+        """
+        processed = 0
+        while not limit or processed < limit:
+            event = self._queue.pop()
+            if event == Event.NONE:
+                break
+            handler = self._handlers.get(event)
+            if handler:
+                handler()
+            processed += 1
+        return processed
+
+    def schedule(self) -> bool:
+        """
+        Request a deferred dispatch via micropython.schedule.
+
+        Safe to call from hard IRQ context.
+
+        Returns:
+            True if scheduled, False if unavailable or the
+            MicroPython schedule queue is full.
+        """
+        if micropython is None:
+            return False
+        try:
+            micropython.schedule(self._scheduled_ref, 0)
+        except RuntimeError:
+            return False
+        return True
+
+    def _run_scheduled(self, _arg) -> None:
+        """Scheduled callback entry point."""
+        self.dispatch()
@@ -1,10 +1,12 @@
 """
 Light controller module.
 
-Handles LED/light strip control with PWM support for fade effects.
+Handles LED/light strip control with PWM support for fade effects
+and a continuous brightness-tracking mode.
 """
-from machine import Pin, PWM
-from time import sleep_ms
+from time import ticks_diff, ticks_ms
+
+from machine import PWM, Pin
 
 
 class LightController:
@@ -13,6 +15,16 @@ class LightController:
 
     Supports both simple on/off and smooth PWM transitions.
 
+    Fades never block: on() and off() start a fade and update() writes
+    its steps as time passes, so call update() at least every
+    fade_duration_ms / fade_steps while fading is True.
+
+    Tracking mode: track() sets a brightness target while the light is
+    on and update() slews towards it at slew_percent_per_s. Each PWM
+    write moves at least min_step_percent; smaller differences are a
+    dead band, so a noisy target costs no writes. on() fades in to the
+    tracked level instead of full brightness.
+
     Attributes:
         pin: GPIO pin controlling the light.
         is_on: Current state of the light.
@@ -27,6 +39,9 @@ class LightController:
         fade_duration_ms: int = 500,
         fade_steps: int = 50,
         pwm_freq: int = 1000,
+        slew_percent_per_s: int = 50,
+        min_step_percent: int = 2,
+        defer_setup: bool = False,
     ) -> None:
         """
         Initialize light controller.
@@ -37,17 +52,44 @@ class LightController:
             fade_duration_ms: Total duration of fade effect.
             fade_steps: Number of steps in fade (smoothness).
             pwm_freq: PWM frequency in Hz.
+            slew_percent_per_s: Tracking mode brightness rate limit.
+            min_step_percent: Smallest tracking change written to PWM.
+            defer_setup: Leave the output unconfigured until begin()
+                or the first on(), to shorten boot.
         """
+        self._pin_id = pin
+        self._pwm_freq = pwm_freq
+        self._pwm = None
+        self._pin = None
         self._use_fade = use_fade
         self._fade_duration_ms = fade_duration_ms
         self._fade_steps = fade_steps
         self._is_on = False
         self._current_duty = 0
 
-        if use_fade:
-            self._pwm = PWM(Pin(pin), freq=pwm_freq, duty_u16=0)
+        # Running fade (duty units)
+        self._fading = False
+        self._fade_from = 0
+        self._fade_target = 0
+        self._fade_start = 0
+
+        # Tracking mode state (duty units)
+        self._level_duty = self.MAX_DUTY
+        self._slew_duty_per_s = self.MAX_DUTY * slew_percent_per_s // 100
+        self._min_step_duty = self.MAX_DUTY * min_step_percent // 100
+        self._last_update = ticks_ms()
+
+        if not defer_setup:
+            self.begin()
+
+    def begin(self) -> None:
+        """Configure the output pin (off). Safe to call repeatedly."""
+        if self._pwm is not None or self._pin is not None:
+            return
+        if self._use_fade:
+            self._pwm = PWM(Pin(self._pin_id), freq=self._pwm_freq, duty_u16=0)
         else:
-            self._pin = Pin(pin, Pin.OUT)
+            self._pin = Pin(self._pin_id, Pin.OUT)
             self._pin.off()
 
     @property
@@ -55,20 +97,26 @@ class LightController:
         """Return current light state."""
         return self._is_on
 
+    @property
+    def fading(self) -> bool:
+        """Return True while a fade started by on() or off() is running."""
+        return self._fading
+
     def on(self) -> None:
-        """Turn light on with optional fade in."""
+        """Turn light on with optional fade in (stepped by update())."""
         if self._is_on:
             return
 
+        self.begin()
         if self._use_fade:
-            self._fade_to(self.MAX_DUTY)
+            self._fade_to(self._level_duty)
         else:
             self._pin.on()
 
         self._is_on = True
 
     def off(self) -> None:
-        """Turn light off with optional fade out."""
+        """Turn light off with optional fade out (stepped by update())."""
         if not self._is_on:
             return
 
@@ -81,22 +129,96 @@ class LightController:
 
     def _fade_to(self, target_duty: int) -> None:
         """
-        Smoothly transition to target brightness.
+        Start a fade from the current brightness to target_duty.
 
         Args:
             target_duty: Target PWM duty cycle (0-65535).
         """
-        start_duty = self._current_duty
-        step_delay = self._fade_duration_ms // self._fade_steps
-        duty_step = (target_duty - start_duty) // self._fade_steps
+        self._fade_from = self._current_duty
+        self._fade_target = target_duty
+        self._fade_start = ticks_ms()
+        self._fading = True
+        self._fade_step(self._fade_start)
+
+    # emit: native
+    def _fade_step(self, now: int) -> bool:
+        """
+        Write the fade step due at now; end the fade after its duration.
+
+        Args:
+            now: Current ticks_ms.
+
+        Returns:
+            True if a PWM write was issued.
+        """
+        elapsed = ticks_diff(now, self._fade_start)
+        if elapsed >= self._fade_duration_ms:
+            duty = self._fade_target
+            self._fading = False
+            self._last_update = now
+        else:
+            steps = self._fade_steps
+            step = elapsed * steps // self._fade_duration_ms
+            duty = self._fade_from + (self._fade_target - self._fade_from) * step // steps
+        if duty == self._current_duty:
+            return False
+        self._current_duty = duty
+        self._pwm.duty_u16(duty)
+        return True
+
+    def track(self, percent: int) -> None:
+        """
+        Set tracking mode brightness target (0-100%).
+
+        Takes effect through update() while on, and as the fade-in
+        level for the next on().
+
+        Args:
+            percent: Target brightness percentage.
+        """
+        self._level_duty = self.MAX_DUTY * max(0, min(100, percent)) // 100
 
-        for i in range(self._fade_steps):
-            self._current_duty = start_duty + (duty_step * (i + 1))
-            self._pwm.duty_u16(max(0, min(self.MAX_DUTY, self._current_duty)))
-            sleep_ms(step_delay)
+    # emit: native
+    def update(self, now: int | None = None) -> bool:
+        """
+        Step a running fade, else slew output towards the tracking target.
+
+        Call once per loop iteration (more often while fading); slewing
+        does nothing while off.
+
+        Args:
+            now: Current ticks_ms (default: read clock).
 
-        self._current_duty = target_duty
-        self._pwm.duty_u16(target_duty)
+        Returns:
+            True if a PWM write was issued.
+        """
+        if now is None:
+            now = ticks_ms()
+        if self._fading:
+            return self._fade_step(now)
+        if not (self._is_on and self._use_fade):
+            self._last_update = now
+            return False
+
+        duty = self._current_duty
+        error = self._level_duty - duty
+        if -self._min_step_duty < error < self._min_step_duty:
+            # Dead band: imperceptible, hold output
+            self._last_update = now
+            return False
+
+        step = self._slew_duty_per_s * ticks_diff(now, self._last_update) // 1000
+        if step < self._min_step_duty:
+            return False  # Accumulate slew time until the step is visible
+
+        if error > 0:
+            duty += min(error, step)
+        else:
+            duty -= min(-error, step)
+        self._current_duty = duty
+        self._last_update = now
+        self._pwm.duty_u16(duty)
+        return True
 
     def set_brightness(self, percent: int) -> None:
         """
@@ -108,7 +230,9 @@ class LightController:
         if not self._use_fade:
             return
 
+        self.begin()
         duty = int((percent / 100) * self.MAX_DUTY)
+        self._fading = False
         self._pwm.duty_u16(duty)
         self._current_duty = duty
         self._is_on = percent > 0
@@ -0,0 +1,196 @@
+"""
+Ring-buffered logging module.
+
+Log calls store a fixed-size record (message ID, level, ticks, two
+integer arguments, one object reference) in preallocated storage. Text
+is only formatted and written to the console by flush(), which the app
+calls in idle windows, so logging never blocks the loop on the UART.
+"""
+from array import array
+from time import ticks_ms
+
+
+class LogLevel:
+    """Enum-like class for log levels."""
+
+    DEBUG = 0
+    INFO = 1
+    WARNING = 2
+    ERROR = 3
+    OFF = 4
+
+
+_LEVEL_TAGS = "DIWE"
+
+
+class LogMessage:
+    """
+    Enum-like class for log message identifiers.
+
+    Each ID indexes _FORMATS. Formats reference the record arguments
+    positionally: {0} and {1} are the integers, {2} the object.
+    """
+
+    LIGHT_ON = 0
+    LIGHT_OFF = 1
+    SENSOR_HEALTH = 2
+    SENSOR_MODEL = 3
+    SAMPLER_INLINE = 4
+    FIRST_SAMPLE = 5
+    WAKE_ARMED = 6
+    WAKE_TIMEOUT = 7
+    CONFIG_TITLE = 8
+    CONFIG_SENSOR = 9
+    CONFIG_RANGE = 10
+    CONFIG_ACTIVATION = 11
+    CONFIG_APPROACH = 12
+    CONFIG_TIMEOUT = 13
+    CONFIG_FADE = 14
+    CONFIG_DIMMING = 15
+    CONFIG_LIGHT_SLEEP = 16
+    CONFIG_WAKE_IRQ = 17
+    CONFIG_READY = 18
+    CONFIG_ZONES = 19
+    CONFIG_ADAPTIVE = 20
+    TIMEOUT_LEARNED = 21
+    PIR_WAKE = 22
+    PIR_SLEEP = 23
+    CONFIG_PIR = 24
+    PIR_NO_POWER = 25
+
+
+_FORMATS = (
+    "Light ON - presence confirmed (zone {0})",
+    "Light OFF - presence timeout (zone {0})",
+    "Sensor health: {2} (zone {0})",
+    "Sensor model ID {0:#x}, expected {1:#x}",
+    "Sampling thread unavailable (single core), sampling inline",
+    "First sample: {0}ms ({2} boot)",
+    "Wake armed at {0}cm",
+    "Wake timeout after {0}ms",
+    "Mirror Light Controller",
+    "  Sensor:      {2}",
+    "  Range:       {0}-{1}cm",
+    "  Activation:  {0}ms",
+    "  Approach:    {0}ms",
+    "  Timeout:     {0}ms",
+    "  Fade:        {2} ({0}ms)",
+    "  Dimming:     {2}",
+    "  Light sleep: {2}",
+    "  Wake on IRQ: {2}",
+    "Ready.",
+    "  Zones:       {0}",
+    "  Adaptive:    {0}-{1}ms",
+    "Timeout learned: {0}ms after {1} flaps (zone {2})",
+    "PIR wake after {0}ms",
+    "PIR idle, sensor off",
+    "  PIR wake:    {2}",
+    "PIR wake without a sensor power pin: sensor stays on",
+)
+
+
+class Logger:
+    """
+    Leveled logger writing binary records into a ring buffer.
+
+    Logging below the configured level returns after one comparison.
+    Otherwise the record goes into preallocated arrays without
+    allocating; when the ring is full the oldest record is overwritten
+    and counted in dropped. The object slot only stores a reference,
+    so pass existing objects (constants, config values), not freshly
+    built strings.
+
+    Production builds strip debug() calls (scripts/build.py), so keep
+    each debug call on a single line.
+
+    Attributes:
+        level: Minimum level recorded.
+        dropped: Records overwritten before they were flushed.
+    """
+
+    def __init__(self, capacity: int = 32, level: int = LogLevel.INFO) -> None:
+        """
+        Initialize logger.
+
+        Args:
+            capacity: Number of records kept until flushed.
+            level: Minimum level recorded (LogLevel).
+        """
+        self._size = capacity
+        self._messages = bytearray(capacity)
+        self._levels = bytearray(capacity)
+        self._ticks = array("l", [0] * capacity)
+        self._args = array("l", [0] * (2 * capacity))
+        self._objects = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self.level = level
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return number of records waiting to be flushed."""
+        return self._count
+
+    def debug(self, message: int, a: int = 0, b: int = 0, obj=None) -> None:
+        """Record a DEBUG message (stripped from production builds)."""
+        if self.level <= LogLevel.DEBUG:
+            self._record(LogLevel.DEBUG, message, a, b, obj)
+
+    def info(self, message: int, a: int = 0, b: int = 0, obj=None) -> None:
+        """Record an INFO message."""
+        if self.level <= LogLevel.INFO:
+            self._record(LogLevel.INFO, message, a, b, obj)
+
+    def warning(self, message: int, a: int = 0, b: int = 0, obj=None) -> None:
+        """Record a WARNING message."""
+        if self.level <= LogLevel.WARNING:
+            self._record(LogLevel.WARNING, message, a, b, obj)
+
+    def error(self, message: int, a: int = 0, b: int = 0, obj=None) -> None:
+        """Record an ERROR message."""
+        if self.level <= LogLevel.ERROR:
+            self._record(LogLevel.ERROR, message, a, b, obj)
+
+    def flush(self, limit: int = 0, write=print) -> int:
+        """
+        Format and write pending records, oldest first.
+
+        Call only in idle windows: formatting allocates and writing
+        blocks on the console.
+
+        Args:
+            limit: Maximum records to write (0 for all).
+            write: Callable receiving each formatted line.
+
+        Returns:
+            Number of records written.
+        """
+        written = 0
+        while self._count and (not limit or written < limit):
+            index = self._head
+            text = _FORMATS[self._messages[index]].format(
+                self._args[2 * index],
+                self._args[2 * index + 1],
+                self._objects[index],
+            )
+            write(f"{self._ticks[index]:>8} {_LEVEL_TAGS[self._levels[index]]} {text}")
+            self._objects[index] = None
+            self._head = (index + 1) % self._size
+            self._count -= 1
+            written += 1
+        return written
+
+    def _record(self, level: int, message: int, a: int, b: int, obj) -> None:
+        """Store one record, overwriting the oldest if full."""
+        if self._count == self._size:
+            self._head = (self._head + 1) % self._size
+            self._count -= 1
+            self.dropped += 1
+        index = (self._head + self._count) % self._size
+        self._messages[index] = message
+        self._levels[index] = level
+        self._ticks[index] = ticks_ms()
+        self._args[2 * index] = a
+        self._args[2 * index + 1] = b
+        self._objects[index] = obj
+        self._count += 1
@@ -0,0 +1,106 @@
+"""
+Memory management module.
+
+Schedules garbage collection into known idle windows so the
+collector never pauses a fade or an approaching-user sample.
+"""
+import gc
+
+try:
+    _mem_alloc = gc.mem_alloc
+except AttributeError:
+    def _mem_alloc() -> int:
+        """Return 0 where heap accounting is unsupported (CPython)."""
+        return 0
+
+
+class GCPolicy:
+    """
+    Garbage collection policy for the main loop.
+
+    The steady-state loop is designed not to allocate, so the heap
+    only grows during transitions (events, logging, fades). Collection
+    is performed in idle windows, right before a sleep, once enough
+    has been allocated. gc.threshold acts as a safety net for long
+    active sessions, keeping automatic collections small and rare.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int = 32768,
+        idle_collect_bytes: int = 4096,
+    ) -> None:
+        """
+        Initialize GC policy.
+
+        Args:
+            threshold_bytes: Allocation amount that forces an automatic
+                collection anywhere (gc.threshold). 0 keeps the default.
+            idle_collect_bytes: Allocation since last collection that
+                makes the next idle window collect.
+        """
+        self._threshold_bytes = threshold_bytes
+        self._idle_collect_bytes = idle_collect_bytes
+        self._baseline = 0
+        self._collections = 0
+
+    @property
+    def collections(self) -> int:
+        """Return number of idle-window collections performed."""
+        return self._collections
+
+    def configure(self) -> None:
+        """Collect once and apply gc.threshold (call before main loop)."""
+        gc.collect()
+        if self._threshold_bytes:
+            try:
+                gc.threshold(self._threshold_bytes)
+            except AttributeError:
+                pass  # Not MicroPython
+        self._baseline = _mem_alloc()
+
+    def idle(self) -> bool:
+        """
+        Collect if enough was allocated since the last collection.
+
+        Call only in an idle window (presence IDLE, before sleep).
+
+        Returns:
+            True if a collection ran.
+        """
+        if _mem_alloc() - self._baseline < self._idle_collect_bytes:
+            return False
+
+        gc.collect()
+        self._baseline = _mem_alloc()
+        self._collections += 1
+        return True
+
+
+def allocations_per_call(func, iterations: int = 100) -> int:
+    """
+    Measure heap bytes allocated per call on MicroPython.
+
+    Disables the collector while measuring so freed objects
+    are still counted.
+
+    Args:
+        func: Callable taking no arguments.
+        iterations: Number of calls to average over.
+
+    Returns:
+        Average bytes allocated per call, or -1 if unsupported.
+    """
+    if not hasattr(gc, "mem_alloc"):
+        return -1
+
+    gc.collect()
+    gc.disable()
+    try:
+        before = gc.mem_alloc()
+        for _ in range(iterations):
+            func()
+        after = gc.mem_alloc()
+    finally:
+        gc.enable()
+    return (after - before) // iterations
@@ -3,8 +3,14 @@ Power management module.
 
 Handles sleep modes for energy efficiency.
 """
+from time import sleep_ms, ticks_diff, ticks_ms
+
 import machine
-from time import sleep_ms
+
+try:
+    import esp32
+except ImportError:
+    esp32 = None
 
 
 class PowerManager:
@@ -13,16 +19,53 @@ class PowerManager:
 
     Supports light sleep for ~60% power reduction while
     maintaining quick wake-up for sensor polling.
+
+    Sensors handed to gate_sensors() are powered down for sleeps long
+    enough to pay off and powered up power_up_ms before the sleep
+    ends, so they are ready at the next sample deadline.
     """
 
-    def __init__(self, use_light_sleep: bool = True) -> None:
+    def __init__(
+        self,
+        use_light_sleep: bool = True,
+        pin_poll_ms: int = 100,
+        sensor_min_off_ms: int = 20,
+    ) -> None:
         """
         Initialize power manager.
 
         Args:
             use_light_sleep: If True, use light sleep instead of busy wait.
+            pin_poll_ms: Pin check interval for sleep_until() on ports
+                without a hardware pin wake source.
+            sensor_min_off_ms: Shortest sensor off-time worth a power
+                cycle; shorter sleeps keep gated sensors powered.
         """
         self._use_light_sleep = use_light_sleep
+        self._pin_poll_ms = pin_poll_ms
+        self._sensor_min_off_ms = sensor_min_off_ms
+        self._gated = ()
+        self._gate_lead_ms = 0
+        self._sensor_power_cycles = 0
+
+    @property
+    def sensor_power_cycles(self) -> int:
+        """Return number of sleeps with gated sensors powered down."""
+        return self._sensor_power_cycles
+
+    def gate_sensors(self, sensors: tuple = ()) -> None:
+        """
+        Power sensors down during sleep().
+
+        Args:
+            sensors: Sensors with a power switch, in power-up order;
+                () stops gating.
+        """
+        lead = 0
+        for sensor in sensors:
+            lead = max(lead, sensor.power_up_ms)
+        self._gated = sensors
+        self._gate_lead_ms = lead
 
     def sleep(self, duration_ms: int) -> None:
         """
@@ -34,11 +77,105 @@ class PowerManager:
         Args:
             duration_ms: Sleep duration in milliseconds.
         """
+        lead = self._gate_lead_ms
+        if self._gated and duration_ms - lead >= self._sensor_min_off_ms:
+            for sensor in self._gated:
+                sensor.power_down()
+            self._sleep(duration_ms - lead)
+            for sensor in self._gated:
+                sensor.power_up()
+            self._sensor_power_cycles += 1
+        else:
+            self._sleep(duration_ms)
+
+    def nap(self, duration_ms: int) -> None:
+        """
+        Idle while a sensor conversion runs.
+
+        Never gates sensor power and never light-sleeps: the CPU idles
+        in sleep_ms, so pin interrupts and ticks_us keep running for
+        drivers that time echoes from IRQs.
+
+        Args:
+            duration_ms: Expected conversion time in milliseconds.
+        """
+        sleep_ms(duration_ms)
+
+    def _sleep(self, duration_ms: int) -> None:
+        """Sleep without touching sensor power."""
         if self._use_light_sleep:
             self._light_sleep(duration_ms)
         else:
             sleep_ms(duration_ms)
 
+    def sleep_until(self, pin, timeout_ms: int, level: int = 0) -> bool:
+        """
+        Sleep until pin reaches level or timeout expires.
+
+        On ESP32 the pin is an ext0 wake source for light sleep, so
+        the CPU stays asleep until the sensor raises its interrupt.
+        Elsewhere the pin is checked every pin_poll_ms.
+
+        Args:
+            pin: Wake Pin (must be an RTC GPIO on ESP32).
+            timeout_ms: Maximum time to sleep.
+            level: Pin level that wakes: 0 for active-low interrupts
+                (ToF GPIO1), 1 for active-high outputs (PIR).
+
+        Returns:
+            True if woken by the pin.
+        """
+        if pin.value() == level:
+            return True
+
+        if esp32 is not None and self._use_light_sleep:
+            esp32.wake_on_ext0(pin=pin, level=self._wake_level(level))
+            try:
+                self._light_sleep(timeout_ms)
+            finally:
+                esp32.wake_on_ext0(pin=None)
+            return pin.value() == level
+
+        start = ticks_ms()
+        while pin.value() != level:
+            if ticks_diff(ticks_ms(), start) >= timeout_ms:
+                return False
+            self._sleep(self._pin_poll_ms)
+        return True
+
+    def deep_sleep_until(self, pin, timeout_ms: int, level: int = 1, hold: tuple = ()) -> None:
+        """
+        Deep sleep until pin reaches level or timeout expires.
+
+        Wake causes reset, so this only returns if the pin is already
+        at level. Without a pin wake source (non-ESP32 ports) it falls
+        back to a timed deep sleep.
+
+        Outputs float in deep sleep, so a sensor switched off through a
+        pulled-up enable (VL53L0X XSHUT) would power up again. Pins in
+        hold are latched at their level until the driver that claims
+        them at boot releases the hold.
+
+        Args:
+            pin: Wake Pin (must be an RTC GPIO on ESP32).
+            timeout_ms: Maximum time to sleep.
+            level: Pin level that wakes (1 for a PIR output).
+            hold: Output Pins to keep at their level (sensor power).
+        """
+        if pin.value() == level:
+            return
+        if esp32 is not None:
+            for output in hold:
+                output.init(hold=True)
+            esp32.gpio_deep_sleep_hold(True)
+            esp32.wake_on_ext0(pin=pin, level=self._wake_level(level))
+        self.deep_sleep(timeout_ms)
+
+    @staticmethod
+    def _wake_level(level: int) -> bool:
+        """Return the esp32 ext0 constant for a pin level."""
+        return esp32.WAKEUP_ANY_HIGH if level else esp32.WAKEUP_ALL_LOW
+
     def _light_sleep(self, duration_ms: int) -> None:
         """
         Enter light sleep mode.
@@ -54,6 +191,20 @@ class PowerManager:
         except AttributeError:
             sleep_ms(duration_ms)
 
+    @staticmethod
+    def release_hold(pin_id: int) -> None:
+        """
+        Release a Pin hold set by deep_sleep_until() before a reset.
+
+        A held pin ignores writes, so call this before a driver claims
+        the pin at boot. No-op on ports without Pin hold.
+
+        Args:
+            pin_id: GPIO number.
+        """
+        if esp32 is not None:
+            machine.Pin(pin_id).init(hold=False)
+
     @staticmethod
     def deep_sleep(duration_ms: int) -> None:
         """
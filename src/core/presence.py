@@ -1,9 +1,13 @@
 """
 Presence detection state machine.
 
-Handles timing logic for activation delay and timeout.
+Handles timing logic for activation delay and timeout, and optionally
+learns the timeout from the gaps observed while people are present.
 """
-from time import ticks_ms, ticks_diff
+from array import array
+from time import ticks_diff, ticks_ms
+
+from core.events import Event
 
 
 class PresenceState:
@@ -15,6 +19,79 @@ class PresenceState:
     TIMEOUT = "timeout"
 
 
+class Histogram:
+    """
+    Fixed-memory histogram of durations.
+
+    Counts live in a preallocated array; values beyond the last bin are
+    counted in the last bin. When the total reaches max_count all bins
+    are halved, so old observations fade out and the memory never grows.
+
+    Attributes:
+        bin_ms: Width of one bin in milliseconds.
+        total: Number of (aged) observations.
+    """
+
+    def __init__(self, bins: int, bin_ms: int, max_count: int = 1000) -> None:
+        """
+        Initialize histogram.
+
+        Args:
+            bins: Number of bins.
+            bin_ms: Width of one bin in milliseconds.
+            max_count: Total at which all counts are halved.
+        """
+        self.bin_ms = bin_ms
+        self._counts = array("H", [0] * bins)
+        self._max_count = max_count
+        self.total = 0
+
+    def __len__(self) -> int:
+        """Return number of bins."""
+        return len(self._counts)
+
+    def __getitem__(self, index: int) -> int:
+        """Return count of one bin."""
+        return self._counts[index]
+
+    def add(self, value_ms: int) -> None:
+        """
+        Count one observation.
+
+        Args:
+            value_ms: Duration in milliseconds (negative counts as 0).
+        """
+        counts = self._counts
+        index = max(0, min(value_ms // self.bin_ms, len(counts) - 1))
+        counts[index] += 1
+        self.total += 1
+        if self.total >= self._max_count:
+            self.total = 0
+            for i in range(len(counts)):
+                counts[i] >>= 1
+                self.total += counts[i]
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Return the duration below which the given fraction falls.
+
+        Args:
+            fraction: Quantile between 0.0 and 1.0.
+
+        Returns:
+            Upper edge of the bin reaching the quantile in ms, 0 if empty.
+        """
+        if not self.total:
+            return 0
+        needed = fraction * self.total
+        seen = 0
+        for i in range(len(self._counts)):
+            seen += self._counts[i]
+            if seen >= needed:
+                return (i + 1) * self.bin_ms
+        return len(self._counts) * self.bin_ms
+
+
 class PresenceDetector:
     """
     State machine for presence detection with hysteresis.
@@ -25,6 +102,17 @@ class PresenceDetector:
     State diagram:
         IDLE → (presence) → DETECTING → (sustained) → ACTIVE
         ACTIVE → (no presence) → TIMEOUT → (expired) → IDLE
+
+    If an approach is reported before activation (see ApproachTracker),
+    the detection is pre-armed and the shorter approach_activation_ms
+    dwell applies instead of activation_ms.
+
+    With min/max_timeout_ms given, the timeout adapts. Every drop-out
+    that ends with the person coming back is a gap: either short enough
+    to be bridged by the timeout, or a flap (light off, then on again
+    within flap_window_ms). Gaps and session lengths go into fixed-size
+    histograms, and the timeout becomes the shortest one that would
+    have bridged all but flap_rate flaps per session, within the bounds.
     """
 
     def __init__(
@@ -33,6 +121,13 @@ class PresenceDetector:
         timeout_ms: int,
         on_activate=None,
         on_deactivate=None,
+        events=None,
+        approach_activation_ms: int | None = None,
+        min_timeout_ms: int | None = None,
+        max_timeout_ms: int | None = None,
+        flap_rate: float = 0.05,
+        flap_window_ms: int | None = None,
+        min_gaps: int = 8,
     ) -> None:
         """
         Initialize presence detector.
@@ -42,15 +137,50 @@ class PresenceDetector:
             timeout_ms: Time without presence before deactivating.
             on_activate: Callback when light should turn on.
             on_deactivate: Callback when light should turn off.
+            events: Optional EventQueue. When given, transitions are
+                posted as Event.PRESENCE_START/END instead of calling
+                the callbacks, so slow consumers run outside update().
+            approach_activation_ms: Dwell required when an approach
+                was detected (default: same as activation_ms).
+            min_timeout_ms: Lower bound of the learned timeout. Learning
+                is enabled when both bounds are given.
+            max_timeout_ms: Upper bound of the learned timeout.
+            flap_rate: Target re-triggers per session.
+            flap_window_ms: A return within this time after light off
+                counts as a flap (default: twice max_timeout_ms).
+            min_gaps: Gaps observed before timeout_ms starts to adapt.
         """
         self._activation_ms = activation_ms
+        if approach_activation_ms is None:
+            approach_activation_ms = activation_ms
+        self._approach_activation_ms = approach_activation_ms
         self._timeout_ms = timeout_ms
         self._on_activate = on_activate
         self._on_deactivate = on_deactivate
+        self._events = events
 
         self._state = PresenceState.IDLE
         self._detection_start: int = 0
         self._last_presence: int = 0
+        self._approach_armed = False
+
+        self._adaptive = min_timeout_ms is not None and max_timeout_ms is not None
+        self._min_timeout_ms = min_timeout_ms
+        self._max_timeout_ms = max_timeout_ms
+        self._flap_rate = flap_rate
+        if flap_window_ms is None and self._adaptive:
+            flap_window_ms = 2 * max_timeout_ms
+        self._flap_window_ms = flap_window_ms
+        self._min_gaps = min_gaps
+        self.gaps = None
+        self.sessions = None
+        if self._adaptive:
+            self.gaps = Histogram(bins=40, bin_ms=max(1, flap_window_ms // 40))
+            self.sessions = Histogram(bins=32, bin_ms=15000)
+        self.flaps = 0
+        self._session_start: int = 0
+        self._ended_at = None
+        self._return_gap = -1
 
     @property
     def state(self) -> str:
@@ -62,42 +192,100 @@ class PresenceDetector:
         """Return True if light should be on."""
         return self._state == PresenceState.ACTIVE
 
-    def update(self, presence_detected: bool) -> None:
+    @property
+    def is_idle(self) -> bool:
+        """Return True if nobody is present or being detected."""
+        return self._state == PresenceState.IDLE
+
+    @property
+    def is_detecting(self) -> bool:
+        """Return True while presence is being confirmed."""
+        return self._state == PresenceState.DETECTING
+
+    @property
+    def approach_armed(self) -> bool:
+        """Return True if the current detection was pre-armed."""
+        return self._approach_armed
+
+    @property
+    def timeout_ms(self) -> int:
+        """Return current timeout (learned if adaptive)."""
+        return self._timeout_ms
+
+    @property
+    def adaptive(self) -> bool:
+        """Return True if the timeout is learned."""
+        return self._adaptive
+
+    # emit: native
+    def update(
+        self,
+        presence_detected: bool,
+        approaching: bool = False,
+        now: int | None = None,
+    ) -> None:
         """
         Update state machine with new sensor reading.
 
         Args:
             presence_detected: True if sensor detects presence.
+            approaching: True if someone is walking up to the mirror.
+            now: Sample timestamp (ticks_ms), default current time.
         """
-        now = ticks_ms()
+        if now is None:
+            now = ticks_ms()
+
+        if self._state == PresenceState.IDLE:
+            self._approach_armed = approaching
+        elif approaching:
+            self._approach_armed = True
 
         if presence_detected:
             self._handle_presence(now)
         else:
             self._handle_no_presence(now)
 
+    # emit: native
     def _handle_presence(self, now: int) -> None:
         """Handle state transitions when presence is detected."""
+        gap = ticks_diff(now, self._last_presence)
         self._last_presence = now
 
         if self._state == PresenceState.IDLE:
             self._state = PresenceState.DETECTING
             self._detection_start = now
+            if self._ended_at is not None:
+                gap = ticks_diff(now, self._ended_at)
+                self._ended_at = None
+                if gap < self._flap_window_ms:
+                    self._return_gap = gap
 
         elif self._state == PresenceState.DETECTING:
             elapsed = ticks_diff(now, self._detection_start)
-            if elapsed >= self._activation_ms:
+            if self._approach_armed:
+                required = self._approach_activation_ms
+            else:
+                required = self._activation_ms
+            if elapsed >= required:
                 self._state = PresenceState.ACTIVE
-                if self._on_activate:
-                    self._on_activate()
+                self._session_start = self._detection_start
+                if self._return_gap >= 0:
+                    self.flaps += 1
+                    self._learn_gap(self._return_gap)
+                    self._return_gap = -1
+                self._notify(Event.PRESENCE_START, self._on_activate)
 
         elif self._state == PresenceState.TIMEOUT:
             self._state = PresenceState.ACTIVE
+            if self._adaptive:
+                self._learn_gap(gap)
 
+    # emit: native
     def _handle_no_presence(self, now: int) -> None:
         """Handle state transitions when no presence is detected."""
         if self._state == PresenceState.DETECTING:
             self._state = PresenceState.IDLE
+            self._return_gap = -1
 
         elif self._state == PresenceState.ACTIVE:
             self._state = PresenceState.TIMEOUT
@@ -106,5 +294,37 @@ class PresenceDetector:
             elapsed = ticks_diff(now, self._last_presence)
             if elapsed >= self._timeout_ms:
                 self._state = PresenceState.IDLE
-                if self._on_deactivate:
-                    self._on_deactivate()
+                if self._adaptive:
+                    self.sessions.add(ticks_diff(self._last_presence, self._session_start))
+                    self._ended_at = self._last_presence
+                    self._adapt()
+                self._notify(Event.PRESENCE_END, self._on_deactivate)
+
+    def _learn_gap(self, gap_ms: int) -> None:
+        """Count one drop-out that ended with the person returning."""
+        self.gaps.add(gap_ms)
+        self._adapt()
+
+    def _adapt(self) -> None:
+        """
+        Pick the shortest timeout keeping flaps at the target rate.
+
+        A gap longer than the timeout turns into a flap, so the share of
+        gaps allowed above it is flap_rate * sessions / gaps.
+        """
+        gaps = self.gaps.total
+        if gaps < self._min_gaps:
+            return
+        allowed = self._flap_rate * max(1, self.sessions.total) / gaps
+        if allowed >= 1.0:
+            timeout = self._min_timeout_ms
+        else:
+            timeout = self.gaps.percentile(1.0 - allowed)
+        self._timeout_ms = max(self._min_timeout_ms, min(timeout, self._max_timeout_ms))
+
+    def _notify(self, event: int, callback) -> None:
+        """Post transition event, or call callback directly if no queue."""
+        if self._events is not None:
+            self._events.post(event)
+        elif callback:
+            callback()
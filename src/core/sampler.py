@@ -0,0 +1,170 @@
+"""
+Threaded sensor sampling module.
+
+Samples a DistanceSensor at a fixed rate from a _thread worker into
+a lock-free ring buffer, so sampling cadence stays constant while the
+main thread runs the state machine and fades.
+"""
+import os
+from array import array
+from time import sleep_ms, ticks_add, ticks_diff, ticks_ms
+
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+# Port names (os.uname().machine) of single-core parts
+_SINGLE_CORE_MARKERS = (
+    "ESP8266",
+    "ESP32C2",
+    "ESP32C3",
+    "ESP32C6",
+    "ESP32S2",
+    "ESP32-C",
+    "ESP32-S2",
+)
+
+
+def dual_core() -> bool:
+    """
+    Return True if a sampling thread can run alongside the main loop.
+
+    Requires _thread and a part not known to be single-core.
+    """
+    if _thread is None:
+        return False
+    machine_name = os.uname().machine.upper()
+    for marker in _SINGLE_CORE_MARKERS:
+        if marker in machine_name:
+            return False
+    return True
+
+
+class SampleRing:
+    """
+    Single-producer/single-consumer ring of timestamped distances.
+
+    The producer only writes the tail, the consumer only writes the
+    head, so no lock is needed. Storage is preallocated arrays; pop()
+    exposes the sample through attributes instead of a tuple so the
+    consumer does not allocate.
+
+    Attributes:
+        distance: Distance of the last popped sample (mm, -1 if invalid).
+        timestamp: ticks_ms of the last popped sample.
+        overruns: Samples dropped because the consumer fell behind.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        Initialize ring.
+
+        Args:
+            capacity: Maximum number of unread samples.
+        """
+        self._size = capacity + 1
+        self._distances = array("h", [0] * self._size)
+        self._timestamps = array("l", [0] * self._size)
+        self._head = 0
+        self._tail = 0
+        self.distance = -1
+        self.timestamp = 0
+        self.overruns = 0
+
+    def __len__(self) -> int:
+        """Return number of unread samples."""
+        return (self._tail - self._head) % self._size
+
+    def push(self, distance: int, timestamp: int) -> bool:
+        """
+        Append sample (producer side).
+
+        Returns:
+            False if the ring was full and the sample was dropped.
+        """
+        next_tail = (self._tail + 1) % self._size
+        if next_tail == self._head:
+            self.overruns += 1
+            return False
+        self._distances[self._tail] = distance
+        self._timestamps[self._tail] = timestamp
+        self._tail = next_tail
+        return True
+
+    def pop(self) -> bool:
+        """
+        Remove oldest sample into distance/timestamp (consumer side).
+
+        Returns:
+            False if the ring was empty.
+        """
+        if self._head == self._tail:
+            return False
+        self.distance = self._distances[self._head]
+        self.timestamp = self._timestamps[self._head]
+        self._head = (self._head + 1) % self._size
+        return True
+
+
+class ThreadedSampler:
+    """
+    Samples a sensor on a worker thread at fixed deadlines.
+
+    Deadlines are absolute (ticks_add), so measurement time does not
+    accumulate as drift. If a measurement overruns the period the
+    schedule resynchronizes instead of bursting to catch up.
+
+    Note: light sleep halts every core, so the main thread must use
+    regular sleeps while the sampler runs.
+    """
+
+    def __init__(self, sensor, period_ms: int = 100, capacity: int = 16) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            sensor: DistanceSensor to sample.
+            period_ms: Sampling period.
+            capacity: Ring buffer capacity.
+        """
+        self._sensor = sensor
+        self._period_ms = period_ms
+        self.ring = SampleRing(capacity)
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Return True while the worker thread is sampling."""
+        return self._running
+
+    def start(self) -> bool:
+        """
+        Start worker thread.
+
+        Returns:
+            False on single-core parts; the caller keeps sampling inline.
+        """
+        if not dual_core():
+            return False
+        self._running = True
+        _thread.start_new_thread(self._run, ())
+        return True
+
+    def stop(self) -> None:
+        """Ask worker thread to exit after its current sample."""
+        self._running = False
+
+    def _run(self) -> None:
+        """Worker loop."""
+        deadline = ticks_ms()
+        while self._running:
+            distance = self._sensor.measure_mm()
+            self.ring.push(distance, ticks_ms())
+
+            deadline = ticks_add(deadline, self._period_ms)
+            delay = ticks_diff(deadline, ticks_ms())
+            if delay > 0:
+                sleep_ms(delay)
+            else:
+                deadline = ticks_ms()
@@ -0,0 +1,156 @@
+"""
+Sample scheduling module.
+
+Starts each loop iteration at an exact multiple of the sample period,
+independent of how long the measurement or event dispatch took, and
+records per-sample jitter.
+"""
+from time import ticks_add, ticks_diff, ticks_us
+
+import machine
+
+try:
+    import micropython
+except ImportError:
+    micropython = None
+
+
+class SampleScheduler:
+    """
+    Fixed-period scheduler on absolute ticks_us deadlines.
+
+    Deadline mode (default) sleeps only for the time remaining until
+    the next deadline, via PowerManager so light sleep still applies,
+    and learns the average wake latency to wake slightly early.
+
+    Timer mode (timer_id given) counts machine.Timer ticks delivered
+    through micropython.schedule and idles until the next one. It does
+    not light-sleep, so use it only when USE_LIGHT_SLEEP is off.
+
+    Late iterations that miss whole periods skip them rather than
+    bursting to catch up.
+
+    wait() can poll short background work (fade steps) while it waits:
+    the sleep is cut into poll_ms slices for as long as poll() returns
+    True, so the work runs between samples without moving a deadline.
+
+    Attributes:
+        last_jitter_us: Lateness of the most recent iteration.
+        max_jitter_us: Worst lateness since reset_stats().
+        mean_jitter_us: Exponential moving average of lateness (1/16).
+        missed: Number of whole periods skipped.
+    """
+
+    def __init__(self, period_ms: int, power, timer_id: int | None = None) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            period_ms: Sample period.
+            power: PowerManager used to sleep between deadlines.
+            timer_id: Hardware timer to use for timer mode (optional).
+        """
+        self._period_us = period_ms * 1000
+        self._power = power
+        self._deadline = ticks_us()
+        self._pending = 0
+        self._timer = None
+        self._wake_latency_us = 0
+
+        self.last_jitter_us = 0
+        self.max_jitter_us = 0
+        self.mean_jitter_us = 0
+        self.missed = 0
+
+        if timer_id is not None and micropython is not None:
+            # Bound methods cached: creating them in IRQ context allocates
+            self._tick_ref = self._tick
+            self._irq_ref = self._irq
+            self._timer = machine.Timer(timer_id)
+            self._timer.init(
+                mode=machine.Timer.PERIODIC,
+                period=period_ms,
+                callback=self._irq_ref,
+            )
+
+    def wait(self, poll=None, poll_ms: int = 0) -> None:
+        """
+        Block until the next sample deadline.
+
+        Args:
+            poll: Optional callable run every poll_ms while it returns
+                True (must not allocate; pass a cached bound method).
+            poll_ms: Poll interval in milliseconds.
+        """
+        self._deadline = ticks_add(self._deadline, self._period_us)
+
+        slept = False
+        if self._timer is not None:
+            while not self._pending:
+                if poll is not None:
+                    poll()
+                machine.idle()
+            self._pending -= 1
+        else:
+            if poll is not None:
+                self._poll(poll, poll_ms)
+            remaining = ticks_diff(self._deadline, ticks_us()) - self._wake_latency_us
+            if remaining >= 1000:
+                self._power.sleep(remaining // 1000)
+                slept = True
+
+        jitter = ticks_diff(ticks_us(), self._deadline)
+        if slept:
+            # Oversleep relative to the early wake we aimed for
+            oversleep = jitter + self._wake_latency_us
+            self._wake_latency_us += (oversleep - self._wake_latency_us) >> 4
+        self._record(jitter)
+
+    def _poll(self, poll, poll_ms: int) -> None:
+        """Run poll() every poll_ms until it is done or the deadline is near."""
+        while poll():
+            remaining = ticks_diff(self._deadline, ticks_us()) - self._wake_latency_us
+            if remaining < (poll_ms + 1) * 1000:
+                return
+            self._power.sleep(poll_ms)
+
+    def resync(self) -> None:
+        """Restart the schedule from now (after an unscheduled sleep)."""
+        self._deadline = ticks_us()
+        self._pending = 0
+
+    def reset_stats(self) -> None:
+        """Clear jitter statistics."""
+        self.last_jitter_us = 0
+        self.max_jitter_us = 0
+        self.mean_jitter_us = 0
+        self.missed = 0
+
+    def deinit(self) -> None:
+        """Release hardware timer."""
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+
+    def _record(self, jitter: int) -> None:
+        """Update jitter statistics and skip missed periods."""
+        if jitter >= self._period_us:
+            skipped = jitter // self._period_us
+            self.missed += skipped
+            self._deadline = ticks_add(self._deadline, skipped * self._period_us)
+            jitter -= skipped * self._period_us
+
+        self.last_jitter_us = jitter
+        self.max_jitter_us = max(self.max_jitter_us, jitter)
+        self.mean_jitter_us += (jitter - self.mean_jitter_us) >> 4
+
+    def _irq(self, _timer) -> None:
+        """Timer interrupt: defer tick to scheduler context."""
+        try:
+            micropython.schedule(self._tick_ref, 0)
+        except RuntimeError:
+            pass  # Schedule queue full: tick shows up as jitter
+
+    def _tick(self, _arg) -> None:
+        """Scheduled timer tick."""
+        self._pending += 1
@@ -0,0 +1,434 @@
+"""
+Telemetry publisher module.
+
+Optional: batches events, counters and sampled distances into compact
+binary messages sent at most once per interval. Records live in a
+bounded ring buffer that drops the oldest data when the network cannot
+keep up, so the main loop never waits on WiFi.
+
+Wire format (little endian, one message per batch):
+    header:   magic b"MT", version u8, device u16, seq u16,
+              ticks_ms u32, counter count u8, record count u8
+    counters: u32 each, indexed by Counter
+    records:  kind u8, arg u8, value i16, ticks_ms u32
+"""
+import errno
+import select
+import socket
+import struct
+from time import ticks_add, ticks_diff, ticks_ms
+
+TELEMETRY_MAGIC = b"MT"
+TELEMETRY_VERSION = 1
+TELEMETRY_HEADER_FORMAT = "<2sBHHIBB"
+TELEMETRY_HEADER_SIZE = struct.calcsize(TELEMETRY_HEADER_FORMAT)
+TELEMETRY_COUNTER_FORMAT = "<I"
+TELEMETRY_COUNTER_SIZE = 4
+TELEMETRY_RECORD_FORMAT = "<BBhI"
+TELEMETRY_RECORD_SIZE = struct.calcsize(TELEMETRY_RECORD_FORMAT)
+TELEMETRY_MAX_RECORDS = 255
+
+_MQTT_CONNECT = 0x10
+_MQTT_CONNACK = 0x20
+_MQTT_PUBLISH = 0x30
+# Non-blocking connect() and recv() results that mean "not yet"
+_MQTT_PENDING = (errno.EINPROGRESS, errno.EAGAIN)
+
+
+def _mqtt_header(kind: int, size: int) -> bytearray:
+    """Return MQTT fixed header: packet type and variable-length size."""
+    header = bytearray((kind,))
+    while True:
+        byte = size & 0x7F
+        size >>= 7
+        header.append(byte | 0x80 if size else byte)
+        if not size:
+            return header
+
+
+def _mqtt_string(value: bytes) -> bytes:
+    """Return value as a length-prefixed MQTT string."""
+    return struct.pack("!H", len(value)) + value
+
+
+class RecordKind:
+    """Enum-like class for telemetry record kinds."""
+
+    EVENT = 1     # arg: Event id
+    DISTANCE = 2  # value: distance in mm, -1 if invalid
+
+
+class Counter:
+    """Enum-like class for counter slots."""
+
+    SAMPLES = 0
+    ACTIVATIONS = 1
+    DEACTIVATIONS = 2
+    SENSOR_FAULTS = 3
+    DROPPED = 4           # Records discarded under backpressure
+    PUBLISH_FAILURES = 5
+
+    COUNT = 6
+
+
+class TelemetryPublisher:
+    """
+    Batches telemetry into rate-limited binary messages.
+
+    Recording is allocation-free and O(1). poll() sends at most one
+    message per interval; if the transport refuses it, records are
+    kept and the oldest are overwritten once the buffer is full.
+    Every poll() also lets the transport advance its connection, which
+    must never block.
+    """
+
+    def __init__(
+        self,
+        transport,
+        device_id: int = 0,
+        interval_ms: int = 10000,
+        capacity: int = 64,
+        distance_every: int = 10,
+    ) -> None:
+        """
+        Initialize telemetry publisher.
+
+        Args:
+            transport: Object with poll() and publish(payload) -> bool.
+            device_id: Identifier of this mirror (0-65535).
+            interval_ms: Minimum time between messages.
+            capacity: Maximum buffered records (up to 255).
+            distance_every: Record one distance every N samples.
+        """
+        self._transport = transport
+        self._device_id = device_id
+        self._interval_ms = interval_ms
+        self._capacity = min(capacity, TELEMETRY_MAX_RECORDS)
+        self._distance_every = max(1, distance_every)
+
+        self._records = bytearray(self._capacity * TELEMETRY_RECORD_SIZE)
+        self._head = 0
+        self._count = 0
+        self._counters = [0] * Counter.COUNT
+        counters_size = Counter.COUNT * TELEMETRY_COUNTER_SIZE
+        self._payload = bytearray(
+            TELEMETRY_HEADER_SIZE + counters_size + len(self._records)
+        )
+        self._payload_view = memoryview(self._payload)
+        self._seq = 0
+        self._distance_skip = 0
+        self._last_publish = ticks_ms()
+
+    @property
+    def pending(self) -> int:
+        """Return number of buffered records."""
+        return self._count
+
+    def counter(self, index: int) -> int:
+        """Return current value of a counter."""
+        return self._counters[index]
+
+    def count(self, index: int, amount: int = 1) -> None:
+        """Increment a counter."""
+        self._counters[index] += amount
+
+    def record(self, kind: int, arg: int = 0, value: int = 0) -> None:
+        """
+        Append a record, overwriting the oldest if full.
+
+        Args:
+            kind: RecordKind value.
+            arg: Small argument (0-255).
+            value: Signed 16-bit value.
+        """
+        if self._count == self._capacity:
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+            self._counters[Counter.DROPPED] += 1
+
+        slot = (self._head + self._count) % self._capacity
+        struct.pack_into(
+            TELEMETRY_RECORD_FORMAT, self._records, slot * TELEMETRY_RECORD_SIZE,
+            kind, arg, value, ticks_ms() & 0xFFFFFFFF,
+        )
+        self._count += 1
+
+    def record_event(self, event: int) -> None:
+        """Record a presence event."""
+        self.record(RecordKind.EVENT, event)
+
+    def record_distance(self, distance: int) -> None:
+        """
+        Count a sample and record every Nth distance.
+
+        Args:
+            distance: Distance in mm, negative if invalid.
+        """
+        self._counters[Counter.SAMPLES] += 1
+        self._distance_skip += 1
+        if self._distance_skip < self._distance_every:
+            return
+        self._distance_skip = 0
+        value = distance if distance >= 0 else -1
+        self.record(RecordKind.DISTANCE, 0, min(value, 32767))
+
+    def poll(self) -> bool:
+        """
+        Publish pending data if the interval has elapsed.
+
+        Returns:
+            True if a message was handed to the transport.
+        """
+        self._transport.poll()
+        now = ticks_ms()
+        if ticks_diff(now, self._last_publish) < self._interval_ms:
+            return False
+        self._last_publish = now
+
+        size = self._encode(now)
+        if not self._transport.publish(self._payload_view[:size]):
+            self._counters[Counter.PUBLISH_FAILURES] += 1
+            return False
+
+        self._head = 0
+        self._count = 0
+        self._seq = (self._seq + 1) & 0xFFFF
+        return True
+
+    def _encode(self, now: int) -> int:
+        """Serialize header, counters and records into payload buffer."""
+        payload = self._payload
+        struct.pack_into(
+            TELEMETRY_HEADER_FORMAT, payload, 0,
+            TELEMETRY_MAGIC, TELEMETRY_VERSION, self._device_id, self._seq,
+            now & 0xFFFFFFFF, Counter.COUNT, self._count,
+        )
+
+        offset = TELEMETRY_HEADER_SIZE
+        for value in self._counters:
+            struct.pack_into(TELEMETRY_COUNTER_FORMAT, payload, offset, value & 0xFFFFFFFF)
+            offset += TELEMETRY_COUNTER_SIZE
+
+        # Copy ring in chronological order (at most two slices)
+        start = self._head * TELEMETRY_RECORD_SIZE
+        end = start + self._count * TELEMETRY_RECORD_SIZE
+        total = len(self._records)
+        if end <= total:
+            payload[offset:offset + end - start] = self._records[start:end]
+        else:
+            first = total - start
+            payload[offset:offset + first] = self._records[start:]
+            payload[offset + first:offset + end - start] = self._records[:end - total]
+        return offset + end - start
+
+
+class UDPTransport:
+    """
+    Fire-and-forget UDP transport.
+
+    The socket is non-blocking: if the stack cannot take the
+    datagram right now, publish() returns False immediately.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Initialize UDP transport.
+
+        Args:
+            host: Collector host name or IP.
+            port: Collector UDP port.
+        """
+        self._host = host
+        self._port = port
+        self._address = None
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def poll(self) -> bool:
+        """Return True: datagrams need no connection."""
+        return True
+
+    def publish(self, payload) -> bool:
+        """Send payload as one datagram."""
+        try:
+            if self._address is None:
+                self._address = socket.getaddrinfo(self._host, self._port)[0][-1]
+            self._socket.sendto(payload, self._address)
+        except OSError:
+            return False
+        return True
+
+
+class MQTTTransport:
+    """
+    MQTT 3.1.1 publisher (QoS 0) on a non-blocking socket.
+
+    Nothing here blocks the caller. poll() advances the connection one
+    step per call: TCP connect, CONNECT sent once the socket is
+    writable, CONNACK read when it arrives. publish() returns False
+    immediately until the broker has accepted the session.
+
+    A handshake slower than timeout_ms, a refused or dropped connection
+    or a send the socket cannot take in full closes the socket; poll()
+    reconnects after retry_ms. Give server as an IP address: a host
+    name lookup blocks.
+    """
+
+    _DISCONNECTED = 0
+    _CONNECTING = 1  # TCP connect in progress
+    _HANDSHAKE = 2   # CONNECT sent, waiting for CONNACK
+    _CONNECTED = 3
+
+    def __init__(
+        self,
+        client_id: str,
+        server: str,
+        topic: str,
+        port: int = 1883,
+        timeout_ms: int = 5000,
+        retry_ms: int = 10000,
+    ) -> None:
+        """
+        Initialize MQTT transport.
+
+        Args:
+            client_id: MQTT client identifier.
+            server: Broker IP address (or host name, see above).
+            topic: Topic to publish batches on.
+            port: Broker port.
+            timeout_ms: Longest TCP connect plus CONNECT/CONNACK exchange.
+            retry_ms: Delay before reconnecting after a failure.
+        """
+        self._server = server
+        self._port = port
+        self._address = None
+        self._timeout_ms = timeout_ms
+        self._retry_ms = retry_ms
+        topic = topic.encode() if isinstance(topic, str) else topic
+        self._topic = _mqtt_string(topic)
+        # Protocol "MQTT" level 4, clean session, no keepalive
+        body = _mqtt_string(b"MQTT") + b"\x04\x02\x00\x00" + _mqtt_string(client_id.encode())
+        self._connect_packet = _mqtt_header(_MQTT_CONNECT, len(body)) + body
+        self._connack = bytearray(4)
+        self._connack_size = 0
+        self._socket = None
+        self._poller = None
+        self._state = self._DISCONNECTED
+        self._since = ticks_add(ticks_ms(), -retry_ms)  # Connect on first poll()
+
+    @property
+    def connected(self) -> bool:
+        """Return True once the broker has accepted the session."""
+        return self._state == self._CONNECTED
+
+    def poll(self) -> bool:
+        """
+        Advance the connection without blocking.
+
+        Returns:
+            True if connected.
+        """
+        state = self._state
+        if state == self._CONNECTED:
+            return True
+        now = ticks_ms()
+        if state == self._DISCONNECTED:
+            if ticks_diff(now, self._since) >= self._retry_ms:
+                self._open(now)
+            return False
+        if ticks_diff(now, self._since) >= self._timeout_ms:
+            self._close(now)
+            return False
+        try:
+            if state == self._CONNECTING:
+                if self._writable():
+                    self._send(self._connect_packet)
+                    self._state = self._HANDSHAKE
+            else:
+                self._receive_connack()
+        except OSError:
+            self._close(now)
+        return self._state == self._CONNECTED
+
+    def publish(self, payload) -> bool:
+        """Publish payload with QoS 0 if connected."""
+        if self._state != self._CONNECTED:
+            return False
+        topic = self._topic
+        # One send per packet: split writes would wait on Nagle's algorithm
+        packet = _mqtt_header(_MQTT_PUBLISH, len(topic) + len(payload))
+        packet += topic
+        packet += payload
+        try:
+            self._send(packet)
+        except OSError:
+            self._close(ticks_ms())
+            return False
+        return True
+
+    def _open(self, now: int) -> None:
+        """Start a non-blocking TCP connect to the broker."""
+        self._since = now
+        try:
+            if self._address is None:
+                self._address = socket.getaddrinfo(self._server, self._port)[0][-1]
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket.setblocking(False)
+            try:
+                self._socket.connect(self._address)
+            except OSError as error:
+                if error.args[0] not in _MQTT_PENDING:
+                    raise
+            self._poller = select.poll()
+            self._poller.register(self._socket, select.POLLOUT)
+        except OSError:
+            self._close(now)
+            return
+        self._connack_size = 0
+        self._state = self._CONNECTING
+
+    def _writable(self) -> bool:
+        """Return True once the TCP connect completed; raise if it failed."""
+        events = self._poller.poll(0)
+        if not events:
+            return False
+        if events[0][1] & (select.POLLERR | select.POLLHUP):
+            raise OSError(errno.ECONNREFUSED)
+        return True
+
+    def _receive_connack(self) -> None:
+        """Read CONNACK as far as it arrived; connect if the broker accepted."""
+        try:
+            data = self._socket.recv(4 - self._connack_size)
+        except OSError as error:
+            if error.args[0] in _MQTT_PENDING:
+                return
+            raise
+        if not data:
+            raise OSError(errno.ECONNRESET)
+        size = self._connack_size
+        self._connack[size:size + len(data)] = data
+        self._connack_size = size + len(data)
+        if self._connack_size < 4:
+            return
+        ack = self._connack
+        if ack[0] != _MQTT_CONNACK or ack[1] != 2 or ack[3] != 0:
+            raise OSError(errno.ECONNREFUSED)
+        self._state = self._CONNECTED
+
+    def _send(self, data) -> None:
+        """Send data in full; a short write would corrupt the stream."""
+        if self._socket.send(data) != len(data):
+            raise OSError(errno.EAGAIN)
+
+    def _close(self, now: int) -> None:
+        """Drop the connection; poll() retries after retry_ms."""
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._poller = None
+        self._state = self._DISCONNECTED
+        self._since = now
@@ -0,0 +1,138 @@
+"""
+Latency tracing module.
+
+Stamps trace points with ticks_us into preallocated arrays, so the
+path from "person enters range" to "light at full brightness" can be
+broken down (sensor conversion, filtering, activation dwell, event
+dispatch, fade). Dumps are plain console lines that
+scripts/trace_export.py turns into Chrome trace / Perfetto JSON.
+"""
+from array import array
+from time import ticks_us
+
+# Prefix of dumped lines - must match scripts/trace_export.py
+DUMP_PREFIX = "@trace"
+
+
+class TracePoint:
+    """
+    Enum-like class for trace point identifiers.
+
+    Names are kept in scripts/trace_export.py; keep both in sync.
+    """
+
+    SENSOR = 0    # Span: one sensor conversion
+    FILTER = 1    # Span: approach tracking and presence state machine
+    ENTER = 2     # Instant: first in-range sample
+    DWELL = 3     # Span: activation dwell (ends on activation or loss)
+    ACTIVATE = 4  # Instant: presence confirmed, event queued
+    DISPATCH = 5  # Span: PRESENCE_START handler
+    FADE = 6      # Span: fade in to full brightness
+
+
+class TracePhase:
+    """Enum-like class for record phases (Chrome trace "B", "E", "i")."""
+
+    BEGIN = 0
+    END = 1
+    INSTANT = 2
+
+
+class Tracer:
+    """
+    Ring buffer of ticks_us trace records.
+
+    Recording stores point, phase, argument (zone index) and timestamp
+    without allocating; when the ring is full the oldest record is
+    overwritten and counted in dropped, so the ring always holds the
+    most recent history. Call trigger() once a complete episode has
+    been recorded; the app dumps triggered traces in idle windows.
+
+    Attributes:
+        dropped: Records overwritten before they were dumped.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """
+        Initialize tracer.
+
+        Args:
+            capacity: Number of records kept.
+        """
+        self._size = capacity
+        self._points = bytearray(capacity)
+        self._phases = bytearray(capacity)
+        self._args = bytearray(capacity)
+        self._ticks = array("l", [0] * capacity)
+        self._head = 0
+        self._count = 0
+        self._triggered = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return number of records waiting to be dumped."""
+        return self._count
+
+    @property
+    def triggered(self) -> bool:
+        """Return True if a complete episode is waiting to be dumped."""
+        return self._triggered
+
+    def begin(self, point: int, arg: int = 0) -> None:
+        """Record the start of a span."""
+        self._record(point, TracePhase.BEGIN, arg)
+
+    def end(self, point: int, arg: int = 0) -> None:
+        """Record the end of a span."""
+        self._record(point, TracePhase.END, arg)
+
+    def instant(self, point: int, arg: int = 0) -> None:
+        """Record an instant event."""
+        self._record(point, TracePhase.INSTANT, arg)
+
+    def trigger(self) -> None:
+        """Mark the buffer for dumping (an episode has completed)."""
+        self._triggered = True
+
+    def dump(self, write=print) -> int:
+        """
+        Write all records, oldest first, and clear the buffer.
+
+        A "@trace-dump <records> <dropped>" header is followed by one
+        "@trace <ticks_us> <point> <phase> <arg>" line per record. Call
+        only in idle windows: formatting allocates and writing blocks
+        on the console.
+
+        Args:
+            write: Callable receiving each line.
+
+        Returns:
+            Number of records written.
+        """
+        write(f"{DUMP_PREFIX}-dump {self._count} {self.dropped}")
+        written = 0
+        while self._count:
+            index = self._head
+            write(
+                f"{DUMP_PREFIX} {self._ticks[index]} {self._points[index]} "
+                f"{self._phases[index]} {self._args[index]}"
+            )
+            self._head = (index + 1) % self._size
+            self._count -= 1
+            written += 1
+        self._triggered = False
+        self.dropped = 0
+        return written
+
+    def _record(self, point: int, phase: int, arg: int) -> None:
+        """Store one record, overwriting the oldest if full."""
+        if self._count == self._size:
+            self._head = (self._head + 1) % self._size
+            self._count -= 1
+            self.dropped += 1
+        index = (self._head + self._count) % self._size
+        self._points[index] = point
+        self._phases[index] = phase
+        self._args[index] = arg
+        self._ticks[index] = ticks_us()
+        self._count += 1
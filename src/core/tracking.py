@@ -0,0 +1,118 @@
+"""
+Approach tracking module.
+
+Estimates distance and approach velocity from the raw distance
+stream so presence activation can be pre-armed for someone
+walking straight up to the mirror.
+"""
+from time import ticks_diff, ticks_ms
+
+
+class ApproachTracker:
+    """
+    Alpha-beta filter over the distance stream.
+
+    A track starts on the first valid sample within track range and
+    is dropped on any invalid sample. An approach is reported only
+    once the track is established (min_samples), the filtered velocity
+    points towards the mirror faster than approach_speed, and the
+    target has travelled at least min_travel since the track started.
+    Walk-bys fail these checks: they appear abruptly at a roughly
+    constant distance and never build a long inbound track.
+
+    The filter runs on small ints (mm, mm/s, gains in 1/256) so a
+    sample never allocates; configuration stays in cm.
+
+    Attributes:
+        position: Filtered distance in mm.
+        velocity: Filtered velocity in mm/s (negative = approaching).
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.5,
+        beta: float = 0.1,
+        track_range_cm: float = 150.0,
+        approach_speed_cm_s: float = 15.0,
+        min_travel_cm: float = 15.0,
+        min_samples: int = 3,
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            alpha: Position correction gain (0-1).
+            beta: Velocity correction gain (0-1).
+            track_range_cm: Samples beyond this drop the track.
+            approach_speed_cm_s: Minimum inbound speed for an approach.
+            min_travel_cm: Minimum inbound travel since track start.
+            min_samples: Samples needed before a track is trusted.
+        """
+        self._alpha = round(alpha * 256)
+        self._beta = round(beta * 256)
+        self._track_range = round(track_range_cm * 10)
+        self._approach_speed = round(approach_speed_cm_s * 10)
+        self._min_travel = round(min_travel_cm * 10)
+        self._min_samples = min_samples
+
+        self.position = 0
+        self.velocity = 0
+        self._start = 0
+        self._samples = 0
+        self._last_update = 0
+        self._approaching = False
+
+    @property
+    def approaching(self) -> bool:
+        """Return True if a confirmed approach is in progress."""
+        return self._approaching
+
+    def reset(self) -> None:
+        """Drop current track."""
+        self._samples = 0
+        self.velocity = 0
+        self._approaching = False
+
+    def update(self, distance: int, now: int | None = None) -> bool:
+        """
+        Feed one distance sample.
+
+        Args:
+            distance: Measured distance in mm, negative if invalid.
+            now: Sample timestamp (ticks_ms), default current time.
+
+        Returns:
+            True if a confirmed approach is in progress.
+        """
+        if now is None:
+            now = ticks_ms()
+
+        if distance < 0 or distance > self._track_range:
+            self.reset()
+            return False
+
+        if self._samples == 0:
+            self.position = distance
+            self._start = distance
+            self._samples = 1
+            self._last_update = now
+            return False
+
+        dt_ms = ticks_diff(now, self._last_update)
+        self._last_update = now
+        if dt_ms <= 0:
+            return self._approaching
+
+        predicted = self.position + self.velocity * dt_ms // 1000
+        residual = distance - predicted
+        self.position = predicted + (self._alpha * residual >> 8)
+        self.velocity += self._beta * residual * 1000 // (dt_ms << 8)
+        if self._samples < self._min_samples:
+            self._samples += 1
+
+        self._approaching = (
+            self._samples >= self._min_samples
+            and self.velocity <= -self._approach_speed
+            and self._start - self.position >= self._min_travel
+        )
+        return self._approaching
@@ -7,27 +7,44 @@ Copy this folder to any project that needs distance sensing.
 Available sensors:
     - ultrasonic: HC-SR04, AJ-SR04M, JSN-SR04T (trigger/echo)
     - vl53l0x: VL53L0X Time-of-Flight laser sensor (I2C)
+    - ld2410: LD2410 mmWave radar presence sensor (UART)
 
 Usage:
     from hardware.sensors import SensorFactory
 
     # Create sensor by type
     sensor = SensorFactory.create("vl53l0x", sda_pin=8, scl_pin=9)
-    distance = sensor.measure()
+    distance = sensor.measure()     # cm (float)
+    distance = sensor.measure_mm()  # mm (small int, no heap allocation)
 
 Adding new sensors:
     1. Create new file in this folder (e.g., my_sensor.py)
-    2. Inherit from DistanceSensor
+    2. Inherit from DistanceSensor and implement measure_mm()
     3. Decorate class with @SensorFactory.register("my_sensor")
     4. Import in this __init__.py
+
+Fault handling:
+    sensor = SensorMonitor(SensorFactory.create("vl53l0x", sda_pin=8, scl_pin=9))
+    sensor.measure()  # Returns -1.0 instantly while backing off
+    sensor.health     # "ok", "degraded" or "failed"
+
+Shared samples:
+    sensor.max_age_ms = 50
+    sensor.read_mm()      # Measures
+    sensor.read_mm()      # Same sample, no bus traffic, while < 50ms old
+    sensor.sample_valid   # In range and fault-free
 """
-from hardware.sensors.base import DistanceSensor
+from hardware.sensors.base import DistanceSensor, SensorHealth
 from hardware.sensors.factory import SensorFactory
+from hardware.sensors.health import SensorMonitor
 
+import hardware.sensors.ld2410  # noqa: F401
 import hardware.sensors.ultrasonic  # noqa: F401
 import hardware.sensors.vl53l0x  # noqa: F401
 
 __all__ = [
     "DistanceSensor",
     "SensorFactory",
+    "SensorHealth",
+    "SensorMonitor",
 ]
@@ -2,39 +2,337 @@
 Base sensor protocol/interface.
 
 Defines the contract that all distance sensors must implement.
+
+Distances flow through the firmware as small-int millimetres, which
+MicroPython keeps off the heap; -1 marks an invalid sample. The cm
+methods (measure, read) are float views for external callers.
 """
-from abc import ABC, abstractmethod
+from abc import ABC
+from time import ticks_diff, ticks_ms
+
+
+def _to_cm(distance_mm: int) -> float:
+    """Convert a millimetre sample to the cm view (-1.0 if invalid)."""
+    return distance_mm / 10 if distance_mm >= 0 else -1.0
+
+
+class SensorHealth:
+    """Enum-like class for sensor health states."""
+
+    OK = "ok"
+    DEGRADED = "degraded"  # Recent failures, still measuring every call
+    FAILED = "failed"      # Backing off, recovery attempted on schedule
 
 
 class DistanceSensor(ABC):
     """
     Abstract base class for distance sensors.
 
-    All sensor implementations must inherit from this class
-    and implement the measure() method.
+    All sensor implementations must inherit from this class and
+    implement measure_mm(). Drivers written against the cm API may
+    implement measure() instead; measure_mm() then rounds its result.
+    A driver implementing neither raises TypeError when created.
 
     This ensures consistent interface across different sensor types,
     enabling the Factory pattern and dependency injection.
 
     Methods:
-        measure: Returns distance in centimeters or -1 on failure.
+        measure_mm: Returns distance in millimetres or -1 on failure.
+        measure: Same in centimeters (float view of measure_mm).
+        start: Starts a conversion without waiting (split-phase).
+        ready: True once the started conversion has a result.
+        collect: Returns the result (mm) of the started conversion.
+        read_mm: Cached measure_mm() for several consumers (sample-and-hold).
+        read: Same in centimeters.
+        recover: Attempts to bring a faulted sensor back online.
+        arm_wake: Optional hardware threshold interrupt for sleep wake.
+        power_down: Optional sensor power switch for idle periods.
+        streams: True if data arrives unprompted (no light sleep).
+        presence: Sensor's own presence decision (None if distance only).
         sensor_type: Returns string identifier for the sensor.
+        faulted: True if the last measurement failed due to a fault.
+        health: SensorHealth state derived from fault tracking.
     """
 
-    @abstractmethod
-    def measure(self) -> float:
+    _faulted: bool = False
+
+    # Sample-and-hold cache used by read()
+    max_age_ms: int = 0  # Default cache lifetime; 0 = always measure
+    _sample_mm: int = -1
+    _sample_ms: int = 0
+    _sample_valid: bool = False
+    _sampled: bool = False
+
+    # Result held by the default (blocking) start()
+    _result_mm: int = -1
+
+    def __new__(cls, *args, **kwargs):
+        """
+        Create a sensor, refusing drivers without a measurement method.
+
+        measure_mm() and measure() default to each other, so a driver
+        overriding neither would recurse on its first sample. Checked
+        here rather than in __init_subclass__, which MicroPython lacks.
+
+        Raises:
+            TypeError: If cls overrides neither measure_mm() nor measure().
+        """
+        if cls.measure_mm is DistanceSensor.measure_mm and cls.measure is DistanceSensor.measure:
+            raise TypeError(cls.__name__ + " must implement measure_mm() or measure()")
+        return object.__new__(cls)
+
+    def measure_mm(self) -> int:
         """
         Measure distance to nearest object.
 
         Returns:
-            Distance in centimeters.
-            Returns -1.0 if measurement failed or object out of range.
+            Distance in millimetres.
+            Returns -1 if measurement failed or object out of range.
 
         Note:
             Implementations should handle hardware errors gracefully
-            and return -1.0 rather than raising exceptions.
+            and return -1 rather than raising exceptions.
+            Hardware faults (bus errors, no response) should also
+            set the faulted flag; "nothing in range" is not a fault.
+            Default: rounds measure() for drivers written in cm.
+        """
+        distance = self.measure()
+        if distance < 0:
+            return -1
+        return int(distance * 10 + 0.5)
+
+    def measure(self) -> float:
+        """
+        Measure distance to nearest object in centimeters.
+
+        Returns:
+            Distance in centimeters, or -1.0 (see measure_mm()).
+        """
+        return _to_cm(self.measure_mm())
+
+    def start(self) -> bool:
+        """
+        Start one conversion and return without waiting for it.
+
+        Split-phase drivers override start(), ready(), collect() and
+        conversion_ms (and ready_poll_ms if it varies) so the caller
+        can sleep or do other work while the sensor converts. Default:
+        measures synchronously and holds the result for collect().
+
+        Returns:
+            True if a conversion was started.
+        """
+        self._result_mm = self.measure_mm()
+        return True
+
+    def ready(self) -> bool:
+        """Return True once the conversion started by start() is done."""
+        return True
+
+    def collect(self) -> float:
+        """
+        Return the result of the conversion started by start().
+
+        Waits for the conversion if it is not ready yet.
+
+        Returns:
+            Distance in millimetres, or -1 (see measure_mm()).
+        """
+        return self._result_mm
+
+    @property
+    def conversion_ms(self) -> int:
+        """Return expected time from start() to ready() (0 if start() blocks)."""
+        return 0
+
+    @property
+    def ready_poll_ms(self) -> int:
+        """
+        Return the nap length between ready() checks in read_mm().
+
+        Default: conversion_ms, one nap and no ready() check. Drivers
+        whose conversion time varies (echo timing) return less so a
+        short conversion is not waited out in full.
+        """
+        return self.conversion_ms
+
+    def read_mm(self, max_age_ms: int | None = None, wait=None) -> int:
+        """
+        Return the last sample if fresh enough, else measure.
+
+        Several consumers (presence, brightness, telemetry) can call
+        read() in the same period and share one hardware ranging.
+        The sample is stamped when its measurement started, so a
+        reader on a max_age_ms period gets a new sample each period.
+
+        Args:
+            max_age_ms: Oldest acceptable sample (default max_age_ms).
+            wait: Optional callable(ms) run while a split-phase sensor
+                converts (e.g. PowerManager.nap) instead of blocking in
+                measure_mm(); called in ready_poll_ms naps until ready()
+                or conversion_ms has passed.
+
+        Returns:
+            Distance in millimetres, or -1 (see measure_mm()).
+        """
+        if max_age_ms is None:
+            max_age_ms = self.max_age_ms
+        now = ticks_ms()
+        if self._sampled and ticks_diff(now, self._sample_ms) < max_age_ms:
+            return self._sample_mm
+
+        conversion_ms = self.conversion_ms
+        if wait is not None and conversion_ms:
+            if self.start():
+                nap_ms = self.ready_poll_ms
+                waited_ms = nap_ms
+                wait(nap_ms)
+                while waited_ms < conversion_ms and not self.ready():
+                    wait(nap_ms)
+                    waited_ms += nap_ms
+            distance = self.collect()
+        else:
+            distance = self.measure_mm()
+        self._sample_mm = distance
+        self._sample_ms = now
+        self._sample_valid = distance >= 0 and not self.faulted
+        self._sampled = True
+        return distance
+
+    def read(self, max_age_ms: int | None = None, wait=None) -> float:
+        """
+        Return read_mm() in centimeters.
+
+        Returns:
+            Distance in centimeters, or -1.0 (see measure()).
+        """
+        return _to_cm(self.read_mm(max_age_ms, wait))
+
+    def invalidate(self) -> None:
+        """Drop the cached sample so the next read_mm() measures."""
+        self._sampled = False
+
+    @property
+    def sample_timestamp(self) -> int:
+        """Return ticks_ms at which the cached sample was taken."""
+        return self._sample_ms
+
+    @property
+    def sample_valid(self) -> bool:
+        """Return True if the cached sample is an in-range, fault-free reading."""
+        return self._sampled and self._sample_valid
+
+    def recover(self) -> bool:
+        """
+        Attempt to recover from a hardware fault.
+
+        Default implementation does nothing. Drivers with
+        recoverable buses should override this.
+
+        Returns:
+            True if the sensor is believed to be operational.
+        """
+        self._faulted = False
+        return True
+
+    def arm_wake(self, threshold_cm: float):
+        """
+        Arm a hardware interrupt for when range drops below threshold.
+
+        Sensors that can range autonomously override this so the MCU
+        can sleep until someone approaches. Default: unsupported.
+
+        Args:
+            threshold_cm: Distance that should wake the MCU.
+
+        Returns:
+            machine.Pin that goes low on wake, or None if unsupported.
+        """
+
+    def disarm_wake(self) -> None:
+        """Return to normal measure() operation after arm_wake()."""
+
+    def power_down(self) -> bool:
+        """
+        Switch the sensor off (XSHUT, supply switch) to save power.
+
+        Drivers with a power pin override this. The sensor powers up
+        again on power_up() or, lazily, on the next measure_mm().
+        Default: unsupported.
+
+        Returns:
+            True if the sensor was switched off.
+        """
+        return False
+
+    def power_up(self) -> bool:
+        """
+        Restore power after power_down() and re-initialize.
+
+        Blocks for power_up_ms.
+
+        Returns:
+            True if the sensor is ready to measure.
+        """
+        return True
+
+    @property
+    def power_up_ms(self) -> int:
+        """Return time power_up() takes (0 if power is not switchable)."""
+        return 0
+
+    @property
+    def streams(self) -> bool:
+        """
+        Return True if the sensor sends data unprompted (UART stream).
+
+        Light sleep stops the UART, so frames arriving while the CPU
+        sleeps are lost; the app keeps such sensors' loop awake.
+        """
+        return False
+
+    @property
+    def presence(self):
+        """
+        Return the sensor's own presence decision for the last sample.
+
+        Presence sensors (radar) override this; the app then uses it
+        instead of comparing the distance against its range. They
+        return -1 from measure_mm() exactly when presence is False,
+        so buffered samples carry the decision too.
+
+        Returns:
+            True/False, or None if the sensor only measures distance.
+        """
+        return None
+
+    @property
+    def faulted(self) -> bool:
+        """Return True if the last measurement hit a hardware fault."""
+        return self._faulted
+
+    @property
+    def calibration(self):
+        """
+        Return state worth caching across warm boots.
+
+        Drivers that detect or calibrate at init override this and
+        accept the value back as a calibration constructor argument.
+
+        Returns:
+            JSON-serializable dict, or None if nothing to cache.
+        """
+        return None
+
+    @property
+    def health(self) -> str:
+        """
+        Return sensor health state.
+
+        Plain drivers only know about the last measurement;
+        SensorMonitor overrides this with backoff tracking.
         """
-        pass
+        return SensorHealth.DEGRADED if self._faulted else SensorHealth.OK
 
     @property
     def sensor_type(self) -> str:
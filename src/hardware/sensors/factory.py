@@ -23,8 +23,8 @@ class SensorFactory:
             def __init__(self, pin: int):
                 self._pin = pin
 
-            def measure(self) -> float:
-                return 42.0
+            def measure_mm(self) -> int:
+                return 420
 
         # Create sensor instance
         sensor = SensorFactory.create("my_sensor", pin=5)
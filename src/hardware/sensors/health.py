@@ -0,0 +1,205 @@
+"""
+Sensor health monitoring with fault backoff.
+
+Wraps any DistanceSensor so a hung or disconnected sensor costs
+microseconds per loop instead of a full ranging timeout.
+"""
+from time import ticks_add, ticks_diff, ticks_ms
+
+from hardware.sensors.base import DistanceSensor, SensorHealth
+
+
+class SensorMonitor(DistanceSensor):
+    """
+    DistanceSensor decorator that tracks consecutive faults.
+
+    After failure_threshold consecutive faults the sensor is marked
+    FAILED and measure_mm() returns -1 immediately until the backoff
+    expires. Each expiry runs one recover() attempt followed by a
+    measurement; the backoff doubles on every failed attempt up to
+    backoff_max_ms and resets on the first good reading.
+
+    State diagram:
+        OK → (fault) → DEGRADED → (threshold) → FAILED
+        FAILED → (backoff expired, recovered) → OK
+    """
+
+    def __init__(
+        self,
+        sensor: DistanceSensor,
+        failure_threshold: int = 3,
+        backoff_min_ms: int = 500,
+        backoff_max_ms: int = 30000,
+    ) -> None:
+        """
+        Initialize sensor monitor.
+
+        Args:
+            sensor: Sensor to supervise.
+            failure_threshold: Consecutive faults before backing off.
+            backoff_min_ms: First retry delay once FAILED.
+            backoff_max_ms: Upper bound for retry delay.
+        """
+        self._sensor = sensor
+        self._failure_threshold = failure_threshold
+        self._backoff_min_ms = backoff_min_ms
+        self._backoff_max_ms = backoff_max_ms
+
+        self._health = SensorHealth.OK
+        self._failures = 0
+        self._backoff_ms = backoff_min_ms
+        self._retry_at = 0
+        self._recoveries = 0
+        self._started = False
+
+    @property
+    def health(self) -> str:
+        """Return current health state."""
+        return self._health
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Return number of consecutive faulted measurements."""
+        return self._failures
+
+    @property
+    def recoveries(self) -> int:
+        """Return number of recovery attempts made."""
+        return self._recoveries
+
+    @property
+    def sensor_type(self) -> str:
+        """Return wrapped sensor type identifier."""
+        return self._sensor.sensor_type
+
+    @property
+    def calibration(self):
+        """Return wrapped sensor calibration."""
+        return self._sensor.calibration
+
+    @property
+    def presence(self):
+        """Return wrapped sensor presence decision."""
+        return self._sensor.presence
+
+    @property
+    def faulted(self) -> bool:
+        """Return True if the wrapped sensor is faulted."""
+        return self._health != SensorHealth.OK
+
+    def measure_mm(self) -> int:
+        """
+        Measure distance unless backing off.
+
+        Returns:
+            Distance in millimetres, or -1 on failure or while
+            waiting for the next recovery attempt.
+        """
+        if not self._may_measure():
+            return -1
+        return self._track(self._sensor.measure_mm())
+
+    def start(self) -> bool:
+        """
+        Start a conversion on the wrapped sensor unless backing off.
+
+        A start that fails (bus error) counts as a faulted measurement.
+        """
+        self._started = False
+        if not self._may_measure():
+            return False
+        self._started = self._sensor.start()
+        if not self._started:
+            self._fault()
+        return self._started
+
+    def ready(self) -> bool:
+        """Return True once the wrapped sensor's conversion is done."""
+        return not self._started or self._sensor.ready()
+
+    def collect(self) -> int:
+        """Return the wrapped sensor's result, or -1 if none was started."""
+        if not self._started:
+            return -1
+        self._started = False
+        return self._track(self._sensor.collect())
+
+    @property
+    def conversion_ms(self) -> int:
+        """Return wrapped sensor conversion time."""
+        return self._sensor.conversion_ms
+
+    @property
+    def ready_poll_ms(self) -> int:
+        """Return wrapped sensor ready() check interval."""
+        return self._sensor.ready_poll_ms
+
+    def recover(self) -> bool:
+        """Force an immediate recovery attempt on the wrapped sensor."""
+        return self._sensor.recover()
+
+    def arm_wake(self, threshold_cm: float):
+        """Arm wrapped sensor's wake interrupt (only while healthy)."""
+        if self._health != SensorHealth.OK:
+            return None
+        return self._sensor.arm_wake(threshold_cm)
+
+    def disarm_wake(self) -> None:
+        """Disarm wrapped sensor's wake interrupt."""
+        self._sensor.disarm_wake()
+
+    def power_down(self) -> bool:
+        """Switch wrapped sensor off."""
+        return self._sensor.power_down()
+
+    def power_up(self) -> bool:
+        """Switch wrapped sensor back on."""
+        return self._sensor.power_up()
+
+    @property
+    def power_up_ms(self) -> int:
+        """Return wrapped sensor power-up time."""
+        return self._sensor.power_up_ms
+
+    @property
+    def streams(self) -> bool:
+        """Return True if the wrapped sensor sends data unprompted."""
+        return self._sensor.streams
+
+    def _may_measure(self) -> bool:
+        """Return False while backing off or after a failed recovery."""
+        if self._health != SensorHealth.FAILED:
+            return True
+        now = ticks_ms()
+        if ticks_diff(now, self._retry_at) < 0:
+            return False
+        self._recoveries += 1
+        if not self._sensor.recover():
+            self._backoff(now)
+            return False
+        return True
+
+    def _track(self, distance: int) -> int:
+        """Update health from the wrapped sensor's fault flag."""
+        if self._sensor.faulted:
+            self._fault()
+        else:
+            self._failures = 0
+            self._backoff_ms = self._backoff_min_ms
+            self._health = SensorHealth.OK
+        return distance
+
+    def _fault(self) -> None:
+        """Count one faulted measurement; back off at the threshold."""
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._backoff(ticks_ms())
+        else:
+            self._health = SensorHealth.DEGRADED
+
+    def _backoff(self, now: int) -> None:
+        """Enter FAILED and schedule next retry with exponential delay."""
+        if self._health == SensorHealth.FAILED:
+            self._backoff_ms = min(self._backoff_ms * 2, self._backoff_max_ms)
+        self._health = SensorHealth.FAILED
+        self._retry_at = ticks_add(now, self._backoff_ms)
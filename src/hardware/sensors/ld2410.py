@@ -0,0 +1,311 @@
+"""
+LD2410 mmWave radar presence sensor driver.
+
+24GHz FMCW radar that reports moving and stationary (breathing)
+targets over a wide cone, so it keeps seeing someone who stands
+still off-axis where ToF and ultrasonic sensors lose them.
+
+Pinout:
+    VCC -> 5V
+    GND -> GND
+    TX  -> GPIO (UART RX of the MCU)
+    RX  -> GPIO (UART TX of the MCU)
+
+The module streams report frames at 256000 baud (about 10 per second):
+
+    F4 F3 F2 F1  length (u16 LE)  data  F8 F7 F6 F5
+
+    data: type (0x02 basic, 0x01 engineering), 0xAA, target state,
+          moving distance (u16 cm), moving energy, stationary
+          distance (u16 cm), stationary energy, detection distance
+          (u16 cm), [engineering gate energies], 0x55, 0x00
+
+Range: 0.75m - 6m in 0.75m gates (default configuration)
+"""
+from time import ticks_diff, ticks_ms
+
+from machine import UART
+
+from hardware.sensors.base import DistanceSensor
+from hardware.sensors.factory import SensorFactory
+
+
+class TargetState:
+    """Enum-like class for LD2410 target state bits."""
+
+    NONE = 0
+    MOVING = 1
+    STILL = 2
+    BOTH = 3
+
+
+class LD2410Parser:
+    """
+    Incremental parser for the LD2410 report stream.
+
+    Bytes are received straight into a preallocated buffer through
+    memoryview windows (space()/commit()), the buffer is scanned for
+    frame headers, and the newest report is decoded into attributes.
+    Partial frames are kept for the next commit(); garbage, command
+    ACK frames and corrupted frames are skipped. Nothing is allocated
+    per frame.
+
+    Attributes:
+        state: TargetState bits of the newest report.
+        moving_cm: Moving target distance.
+        moving_energy: Moving target energy (0-100).
+        still_cm: Stationary target distance.
+        still_energy: Stationary target energy (0-100).
+        detect_cm: Detection distance.
+        frames: Reports decoded.
+        errors: Corrupted or unexpected frames skipped.
+    """
+
+    MIN_LENGTH = 13  # Basic report data length
+
+    def __init__(self, capacity: int = 96) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            capacity: Receive buffer size; must hold the longest frame
+                (engineering reports are 45 bytes).
+        """
+        self._size = capacity
+        self._buf = bytearray(capacity)
+        view = memoryview(self._buf)
+        # One window per fill level: receiving never slices (allocates)
+        self._windows = tuple(view[i:] for i in range(capacity))
+        self._fill = 0
+        self.state = TargetState.NONE
+        self.moving_cm = 0
+        self.moving_energy = 0
+        self.still_cm = 0
+        self.still_energy = 0
+        self.detect_cm = 0
+        self.frames = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        """Return number of buffered bytes not parsed yet."""
+        return self._fill
+
+    def space(self) -> memoryview:
+        """Return the free part of the buffer (e.g. for UART.readinto)."""
+        return self._windows[self._fill]
+
+    def commit(self, count: int) -> int:
+        """
+        Parse count bytes just written into space().
+
+        Returns:
+            Number of reports decoded.
+        """
+        self._fill += count
+        buf = self._buf
+        fill = self._fill
+        pos = 0
+        decoded = 0
+        while True:
+            start = self._find_header(pos, fill)
+            if start < 0:
+                pos = max(pos, fill - 3)  # May hold the start of a header
+                break
+            if fill - start < 6:
+                pos = start
+                break
+            length = buf[start + 4] | buf[start + 5] << 8
+            end = start + 10 + length
+            if length < self.MIN_LENGTH or end > self._size:
+                self.errors += 1
+                pos = start + 1
+                continue
+            if end > fill:
+                pos = start
+                break
+            if self._decode(start + 6, length):
+                decoded += 1
+                pos = end
+            else:
+                self.errors += 1
+                pos = start + 1
+        self._shift(pos)
+        return decoded
+
+    def feed(self, data) -> int:
+        """
+        Parse a chunk of captured bytes (tests, recorded streams).
+
+        Copies through space()/commit(), so it allocates; drivers
+        receive into space() directly.
+
+        Returns:
+            Number of reports decoded.
+        """
+        decoded = 0
+        offset = 0
+        while offset < len(data):
+            space = self.space()
+            count = min(len(space), len(data) - offset)
+            space[:count] = data[offset:offset + count]
+            decoded += self.commit(count)
+            offset += count
+        return decoded
+
+    def _find_header(self, pos: int, fill: int) -> int:
+        """Return index of the next frame header, or -1."""
+        buf = self._buf
+        for i in range(pos, fill - 3):
+            if buf[i] == 0xF4 and buf[i + 1] == 0xF3 and buf[i + 2] == 0xF2 and buf[i + 3] == 0xF1:
+                return i
+        return -1
+
+    def _decode(self, data: int, length: int) -> bool:
+        """Check a complete frame and decode its report fields."""
+        buf = self._buf
+        end = data + length
+        if not (buf[end] == 0xF8 and buf[end + 1] == 0xF7
+                and buf[end + 2] == 0xF6 and buf[end + 3] == 0xF5):
+            return False
+        if buf[data] not in (0x01, 0x02) or buf[data + 1] != 0xAA or buf[end - 2] != 0x55:
+            return False
+        self.state = buf[data + 2] & TargetState.BOTH
+        self.moving_cm = buf[data + 3] | buf[data + 4] << 8
+        self.moving_energy = buf[data + 5]
+        self.still_cm = buf[data + 6] | buf[data + 7] << 8
+        self.still_energy = buf[data + 8]
+        self.detect_cm = buf[data + 9] | buf[data + 10] << 8
+        self.frames += 1
+        return True
+
+    def _shift(self, pos: int) -> None:
+        """Drop parsed bytes, moving the unparsed rest to the front."""
+        buf = self._buf
+        remaining = self._fill - pos
+        for i in range(remaining):
+            buf[i] = buf[pos + i]
+        self._fill = remaining
+
+
+@SensorFactory.register("ld2410")
+class LD2410Sensor(DistanceSensor):
+    """
+    Driver for the LD2410 mmWave radar presence sensor.
+
+    measure_mm() drains the UART into the parser and returns the
+    nearest target of the newest report. The radar's own presence
+    decision is available through the presence property; it also
+    covers still people whose distance the mirror's ToF range would
+    reject. No report within stale_ms (unplugged, wrong baud rate)
+    is a fault.
+
+    The module streams whether or not it is asked, and the UART stops
+    in light sleep: a light-sleeping app loses frames and goes stale.
+    streams is True so the app polls with plain sleeps instead.
+
+    Attributes:
+        parser: LD2410Parser holding the newest report.
+    """
+
+    BAUDRATE = 256000
+
+    def __init__(
+        self,
+        tx_pin: int,
+        rx_pin: int,
+        uart_id: int = 1,
+        baudrate: int | None = None,
+        range_cm: float | None = None,
+        stale_ms: int = 1000,
+    ) -> None:
+        """
+        Initialize radar.
+
+        Args:
+            tx_pin: GPIO of the MCU's UART TX (radar RX).
+            rx_pin: GPIO of the MCU's UART RX (radar TX).
+            uart_id: Hardware UART number.
+            baudrate: Serial rate (default 256000, the module default).
+            range_cm: Ignore targets beyond this (default: any).
+            stale_ms: Report age after which the sensor is faulted.
+        """
+        self._uart = UART(
+            uart_id,
+            baudrate=baudrate or self.BAUDRATE,
+            tx=tx_pin,
+            rx=rx_pin,
+            rxbuf=256,
+        )
+        self.parser = LD2410Parser()
+        self._range_mm = -1 if range_cm is None else round(range_cm * 10)
+        self._stale_ms = stale_ms
+        self._report_ms = ticks_ms()
+        self._present = False
+
+    def measure_mm(self) -> int:
+        """
+        Return the nearest target of the newest report.
+
+        Returns:
+            Distance in millimetres, or -1 if no target is in range
+            or no report arrived within stale_ms (faulted).
+        """
+        now = ticks_ms()
+        if self._receive():
+            self._report_ms = now
+        self._faulted = ticks_diff(now, self._report_ms) >= self._stale_ms
+        distance = -1 if self._faulted else self._target_mm()
+        self._present = distance >= 0
+        return distance
+
+    @property
+    def presence(self) -> bool:
+        """Return the radar's presence decision from the last measure_mm()."""
+        return self._present
+
+    @property
+    def streams(self) -> bool:
+        """Return True: reports arrive whether or not the app is awake."""
+        return True
+
+    def recover(self) -> bool:
+        """
+        Check whether reports are arriving again.
+
+        Returns:
+            True if a report was received since the last measurement.
+        """
+        if not self._receive():
+            return False
+        self._report_ms = ticks_ms()
+        self._faulted = False
+        return True
+
+    def _receive(self) -> int:
+        """Move received bytes into the parser; return reports decoded."""
+        uart = self._uart
+        parser = self.parser
+        decoded = 0
+        while uart.any():
+            count = uart.readinto(parser.space())
+            if not count:
+                break
+            decoded += parser.commit(count)
+        return decoded
+
+    def _target_mm(self) -> int:
+        """Return nearest reported target within range, or -1."""
+        parser = self.parser
+        state = parser.state
+        if state == TargetState.BOTH:
+            distance = min(parser.moving_cm, parser.still_cm)
+        elif state == TargetState.MOVING:
+            distance = parser.moving_cm
+        elif state == TargetState.STILL:
+            distance = parser.still_cm
+        else:
+            return -1
+        distance *= 10
+        if 0 <= self._range_mm < distance:
+            return -1
+        return distance
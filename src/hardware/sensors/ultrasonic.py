@@ -11,15 +11,35 @@ Pinout:
     GND  -> GND
     TRIG -> GPIO (output from MCU)
     ECHO -> GPIO (input to MCU)
+    Optional: supply switch (MOSFET / load switch enable) on a GPIO
 
 Range: 2cm - 400cm (sensor dependent)
 """
+from time import sleep_ms, sleep_us, ticks_diff, ticks_us
+
 from machine import Pin, time_pulse_us
-from time import sleep_us
 
 from hardware.sensors.base import DistanceSensor
 from hardware.sensors.factory import SensorFactory
 
+# Fixed-point shift of the echo scale (mm per microsecond << 16)
+_SCALE_SHIFT = 16
+
+
+def _echo_scale(sound_divisor: float) -> int:
+    """Return the integer echo scale for a sound divisor (us per cm)."""
+    return round((10 << _SCALE_SHIFT) / (2 * sound_divisor))
+
+
+# emit: native
+def _echo_mm(duration_us: int, scale: int) -> int:
+    """
+    Convert a round-trip echo duration to distance in mm.
+
+    Integer-only: for echoes up to ~60ms the product stays a small int.
+    """
+    return (duration_us * scale + (1 << (_SCALE_SHIFT - 1))) >> _SCALE_SHIFT
+
 
 @SensorFactory.register("ultrasonic")
 class UltrasonicSensor(DistanceSensor):
@@ -29,11 +49,21 @@ class UltrasonicSensor(DistanceSensor):
     Uses trigger pulse and echo timing to calculate distance
     based on speed of sound.
 
+    With a power pin switching the module's supply (high = on) the
+    sensor can be powered down between samples; the module needs
+    power_up_ms to settle before its first ping.
+
+    measure_mm() times the echo with time_pulse_us, blocking for up to
+    timeout_us. start() instead sends the trigger and timestamps the
+    echo edges from a hard pin interrupt, so collect() only does the
+    math; read_mm() naps in ready_poll_ms steps until the echo ends.
+
     Attributes:
         _trigger: Output pin for trigger pulse.
         _echo: Input pin for echo signal.
+        _power: Supply switch pin, or None if always powered.
         _timeout_us: Maximum wait time for echo.
-        _sound_divisor: Factor for distance calculation.
+        _echo_scale: Echo duration to mm factor (fixed point).
     """
 
     SPEED_OF_SOUND_DIVISOR = 29.1  # microseconds per cm (round trip / 2)
@@ -43,7 +73,9 @@ class UltrasonicSensor(DistanceSensor):
         trigger_pin: int,
         echo_pin: int,
         timeout_us: int = 30000,
-        sound_divisor: float = None,
+        sound_divisor: float | None = None,
+        power_pin: int | None = None,
+        power_up_ms: int = 50,
     ) -> None:
         """
         Initialize ultrasonic sensor.
@@ -53,29 +85,136 @@ class UltrasonicSensor(DistanceSensor):
             echo_pin: GPIO number for echo input.
             timeout_us: Echo timeout in microseconds (default 30ms = ~5m).
             sound_divisor: Custom divisor for distance calc (default 29.1).
+            power_pin: GPIO enabling the module supply (optional).
+            power_up_ms: Settling time after switching the supply on.
         """
         self._trigger = Pin(trigger_pin, Pin.OUT)
         self._echo = Pin(echo_pin, Pin.IN)
         self._timeout_us = timeout_us
-        self._sound_divisor = sound_divisor or self.SPEED_OF_SOUND_DIVISOR
+        self._echo_scale = _echo_scale(sound_divisor or self.SPEED_OF_SOUND_DIVISOR)
         self._trigger.off()
-
-    def measure(self) -> float:
+        self._started = False
+        self._started_us = 0
+        self._rise_us = -1
+        self._fall_us = -1
+        self._echo_handler = self._on_echo  # Cached: no allocation in IRQ setup
+        self._power = None
+        self._powered = True
+        self._power_up_ms = power_up_ms
+        if power_pin is not None:
+            self._power = Pin(power_pin, Pin.OUT, value=1)
+            sleep_ms(power_up_ms)
+
+    def measure_mm(self) -> int:
         """
         Measure distance to nearest object.
 
         Sends 10us trigger pulse and measures echo duration.
 
         Returns:
-            Distance in centimeters, or -1.0 on timeout/error.
+            Distance in millimetres, or -1 on timeout/error.
         """
+        if not self._powered:
+            self.power_up()
         self._send_trigger_pulse()
         duration = time_pulse_us(self._echo, 1, self._timeout_us)
 
         if duration < 0:
-            return -1.0
+            return -1
+
+        return _echo_mm(duration, self._echo_scale)
+
+    def start(self) -> bool:
+        """
+        Send the trigger pulse and time the echo from pin interrupts.
+
+        Returns:
+            True (the echo is collected by collect()).
+        """
+        if not self._powered:
+            self.power_up()
+        self._rise_us = -1
+        self._fall_us = -1
+        # Hard IRQ: a soft one runs later and could miss a short echo
+        self._echo.irq(self._echo_handler, Pin.IRQ_RISING | Pin.IRQ_FALLING, hard=True)
+        self._send_trigger_pulse()
+        self._started_us = ticks_us()
+        self._started = True
+        return True
+
+    def ready(self) -> bool:
+        """Return True once the echo ended or timed out."""
+        if not self._started or self._fall_us >= 0:
+            return True
+        return ticks_diff(ticks_us(), self._started_us) >= self._timeout_us
+
+    def collect(self) -> int:
+        """
+        Wait for the echo if needed and convert it.
+
+        Returns:
+            Distance in millimetres, or -1 on timeout or if no
+            measurement was started.
+        """
+        if not self._started:
+            return -1
+        while not self.ready():
+            sleep_ms(1)
+        self._started = False
+        self._echo.irq(None)
+        if self._rise_us < 0 or self._fall_us < 0:
+            return -1
+        return _echo_mm(ticks_diff(self._fall_us, self._rise_us), self._echo_scale)
+
+    @property
+    def conversion_ms(self) -> int:
+        """Return the echo timeout: the longest a ping can take."""
+        return (self._timeout_us + 999) // 1000
+
+    @property
+    def ready_poll_ms(self) -> int:
+        """Return 1: echoes end anywhere within the timeout."""
+        return 1
+
+    def _on_echo(self, pin) -> None:
+        """
+        Echo pin IRQ: stamp the rising and falling edge.
+
+        Runs as a hard IRQ, so it must not allocate. The edges come in
+        order after the trigger (the echo idles low), so the first is
+        the rise; pin.value() may already show the next level.
+        """
+        now = ticks_us()
+        if self._rise_us < 0:
+            self._rise_us = now
+        elif self._fall_us < 0:
+            self._fall_us = now
 
-        return (duration / 2) / self._sound_divisor
+    def power_down(self) -> bool:
+        """
+        Switch the module supply off.
+
+        Returns:
+            True if switched off, False without a power pin.
+        """
+        if self._power is None:
+            return False
+        self._power.off()
+        self._powered = False
+        return True
+
+    def power_up(self) -> bool:
+        """Switch the module supply on and wait for it to settle."""
+        if not self._powered:
+            self._power.on()
+            sleep_ms(self._power_up_ms)
+            self._powered = True
+        return True
+
+    @property
+    def power_up_ms(self) -> int:
+        """Return settling time, or 0 without a power pin."""
+        return 0 if self._power is None else self._power_up_ms
 
     def _send_trigger_pulse(self) -> None:
         """Send 10 microsecond trigger pulse."""
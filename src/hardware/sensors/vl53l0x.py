@@ -15,14 +15,35 @@ Pinout:
     GND -> GND
     SDA -> I2C SDA (with pullup)
     SCL -> I2C SCL (with pullup)
+    GPIO1 -> Optional interrupt pin (threshold wake, open-drain)
+    XSHUT -> Optional GPIO (shutdown, active low) for power gating
 """
-from machine import Pin, I2C
-from time import sleep_ms
+import struct
+from time import sleep_ms, sleep_us
+
+from machine import I2C, Pin
 
 from hardware.sensors.base import DistanceSensor
 from hardware.sensors.factory import SensorFactory
 
 
+def ptr8(buf):
+    """
+    Bytecode stand-in for the viper ptr8() cast.
+
+    Viper code compiles ptr8() to a raw byte pointer; without the viper
+    emitter (CPython, --emit bytecode) indexing the buffer is the same.
+    """
+    return buf
+
+
+# emit: viper
+def _result_mm(buf) -> int:
+    """Return the big-endian range field (mm) of a result block."""
+    data = ptr8(buf)
+    return (data[10] << 8) | data[11]
+
+
 @SensorFactory.register("vl53l0x")
 class VL53L0XSensor(DistanceSensor):
     """
@@ -31,9 +52,29 @@ class VL53L0XSensor(DistanceSensor):
     Uses I2C communication with the sensor's onboard
     microcontroller for distance measurement.
 
+    With an interrupt pin wired to GPIO1, arm_wake() switches the
+    sensor to autonomous timed ranging and raises GPIO1 (active low)
+    only when the range drops below a threshold, so the MCU can
+    sleep instead of polling an empty room.
+
+    Passing a calibration (see calibration property) from a warm boot
+    skips detection and the init sequence entirely: the sensor kept
+    its configuration across an MCU-only reset.
+
+    With an XSHUT pin the driver starts the sensor from shutdown, moves
+    it to its address (so several sensors can share a bus) and can
+    power it down between samples. Power-up skips detection and only
+    re-runs the register sequence, so it takes about 3ms.
+
+    start() only triggers a single-shot ranging; the caller can sleep
+    for conversion_ms and then collect() the result instead of the
+    driver polling the status register for the whole ranging.
+
     Attributes:
         _i2c: I2C bus instance.
         _address: I2C address of sensor.
+        _poll_count: Status polls before a ranging timeout.
+        _int_pin: Interrupt input pin, or None if not wired.
     """
 
     DEFAULT_ADDRESS = 0x29
@@ -41,16 +82,43 @@ class VL53L0XSensor(DistanceSensor):
 
     # Register addresses
     _REG_SYSRANGE_START = 0x00
+    _REG_SYSTEM_INTERMEASUREMENT_PERIOD = 0x04
+    _REG_SYSTEM_INTERRUPT_CONFIG_GPIO = 0x0A
+    _REG_SYSTEM_INTERRUPT_CLEAR = 0x0B
+    _REG_SYSTEM_THRESH_HIGH = 0x0C
+    _REG_SYSTEM_THRESH_LOW = 0x0E
     _REG_RESULT_INTERRUPT_STATUS = 0x13
     _REG_RESULT_RANGE_STATUS = 0x14
+    _REG_GPIO_HV_MUX_ACTIVE_HIGH = 0x84
+    _REG_I2C_SLAVE_DEVICE_ADDRESS = 0x8A
     _REG_MODEL_ID = 0xC0
+    _REG_OSC_CALIBRATE_VAL = 0xF8
+
+    # SYSRANGE_START modes
+    _MODE_SINGLESHOT = 0x01
+    _MODE_TIMED = 0x04
+
+    # SYSTEM_INTERRUPT_CONFIG_GPIO functions
+    _GPIO_LEVEL_LOW = 0x01      # Range below THRESH_LOW
+    _GPIO_NEW_SAMPLE = 0x04     # Every completed ranging
+
+    _POLL_INTERVAL_MS = 5
+    _CONVERSION_MS = 33  # Single-shot ranging with the default timing budget
+    _BOOT_MS = 2  # XSHUT high to I2C ready (tBOOT, 1.2ms max)
+    _BUS_RECOVERY_CLOCKS = 9
+    _I2C_FREQ = 400000
 
     def __init__(
         self,
         sda_pin: int,
         scl_pin: int,
         i2c_id: int = 0,
-        address: int = None,
+        address: int | None = None,
+        timeout_ms: int = 500,
+        int_pin: int | None = None,
+        wake_period_ms: int = 100,
+        calibration: dict | None = None,
+        xshut_pin: int | None = None,
     ) -> None:
         """
         Initialize VL53L0X sensor.
@@ -60,22 +128,73 @@ class VL53L0XSensor(DistanceSensor):
             scl_pin: GPIO number for I2C SCL.
             i2c_id: I2C bus ID (0 or 1, default 0).
             address: I2C address (default 0x29).
+            timeout_ms: Ranging timeout before reporting a fault.
+            int_pin: GPIO number wired to sensor GPIO1 (optional).
+            wake_period_ms: Autonomous ranging interval while armed.
+            calibration: Cached calibration from a previous boot.
+            xshut_pin: GPIO number wired to XSHUT (optional).
         """
         self._address = address or self.DEFAULT_ADDRESS
-        self._i2c = I2C(
-            i2c_id,
-            sda=Pin(sda_pin),
-            scl=Pin(scl_pin),
-            freq=400000
+        self._sda_pin = sda_pin
+        self._scl_pin = scl_pin
+        self._i2c_id = i2c_id
+        self._poll_count = max(1, timeout_ms // self._POLL_INTERVAL_MS)
+        # Preallocated I/O buffers: register access must not allocate
+        self._reg_buf = bytearray(1)
+        self._result_buf = bytearray(12)
+        self._int_pin = None
+        if int_pin is not None:
+            self._int_pin = Pin(int_pin, Pin.IN, Pin.PULL_UP)
+        self._wake_period_ms = wake_period_ms
+        self._armed = False
+        self._started = False
+        self._model_id = 0
+        self._osc_calibrate = 0
+        self._xshut = None
+        self._powered = True
+        self._i2c = self._create_bus()
+        if calibration:
+            self._model_id = calibration.get("model", self.MODEL_ID)
+            self._osc_calibrate = calibration.get("osc", 0)
+        if xshut_pin is not None:
+            # Start from shutdown so the sensor boots at the default address
+            self._xshut = Pin(xshut_pin, Pin.OUT, value=0)
+            self._powered = False
+            sleep_ms(1)
+            self.power_up()
+            return
+        if calibration:
+            return
+        try:
+            self._init_sensor()
+        except OSError:
+            self._faulted = True
+
+    def _create_bus(self) -> I2C:
+        """Create I2C bus instance on configured pins."""
+        return I2C(
+            self._i2c_id,
+            sda=Pin(self._sda_pin),
+            scl=Pin(self._scl_pin),
+            freq=self._I2C_FREQ
         )
-        self._init_sensor()
+
+    @property
+    def calibration(self):
+        """Return detected model ID and oscillator calibration, or None."""
+        if self._faulted or not self._model_id:
+            return None
+        return {"model": self._model_id, "osc": self._osc_calibrate}
 
     def _init_sensor(self) -> None:
-        """Initialize sensor with default configuration."""
-        model_id = self._read_reg(self._REG_MODEL_ID)
-        if model_id != self.MODEL_ID:
-            print(f"Warning: VL53L0X model ID {model_id:#x}, expected {self.MODEL_ID:#x}")
+        """Detect the sensor, then configure it."""
+        # An unexpected ID is reported by the app through calibration
+        self._model_id = self._read_reg(self._REG_MODEL_ID)
+        self._osc_calibrate = self._read_reg16(self._REG_OSC_CALIBRATE_VAL)
+        self._configure()
 
+    def _configure(self) -> None:
+        """Write the register setup lost on power-down."""
         # Standard initialization sequence
         self._write_reg(0x88, 0x00)
         self._write_reg(0x80, 0x01)
@@ -85,48 +204,305 @@ class VL53L0XSensor(DistanceSensor):
         self._write_reg(0xFF, 0x00)
         self._write_reg(0x80, 0x00)
 
-    def measure(self) -> float:
+    def measure_mm(self) -> int:
         """
         Measure distance to nearest object.
 
         Triggers single measurement and waits for result.
+        Bus errors and ranging timeouts set the faulted flag.
+
+        Returns:
+            Distance in millimetres, or -1 on timeout/error.
+        """
+        if not self._powered and not self.power_up():
+            return -1
+        try:
+            distance_mm = self._range_mm()
+        except OSError:
+            distance_mm = -1
+        return self._checked_mm(distance_mm)
+
+    def start(self) -> bool:
+        """
+        Start a single-shot ranging and return immediately.
 
         Returns:
-            Distance in centimeters, or -1.0 on timeout/error.
+            True if started; False on bus error (faulted is set).
+        """
+        self._started = False
+        if not self._powered and not self.power_up():
+            return False
+        try:
+            self._write_reg(self._REG_SYSRANGE_START, self._MODE_SINGLESHOT)
+        except OSError:
+            self._faulted = True
+            return False
+        self._started = True
+        return True
+
+    def ready(self) -> bool:
+        """Return True once the started ranging has a result (or failed)."""
+        if not self._started:
+            return True
+        try:
+            return bool(self._read_reg(self._REG_RESULT_INTERRUPT_STATUS) & 0x07)
+        except OSError:
+            return True  # collect() reports the fault
+
+    def collect(self) -> int:
+        """
+        Return the started ranging's result, polling if not ready yet.
+
+        Returns:
+            Distance in millimetres, or -1 on timeout/error or if
+            no ranging was started.
+        """
+        if not self._started:
+            return -1
+        self._started = False
+        try:
+            if self._read_reg(self._REG_RESULT_INTERRUPT_STATUS) & 0x07 or self._wait_ready():
+                distance_mm = self._read_result_mm()
+            else:
+                distance_mm = -1
+        except OSError:
+            distance_mm = -1
+        return self._checked_mm(distance_mm)
+
+    @property
+    def conversion_ms(self) -> int:
+        """Return single-shot ranging time (default timing budget)."""
+        return self._CONVERSION_MS
+
+    def _checked_mm(self, distance_mm: int) -> int:
+        """Set the faulted flag and map out-of-range readings to -1."""
+        self._faulted = distance_mm < 0
+        if self._faulted:
+            return -1
+
+        # Check for out of range
+        if distance_mm >= 8190:
+            return -1
+
+        return distance_mm
+
+    def _range_mm(self) -> int:
+        """
+        Run one ranging cycle.
+
+        Returns:
+            Raw distance in millimeters, or -1 on ranging timeout.
+
+        Raises:
+            OSError: On I2C bus error.
         """
         # Start measurement
-        self._write_reg(self._REG_SYSRANGE_START, 0x01)
+        self._write_reg(self._REG_SYSRANGE_START, self._MODE_SINGLESHOT)
+        if not self._wait_ready():
+            return -1
+        return self._read_result_mm()
+
+    def _wait_ready(self) -> bool:
+        """
+        Poll until the ranging completes.
 
-        # Wait for measurement complete (max 500ms)
-        for _ in range(100):
-            sleep_ms(5)
+        Returns:
+            True when complete, False on ranging timeout.
+
+        Raises:
+            OSError: On I2C bus error.
+        """
+        for _ in range(self._poll_count):
+            sleep_ms(self._POLL_INTERVAL_MS)
             status = self._read_reg(self._REG_RESULT_INTERRUPT_STATUS)
             if status & 0x07:
-                break
-        else:
-            return -1.0
+                return True
+        return False
+
+    def _read_result_mm(self) -> int:
+        """
+        Clear the interrupt and read the completed range.
 
+        Raises:
+            OSError: On I2C bus error.
+        """
         # Clear interrupt
-        self._write_reg(0x0B, 0x01)
+        self._write_reg(self._REG_SYSTEM_INTERRUPT_CLEAR, 0x01)
 
         # Read distance
-        data = self._read_reg_multi(self._REG_RESULT_RANGE_STATUS, 12)
-        distance_mm = (data[10] << 8) | data[11]
+        data = self._result_buf
+        self._read_reg_into(self._REG_RESULT_RANGE_STATUS, data)
+        return _result_mm(data)
 
-        # Check for out of range
-        if distance_mm >= 8190:
-            return -1.0
+    def recover(self) -> bool:
+        """
+        Recover a hung bus and re-initialize the sensor.
+
+        Clocks SCL until a slave holding SDA low releases it,
+        issues a STOP condition, then recreates the I2C bus and
+        re-runs the init sequence.
+
+        Returns:
+            True if the sensor answered the init sequence.
+        """
+        self._reset_bus()
+        self._i2c = self._create_bus()
+        if self._xshut is not None:
+            # Hard reset through XSHUT
+            self._armed = False
+            self.power_down()
+            sleep_ms(1)
+            return self.power_up()
+        try:
+            self._init_sensor()
+        except OSError:
+            self._faulted = True
+            return False
+        self._faulted = False
+        return True
+
+    def arm_wake(self, threshold_cm: float):
+        """
+        Start autonomous ranging with a below-threshold interrupt.
+
+        Args:
+            threshold_cm: GPIO1 asserts when range drops below this.
+
+        Returns:
+            Interrupt Pin (active low), or None without int_pin.
+        """
+        if self._int_pin is None:
+            return None
+        if not self._powered and not self.power_up():
+            return None
 
-        return distance_mm / 10.0
+        # Thresholds are in units of 2mm
+        threshold = int(threshold_cm * 5)
+        try:
+            period = self._wake_period_ms * (self._osc_calibrate or 1)
+            self._write_reg(
+                self._REG_GPIO_HV_MUX_ACTIVE_HIGH,
+                self._read_reg(self._REG_GPIO_HV_MUX_ACTIVE_HIGH) & ~0x10,
+            )
+            self._write_reg16(self._REG_SYSTEM_THRESH_LOW, threshold)
+            self._write_reg16(self._REG_SYSTEM_THRESH_HIGH, 0xFFFF)
+            self._write_reg(self._REG_SYSTEM_INTERRUPT_CONFIG_GPIO, self._GPIO_LEVEL_LOW)
+            self._write_reg32(self._REG_SYSTEM_INTERMEASUREMENT_PERIOD, period)
+            self._write_reg(self._REG_SYSTEM_INTERRUPT_CLEAR, 0x01)
+            self._write_reg(self._REG_SYSRANGE_START, self._MODE_TIMED)
+        except OSError:
+            self._faulted = True
+            return None
+
+        self._armed = True
+        return self._int_pin
+
+    def disarm_wake(self) -> None:
+        """Stop autonomous ranging and restore single-shot mode."""
+        if not self._armed:
+            return
+        self._armed = False
+        try:
+            self._write_reg(self._REG_SYSRANGE_START, self._MODE_SINGLESHOT)
+            self._write_reg(self._REG_SYSTEM_INTERRUPT_CONFIG_GPIO, self._GPIO_NEW_SAMPLE)
+            self._write_reg(self._REG_SYSTEM_INTERRUPT_CLEAR, 0x01)
+        except OSError:
+            self._faulted = True
+
+    def power_down(self) -> bool:
+        """
+        Pull XSHUT low (sensor draws a few uA in shutdown).
+
+        Returns:
+            True if switched off; False without XSHUT or while armed.
+        """
+        if self._xshut is None or self._armed:
+            return False
+        self._xshut.off()
+        self._powered = False
+        return True
+
+    def power_up(self) -> bool:
+        """
+        Release XSHUT, move to the configured address and re-initialize.
+
+        Detection results (model ID, oscillator calibration) are kept
+        from the first start, so only the register setup is repeated.
+
+        Returns:
+            True if the sensor answered.
+        """
+        if self._powered:
+            return not self._faulted
+        self._xshut.on()
+        sleep_ms(self._BOOT_MS)
+        self._powered = True
+        try:
+            if self._address != self.DEFAULT_ADDRESS:
+                self._reg_buf[0] = self._address
+                self._i2c.writeto_mem(
+                    self.DEFAULT_ADDRESS, self._REG_I2C_SLAVE_DEVICE_ADDRESS, self._reg_buf,
+                )
+            if self._model_id:
+                self._configure()
+            else:
+                self._init_sensor()
+        except OSError:
+            self._faulted = True
+            return False
+        self._faulted = False
+        return True
+
+    @property
+    def power_up_ms(self) -> int:
+        """Return boot plus re-init time, or 0 without XSHUT."""
+        if self._xshut is None:
+            return 0
+        return self._BOOT_MS + 1
+
+    def _reset_bus(self) -> None:
+        """Bit-bang I2C bus recovery (up to 9 SCL clocks + STOP)."""
+        scl = Pin(self._scl_pin, Pin.OPEN_DRAIN, value=1)
+        sda = Pin(self._sda_pin, Pin.OPEN_DRAIN, value=1)
+
+        for _ in range(self._BUS_RECOVERY_CLOCKS):
+            if sda.value():
+                break
+            scl.off()
+            sleep_us(5)
+            scl.on()
+            sleep_us(5)
+
+        # STOP: SDA low -> high while SCL is high
+        sda.off()
+        sleep_us(5)
+        scl.on()
+        sleep_us(5)
+        sda.on()
+        sleep_us(5)
 
     def _write_reg(self, reg: int, value: int) -> None:
         """Write single byte to register."""
-        self._i2c.writeto_mem(self._address, reg, bytes([value]))
+        self._reg_buf[0] = value
+        self._i2c.writeto_mem(self._address, reg, self._reg_buf)
 
     def _read_reg(self, reg: int) -> int:
         """Read single byte from register."""
-        return self._i2c.readfrom_mem(self._address, reg, 1)[0]
+        self._i2c.readfrom_mem_into(self._address, reg, self._reg_buf)
+        return self._reg_buf[0]
+
+    def _write_reg16(self, reg: int, value: int) -> None:
+        """Write 16-bit big-endian value to register."""
+        self._i2c.writeto_mem(self._address, reg, struct.pack(">H", value))
+
+    def _write_reg32(self, reg: int, value: int) -> None:
+        """Write 32-bit big-endian value to register."""
+        self._i2c.writeto_mem(self._address, reg, struct.pack(">I", value))
+
+    def _read_reg16(self, reg: int) -> int:
+        """Read 16-bit big-endian value from register."""
+        return struct.unpack(">H", self._i2c.readfrom_mem(self._address, reg, 2))[0]
 
-    def _read_reg_multi(self, reg: int, length: int) -> bytes:
-        """Read multiple bytes starting from register."""
-        return self._i2c.readfrom_mem(self._address, reg, length)
+    def _read_reg_into(self, reg: int, buf: bytearray) -> None:
+        """Read len(buf) bytes starting from register into buf."""
+        self._i2c.readfrom_mem_into(self._address, reg, buf)
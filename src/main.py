@@ -4,124 +4,898 @@ Mirror light controller - Main application.
 Contactless bathroom mirror light using proximity sensor.
 Uses Factory Pattern for sensor creation - supports multiple sensor types.
 """
-from config import PinConfig, SensorConfig, TimingConfig, LightConfig, PowerConfig
-from hardware.sensors import DistanceSensor, SensorFactory
-from core import LightController, PresenceDetector, PowerManager
+from time import ticks_diff, ticks_ms
 
+from machine import Pin
 
-def create_sensor() -> DistanceSensor:
+from config import (
+    BootConfig,
+    LightConfig,
+    LogConfig,
+    MemoryConfig,
+    PinConfig,
+    PowerConfig,
+    SamplingConfig,
+    SensorConfig,
+    TelemetryConfig,
+    TimingConfig,
+    TraceConfig,
+    TrackingConfig,
+    ZoneConfig,
+)
+from core import (
+    ApproachTracker,
+    BootCache,
+    Counter,
+    Event,
+    EventDispatcher,
+    EventQueue,
+    GCPolicy,
+    LightController,
+    Logger,
+    LogMessage,
+    MQTTTransport,
+    PowerManager,
+    PresenceDetector,
+    SampleScheduler,
+    TelemetryPublisher,
+    ThreadedSampler,
+    TracePoint,
+    Tracer,
+    UDPTransport,
+)
+from hardware.sensors import DistanceSensor, SensorFactory, SensorHealth, SensorMonitor
+from hardware.sensors.vl53l0x import VL53L0XSensor
+
+
+def create_sensors(boot_cache: BootCache | None = None) -> list:
+    """
+    Create one sensor per zone (ZoneConfig.ZONES).
+
+    Args:
+        boot_cache: Warm boot cache, used for a single zone only.
+
+    Returns:
+        List of monitored sensors in zone order.
+    """
+    if not ZoneConfig.ZONES:
+        return [create_sensor(boot_cache)]
+    if SensorConfig.SENSOR_TYPE == "vl53l0x":
+        check_i2c_zones(ZoneConfig.ZONES)
+    # Hold every switched sensor off so each boots alone at the default address
+    for zone in ZoneConfig.ZONES:
+        if zone.get("power") is not None:
+            Pin(zone["power"], Pin.OUT, value=0)
+    sensors = [None] * len(ZoneConfig.ZONES)
+    for index in power_up_order(len(sensors)):
+        sensors[index] = create_sensor(zone=ZoneConfig.ZONES[index])
+    return sensors
+
+
+def power_up_order(count: int) -> list:
+    """
+    Return zone indices in the order their sensors must power up.
+
+    Every VL53L0X boots at the default address, so a sensor that keeps
+    it has to come up last: a sensor booting after it would answer at
+    the same address and its address change would move both parts.
+
+    Args:
+        count: Number of zones.
+    """
+    zones = ZoneConfig.ZONES
+    if not zones:
+        return list(range(count))
+    default = VL53L0XSensor.DEFAULT_ADDRESS
+    return sorted(range(count), key=lambda i: (zones[i].get("address") or default) == default)
+
+
+def check_i2c_zones(zones: tuple) -> None:
+    """
+    Reject VL53L0X zone layouts that cannot come up on real hardware.
+
+    Each I2C controller ("i2c", default 0) drives one pair of pins, and
+    every sensor boots at the default address: on a shared bus, a sensor
+    can only be moved to its own address while the others are held off
+    through their power (XSHUT) pins.
+
+    Args:
+        zones: ZoneConfig.ZONES entries.
+
+    Raises:
+        ValueError: If a bus is configured on two pin pairs, or a shared
+            bus has a duplicate address or a readdressed sensor without
+            a power pin.
+    """
+    default = VL53L0XSensor.DEFAULT_ADDRESS
+    buses = {}
+    for zone in zones:
+        buses.setdefault(zone.get("i2c", 0), []).append(zone)
+    for bus, members in buses.items():
+        pins = {(zone.get("sda", PinConfig.SDA), zone.get("scl", PinConfig.SCL))
+                for zone in members}
+        if len(pins) > 1:
+            raise ValueError(f"I2C bus {bus} configured on different pins")
+        if len(members) < 2:
+            continue
+        addresses = [zone.get("address") or default for zone in members]
+        if len(set(addresses)) < len(addresses):
+            raise ValueError(f"Duplicate sensor address on I2C bus {bus}")
+        for zone, address in zip(members, addresses):
+            if address != default and zone.get("power") is None:
+                raise ValueError(
+                    f"Sensor 0x{address:02x} on shared I2C bus {bus} needs a power pin"
+                )
+
+
+def zone_leds(count: int) -> list:
+    """
+    Return the light GPIO of each zone.
+
+    Args:
+        count: Number of sensors (zones) in use.
+
+    Raises:
+        ValueError: If count does not match the configured zones.
+    """
+    if not ZoneConfig.ZONES and count == 1:
+        return [PinConfig.LED]
+    if count != len(ZoneConfig.ZONES):
+        raise ValueError(f"{count} sensors for {len(ZoneConfig.ZONES)} zones")
+    return [zone["led"] for zone in ZoneConfig.ZONES]
+
+
+def create_sensor(boot_cache: BootCache | None = None, zone: dict | None = None) -> DistanceSensor:
     """
     Create sensor instance using Factory Pattern.
 
     Reads sensor type from configuration and creates
-    appropriate sensor with configured pins.
+    appropriate sensor with configured pins, wrapped in a
+    SensorMonitor for fault backoff and recovery. Consumers
+    share samples through read() (SensorConfig.MAX_AGE_MS).
+
+    Args:
+        boot_cache: Warm boot cache; a hit skips sensor detection.
+        zone: ZoneConfig.ZONES entry overriding address/pins.
 
     Returns:
         Configured sensor instance implementing DistanceSensor.
     """
-    sensor_type = SensorConfig.SENSOR_TYPE
+    calibration = None
+    if boot_cache is not None:
+        calibration = boot_cache.load(boot_fingerprint())
+    sensor = _create_raw_sensor(SensorConfig.SENSOR_TYPE, calibration, zone)
+    monitor = SensorMonitor(
+        sensor,
+        failure_threshold=SensorConfig.FAILURE_THRESHOLD,
+        backoff_min_ms=SensorConfig.BACKOFF_MIN_MS,
+        backoff_max_ms=SensorConfig.BACKOFF_MAX_MS,
+    )
+    monitor.max_age_ms = SensorConfig.MAX_AGE_MS
+    return monitor
+
+
+def sensor_power_pin(zone: dict | None = None) -> int:
+    """Return the GPIO switching a zone's sensor supply (None if always on)."""
+    return zone.get("power") if zone else PinConfig.SENSOR_POWER
+
 
+def _create_raw_sensor(
+    sensor_type: str,
+    calibration: dict | None = None,
+    zone: dict | None = None,
+) -> DistanceSensor:
+    """Create unmonitored sensor driver for the given type."""
+    power_pin = sensor_power_pin(zone)
+    if power_pin is not None:
+        PowerManager.release_hold(power_pin)
+    zone = zone or {}
     if sensor_type == "vl53l0x":
+        int_pin = None
+        if PowerConfig.USE_THRESHOLD_WAKE and not zone:
+            int_pin = PinConfig.SENSOR_INT
         return SensorFactory.create(
             sensor_type,
-            sda_pin=PinConfig.SDA,
-            scl_pin=PinConfig.SCL,
+            sda_pin=zone.get("sda", PinConfig.SDA),
+            scl_pin=zone.get("scl", PinConfig.SCL),
+            i2c_id=zone.get("i2c", 0),
+            address=zone.get("address"),
+            timeout_ms=SensorConfig.RANGING_TIMEOUT_MS,
+            int_pin=int_pin,
+            wake_period_ms=PowerConfig.WAKE_PERIOD_MS,
+            calibration=calibration,
+            xshut_pin=power_pin,
         )
     elif sensor_type == "ultrasonic":
         return SensorFactory.create(
             sensor_type,
-            trigger_pin=PinConfig.TRIGGER,
-            echo_pin=PinConfig.ECHO,
+            trigger_pin=zone.get("trigger", PinConfig.TRIGGER),
+            echo_pin=zone.get("echo", PinConfig.ECHO),
             timeout_us=SensorConfig.TIMEOUT_US,
             sound_divisor=SensorConfig.SOUND_SPEED_DIVISOR,
+            power_pin=power_pin,
+            power_up_ms=SensorConfig.POWER_UP_MS,
+        )
+    elif sensor_type == "ld2410":
+        return SensorFactory.create(
+            sensor_type,
+            tx_pin=zone.get("tx", PinConfig.RADAR_TX),
+            rx_pin=zone.get("rx", PinConfig.RADAR_RX),
+            uart_id=zone.get("uart", PinConfig.RADAR_UART),
+            range_cm=SensorConfig.RADAR_RANGE_CM,
+            stale_ms=SensorConfig.RADAR_STALE_MS,
         )
     else:
         raise ValueError(f"Unknown sensor type: {sensor_type}")
 
 
-class MirrorLightApp:
+def boot_fingerprint() -> str:
     """
-    Main application controller.
+    Return identifier of the configured sensor hardware.
+
+    Covers the sensor type, bus and power pins and the zone layout
+    (addresses, buses, power pins), so changing any of them makes the
+    cached calibration and address state miss.
+    """
+    pins = (
+        PinConfig.SDA, PinConfig.SCL, PinConfig.TRIGGER, PinConfig.ECHO, PinConfig.SENSOR_POWER,
+    )
+    zones = ";".join(
+        ",".join(f"{key}={zone[key]}" for key in sorted(zone)) for zone in ZoneConfig.ZONES
+    )
+    return SensorConfig.SENSOR_TYPE + ":" + ":".join(str(pin) for pin in pins) + "/" + zones
+
+
+def create_telemetry() -> TelemetryPublisher:
+    """
+    Create telemetry publisher if enabled in configuration.
+
+    Starts WiFi association without waiting for it; until the link
+    is up publishing fails and records stay buffered.
+
+    Returns:
+        Configured TelemetryPublisher, or None if disabled.
+    """
+    if not TelemetryConfig.ENABLED:
+        return None
+
+    import network
+
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    wlan.connect(TelemetryConfig.WIFI_SSID, TelemetryConfig.WIFI_PASSWORD)
 
-    Coordinates sensor, light, presence detection, and power management.
-    Uses dependency injection for sensor to support multiple types.
+    transport_type = TelemetryConfig.TRANSPORT
+    if transport_type == "udp":
+        transport = UDPTransport(TelemetryConfig.HOST, TelemetryConfig.PORT)
+    elif transport_type == "mqtt":
+        transport = MQTTTransport(
+            client_id=f"mirror-{TelemetryConfig.DEVICE_ID}",
+            server=TelemetryConfig.HOST,
+            topic=TelemetryConfig.TOPIC,
+            port=TelemetryConfig.PORT,
+        )
+    else:
+        raise ValueError(f"Unknown telemetry transport: {transport_type}")
+
+    return TelemetryPublisher(
+        transport,
+        device_id=TelemetryConfig.DEVICE_ID,
+        interval_ms=TelemetryConfig.INTERVAL_MS,
+        capacity=TelemetryConfig.QUEUE_SIZE,
+        distance_every=TelemetryConfig.DISTANCE_EVERY,
+    )
+
+
+class MirrorZone:
     """
+    One mirror: sensor, approach tracker, presence FSM and light.
+
+    Zones are independent; each has its own event queue so presence
+    transitions of one mirror never touch another mirror's light.
 
-    def __init__(self, sensor: DistanceSensor) -> None:
+    With a tracer attached, samples are traced while the zone waits for
+    presence (idle or detecting), and the activation path up to full
+    brightness is traced once; the tracer is then triggered for a dump
+    when the fade in completes.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        sensor: DistanceSensor,
+        led_pin: int,
+        log: Logger,
+    ) -> None:
         """
-        Initialize application with injected sensor.
+        Initialize zone.
 
         Args:
-            sensor: Distance sensor instance implementing DistanceSensor.
+            index: Zone number (used in log messages).
+            sensor: Distance sensor of this mirror.
+            led_pin: GPIO of this mirror's light.
+            log: Shared application logger.
         """
-        self._sensor = sensor
-        self._light = LightController(
-            pin=PinConfig.LED,
+        self.index = index
+        self.sensor = sensor
+        self.telemetry = None
+        self.tracer = None
+        self._log = log
+        self.light = LightController(
+            pin=led_pin,
             use_fade=LightConfig.USE_FADE,
             fade_duration_ms=LightConfig.FADE_DURATION_MS,
             fade_steps=LightConfig.FADE_STEPS,
             pwm_freq=LightConfig.PWM_FREQ,
+            slew_percent_per_s=LightConfig.SLEW_PERCENT_PER_S,
+            min_step_percent=LightConfig.MIN_STEP_PERCENT,
+            defer_setup=BootConfig.FAST_BOOT,
         )
-        self._presence = PresenceDetector(
+        self._events = EventQueue()
+        self._dispatcher = EventDispatcher(self._events)
+        self._dispatcher.subscribe(Event.PRESENCE_START, self._on_presence_start)
+        self._dispatcher.subscribe(Event.PRESENCE_END, self._on_presence_end)
+        adaptive = TimingConfig.ADAPTIVE_TIMEOUT
+        self.presence = PresenceDetector(
             activation_ms=TimingConfig.ACTIVATION_MS,
             timeout_ms=TimingConfig.TIMEOUT_MS,
-            on_activate=self._on_presence_start,
-            on_deactivate=self._on_presence_end,
+            events=self._events,
+            approach_activation_ms=TimingConfig.APPROACH_ACTIVATION_MS,
+            min_timeout_ms=TimingConfig.MIN_TIMEOUT_MS if adaptive else None,
+            max_timeout_ms=TimingConfig.MAX_TIMEOUT_MS if adaptive else None,
+            flap_rate=TimingConfig.FLAP_RATE,
+            flap_window_ms=TimingConfig.FLAP_WINDOW_MS,
         )
-        self._power = PowerManager(use_light_sleep=PowerConfig.USE_LIGHT_SLEEP)
+        self._timeout_ms = TimingConfig.TIMEOUT_MS
+        self.tracker = None
+        if TrackingConfig.ENABLED:
+            self.tracker = ApproachTracker(
+                alpha=TrackingConfig.ALPHA,
+                beta=TrackingConfig.BETA,
+                track_range_cm=TrackingConfig.TRACK_RANGE_CM,
+                approach_speed_cm_s=TrackingConfig.APPROACH_SPEED_CM_S,
+                min_travel_cm=TrackingConfig.MIN_TRAVEL_CM,
+                min_samples=TrackingConfig.MIN_SAMPLES,
+            )
+        self._health = SensorHealth.OK
+        self._fade_traced = False
+        # Integer mm thresholds: samples are compared without floats
+        self._min_mm = round(SensorConfig.MIN_DISTANCE_CM * 10)
+        self._max_mm = round(SensorConfig.MAX_DISTANCE_CM * 10)
+        self._near_mm = round(LightConfig.NEAR_CM * 10)
+        # Presence sensors decide themselves (see DistanceSensor.presence)
+        self._sensor_presence = sensor.presence is not None
+
+    def read(self, wait=None) -> int:
+        """
+        Take one sample from the zone's sensor.
+
+        Args:
+            wait: Callable(ms) to idle in during the conversion (split
+                phase, see DistanceSensor.read_mm), or None to measure.
+
+        Returns:
+            Distance in mm, negative if invalid.
+        """
+        tracer = self._sample_tracer()
+        if tracer is None:
+            return self.sensor.read_mm(None, wait)
+        tracer.begin(TracePoint.SENSOR, self.index)
+        distance = self.sensor.read_mm(None, wait)
+        tracer.end(TracePoint.SENSOR, self.index)
+        return distance
+
+    def process_sample(self, distance: int, now: int | None = None) -> None:
+        """
+        Feed one distance sample through tracking and presence FSM.
+
+        Args:
+            distance: Measured distance in mm, negative if invalid.
+            now: Sample timestamp (ticks_ms), default current time.
+        """
+        self._check_health()
+        tracer = self._sample_tracer()
+        if tracer:
+            tracer.begin(TracePoint.FILTER, self.index)
+            was_idle = self.presence.is_idle
+        approaching = False
+        if self.tracker:
+            approaching = self.tracker.update(distance, now)
+        if self._sensor_presence:
+            presence = distance >= 0
+        else:
+            presence = self._is_presence(distance)
+        self.presence.update(presence, approaching, now)
+        if tracer:
+            tracer.end(TracePoint.FILTER, self.index)
+            self._trace_transition(tracer, was_idle)
+        if LightConfig.TRACK_DISTANCE and presence:
+            self.light.track(self._brightness_for(distance))
+        if self.telemetry:
+            self.telemetry.record_distance(distance)
+
+    def update(self) -> None:
+        """Dispatch queued transitions and advance fades or brightness tracking."""
+        self._dispatcher.dispatch()
+        if not self.step_fade() and LightConfig.TRACK_DISTANCE:
+            self.light.update()
+
+    def step_fade(self) -> bool:
+        """
+        Advance the light's running fade.
+
+        Returns:
+            True while the fade is still running.
+        """
+        light = self.light
+        if not light.fading:
+            return False
+        light.update()
+        if light.fading:
+            return True
+        if self._fade_traced:
+            self._end_fade_trace()
+        return False
+
+    def _sample_tracer(self):
+        """Return the tracer while waiting for presence, else None."""
+        if self.tracer is None:
+            return None
+        if self.presence.is_idle or self.presence.is_detecting:
+            return self.tracer
+        return None
+
+    def _trace_transition(self, tracer: Tracer, was_idle: bool) -> None:
+        """Trace entering range, the activation dwell and activation."""
+        presence = self.presence
+        if was_idle:
+            if presence.is_detecting:
+                tracer.instant(TracePoint.ENTER, self.index)
+                tracer.begin(TracePoint.DWELL, self.index)
+        elif not presence.is_detecting:
+            tracer.end(TracePoint.DWELL, self.index)
+            if presence.is_active:
+                tracer.instant(TracePoint.ACTIVATE, self.index)
 
     def _on_presence_start(self) -> None:
         """Callback when sustained presence detected."""
-        self._light.on()
-        print("Light ON - presence confirmed")
+        tracer = self.tracer
+        if tracer:
+            tracer.begin(TracePoint.DISPATCH, self.index)
+        if self.telemetry:
+            self.telemetry.count(Counter.ACTIVATIONS)
+            self.telemetry.record_event(Event.PRESENCE_START)
+        self.light.on()
+        self._log.info(LogMessage.LIGHT_ON, self.index)
+        if tracer:
+            tracer.end(TracePoint.DISPATCH, self.index)
+            # Ended by step_fade() once the fade in completes
+            tracer.begin(TracePoint.FADE, self.index)
+            self._fade_traced = True
+            if not self.light.fading:
+                self._end_fade_trace()
+
+    def _end_fade_trace(self) -> None:
+        """Close the traced fade in and trigger a dump."""
+        self._fade_traced = False
+        self.tracer.end(TracePoint.FADE, self.index)
+        self.tracer.trigger()
 
     def _on_presence_end(self) -> None:
         """Callback when presence timeout expired."""
-        self._light.off()
-        print("Light OFF - presence timeout")
-
-    def run(self) -> None:
-        """Main application loop."""
-        self._print_config()
+        if self.telemetry:
+            self.telemetry.count(Counter.DEACTIVATIONS)
+            self.telemetry.record_event(Event.PRESENCE_END)
+        self.light.off()
+        self._log.info(LogMessage.LIGHT_OFF, self.index)
+        timeout_ms = self.presence.timeout_ms
+        if timeout_ms != self._timeout_ms:
+            self._timeout_ms = timeout_ms
+            flaps = self.presence.flaps
+            self._log.info(LogMessage.TIMEOUT_LEARNED, timeout_ms, flaps, obj=self.index)
 
-        while True:
-            distance = self._sensor.measure()
-            presence = self._is_presence(distance)
-            self._presence.update(presence)
-            self._power.sleep(PowerConfig.SLEEP_DURATION_MS)
+    def _check_health(self) -> None:
+        """Report sensor health transitions."""
+        health = self.sensor.health
+        if health != self._health:
+            self._health = health
+            if self.telemetry and health == SensorHealth.FAILED:
+                self.telemetry.count(Counter.SENSOR_FAULTS)
+            self._log.warning(LogMessage.SENSOR_HEALTH, self.index, obj=health)
 
-    def _is_presence(self, distance: float) -> bool:
+    # emit: native
+    def _is_presence(self, distance: int) -> bool:
         """
         Determine if distance indicates presence.
 
         Args:
-            distance: Measured distance in cm.
+            distance: Measured distance in mm.
 
         Returns:
             True if valid presence detected within configured range.
         """
         if distance < 0:
             return False
-        if distance < SensorConfig.MIN_DISTANCE_CM:
+        if distance < self._min_mm:
             return False
-        return distance < SensorConfig.MAX_DISTANCE_CM
+        return distance < self._max_mm
+
+    def _brightness_for(self, distance: int) -> int:
+        """
+        Map distance to brightness for tracking mode.
+
+        Args:
+            distance: Valid distance in mm (within presence range).
+
+        Returns:
+            Brightness percentage, 100 at NEAR_CM falling linearly
+            to MIN_BRIGHTNESS_PERCENT at MAX_DISTANCE_CM.
+        """
+        near = self._near_mm
+        far = self._max_mm
+        if distance <= near:
+            return 100
+        if distance >= far:
+            return LightConfig.MIN_BRIGHTNESS_PERCENT
+        span = 100 - LightConfig.MIN_BRIGHTNESS_PERCENT
+        return 100 - span * (distance - near) // (far - near)
+
+
+class MirrorLightApp:
+    """
+    Main application controller.
+
+    Coordinates zones (one per mirror), power management and telemetry.
+    Uses dependency injection for sensors to support multiple types.
+
+    Presence transitions are queued by the state machine and dispatched
+    after the sample is processed, so fades and UART output never run
+    inside PresenceDetector.update(). Fades do not block the loop: their
+    steps run in short slices of the wait for the next sample deadline,
+    so a fade on one mirror never delays a sample of any mirror.
+
+    Several zones share one scheduler: each tick measures the next zone
+    round-robin and the tick period is POLL_INTERVAL_MS divided by the
+    number of zones, so every zone is still sampled once per
+    POLL_INTERVAL_MS however many are added (as long as one measurement
+    fits in a tick). The sampling thread, threshold wake and PIR wake
+    need a single zone.
+
+    With PowerConfig.USE_PIR_WAKE the empty room is watched by a PIR
+    alone: the ranging sensor is powered down and the device sleeps
+    until the PIR fires, then ranges for at least PIR_CONFIRM_MS and
+    for as long as presence is confirmed or tracked, or the PIR still
+    sees motion. Ranging catches people standing still, which the PIR
+    misses.
+
+    The steady-state loop (step) does not allocate; garbage is only
+    collected in idle windows right before a sleep.
+
+    With BootConfig.FAST_BOOT the first sample is taken before any
+    non-critical setup (config printout, sampler thread, WiFi and
+    telemetry, PWM); time_to_first_sample_ms records how long that took.
+    """
+
+    def __init__(
+        self,
+        sensor,
+        telemetry: TelemetryPublisher | None = None,
+        boot_cache: BootCache | None = None,
+    ) -> None:
+        """
+        Initialize application with injected sensors.
+
+        Args:
+            sensor: Distance sensor, or list of sensors with one per
+                ZoneConfig.ZONES entry.
+            telemetry: Optional telemetry publisher (default: created
+                from TelemetryConfig during deferred setup).
+            boot_cache: Warm boot cache updated after the first sample.
 
-    def _print_config(self) -> None:
-        """Print current configuration on startup."""
-        print("Mirror Light Controller")
-        print(f"  Sensor:      {self._sensor.sensor_type}")
-        print(f"  Range:       {SensorConfig.MIN_DISTANCE_CM}-{SensorConfig.MAX_DISTANCE_CM}cm")
-        print(f"  Activation:  {TimingConfig.ACTIVATION_MS}ms")
-        print(f"  Timeout:     {TimingConfig.TIMEOUT_MS}ms")
-        print(f"  Fade:        {LightConfig.USE_FADE} ({LightConfig.FADE_DURATION_MS}ms)")
-        print(f"  Light sleep: {PowerConfig.USE_LIGHT_SLEEP}")
-        print("Ready.")
+        Raises:
+            ValueError: If the number of sensors does not match the zones.
+        """
+        sensors = sensor if isinstance(sensor, list) else [sensor]
+        self._log = Logger(capacity=LogConfig.CAPACITY, level=LogConfig.LEVEL)
+        self._zones = [
+            MirrorZone(index, zone_sensor, led_pin, self._log)
+            for index, (zone_sensor, led_pin) in enumerate(zip(sensors, zone_leds(len(sensors))))
+        ]
+        self._next_zone = 0
+        self._sensor = sensors[0]
+        self._telemetry = telemetry
+        self._boot_cache = boot_cache
+        self._setup_done = False
+        self.time_to_first_sample_ms = -1
+        # The UART stops in light sleep and a streaming sensor's frames are lost
+        self._light_sleep = PowerConfig.USE_LIGHT_SLEEP and not any(
+            zone_sensor.streams for zone_sensor in sensors
+        )
+        self._power = PowerManager(
+            use_light_sleep=self._light_sleep,
+            sensor_min_off_ms=PowerConfig.SENSOR_MIN_OFF_MS,
+        )
+        # Bound once: step() must not allocate
+        self._conversion_wait = self._power.nap if SamplingConfig.SPLIT_PHASE else None
+        self._fade_poll = self._step_fades
+        self._fade_step_ms = max(1, LightConfig.FADE_DURATION_MS // LightConfig.FADE_STEPS)
+        self._scheduler = self._create_scheduler()
+        self._sampler = None
+        self._switched_sensors = ()
+        self._gating = False
+        self._active_at = ticks_ms()
+        self._pir = None
+        self._pir_hold = ()
+        if PowerConfig.USE_PIR_WAKE and PinConfig.PIR is not None and len(self._zones) == 1:
+            self._pir = Pin(PinConfig.PIR, Pin.IN)
+            power_pin = sensor_power_pin(ZoneConfig.ZONES[0] if ZoneConfig.ZONES else None)
+            if power_pin is not None:
+                # Held off through deep sleep; the driver releases it at boot
+                self._pir_hold = (Pin(power_pin),)
+        # Boot (or a deep sleep wake, which reboots) starts a confirm window
+        self._pir_at = self._active_at
+        self._gc = GCPolicy(
+            threshold_bytes=MemoryConfig.GC_THRESHOLD_BYTES,
+            idle_collect_bytes=MemoryConfig.GC_IDLE_COLLECT_BYTES,
+        )
+        self._tracer = None
+        if TraceConfig.ENABLED:
+            self._tracer = Tracer(capacity=TraceConfig.CAPACITY)
+            for zone in self._zones:
+                zone.tracer = self._tracer
+        if telemetry:
+            self._attach_telemetry()
+
+    def run(self) -> None:
+        """Main application loop."""
+        if not BootConfig.FAST_BOOT:
+            self._deferred_setup()
+        self._gc.configure()
+
+        while True:
+            self.step()
+
+    def step(self) -> None:
+        """Run one sample/update/sleep iteration."""
+        if self._sampler:
+            zone = self._zones[0]
+            ring = self._sampler.ring
+            while ring.pop():
+                zone.process_sample(ring.distance, ring.timestamp)
+        else:
+            zone = self._zones[self._next_zone]
+            self._next_zone = (self._next_zone + 1) % len(self._zones)
+            zone.process_sample(zone.read(self._conversion_wait))
+        if self.time_to_first_sample_ms < 0:
+            self._on_first_sample()
+        for zone in self._zones:
+            zone.update()
+        if self._telemetry:
+            self._telemetry.poll()
+        idle = self._is_idle()
+        if self._switched_sensors:
+            self._update_gating(idle)
+        if idle:
+            if len(self._log):
+                self._log.flush(LogConfig.FLUSH_BATCH)
+            if self._tracer and self._tracer.triggered:
+                self._tracer.dump()
+            self._gc.idle()
+            if self._pir and not self._sampler:
+                if self._pir.value():
+                    self._pir_at = ticks_ms()
+                elif ticks_diff(ticks_ms(), self._pir_at) >= PowerConfig.PIR_CONFIRM_MS:
+                    self._sleep_until_motion()
+                    return
+            elif PowerConfig.USE_THRESHOLD_WAKE and len(self._zones) == 1 and not self._sampler:
+                self._sleep_until_presence()
+                return
+        self._scheduler.wait(self._fade_poll, self._fade_step_ms)
+
+    @property
+    def zones(self) -> list:
+        """Return zones in measurement order."""
+        return self._zones
+
+    @property
+    def log(self) -> Logger:
+        """Return application logger (flush() to print on request)."""
+        return self._log
+
+    @property
+    def tracer(self) -> Tracer:
+        """Return latency tracer, or None unless TraceConfig.ENABLED."""
+        return self._tracer
+
+    @property
+    def scheduler(self) -> SampleScheduler:
+        """Return sample scheduler (jitter statistics)."""
+        return self._scheduler
+
+    def _is_idle(self) -> bool:
+        """Return True if no zone has presence activity or a running fade."""
+        for zone in self._zones:
+            if not zone.presence.is_idle or zone.light.fading:
+                return False
+        return True
+
+    def _step_fades(self) -> bool:
+        """Advance running fades; return True while any is running."""
+        fading = False
+        for zone in self._zones:
+            if zone.step_fade():
+                fading = True
+        return fading
+
+    def _update_gating(self, idle: bool) -> None:
+        """Power sensors down between samples once the room stays empty."""
+        now = ticks_ms()
+        if not idle:
+            self._active_at = now
+            if self._gating:
+                self._gating = False
+                self._power.gate_sensors()
+            return
+        idle_ms = ticks_diff(now, self._active_at)
+        if not self._gating and idle_ms >= PowerConfig.SENSOR_OFF_AFTER_MS:
+            self._gating = True
+            self._power.gate_sensors(self._switched_sensors)
+
+    def _create_scheduler(self) -> SampleScheduler:
+        """Create loop scheduler for the current power manager."""
+        timer_id = SamplingConfig.TIMER_ID if SamplingConfig.USE_TIMER else None
+        return SampleScheduler(
+            TimingConfig.POLL_INTERVAL_MS // len(self._zones),
+            self._power,
+            timer_id=timer_id,
+        )
+
+    def _attach_telemetry(self) -> None:
+        """Share the telemetry publisher with all zones."""
+        for zone in self._zones:
+            zone.telemetry = self._telemetry
+
+    def _on_first_sample(self) -> None:
+        """Record boot latency, then run setup deferred by fast boot."""
+        # ticks_ms restarts at reset, so this is time since boot
+        self.time_to_first_sample_ms = ticks_ms()
+        self._deferred_setup()
+        if self._boot_cache:
+            warm = "warm" if self._boot_cache.hit else "cold"
+            self._log.info(LogMessage.FIRST_SAMPLE, self.time_to_first_sample_ms, obj=warm)
+            if not self._sensor.faulted:
+                self._boot_cache.save(boot_fingerprint(), self._sensor.calibration)
+
+    def _deferred_setup(self) -> None:
+        """Non-critical setup: output, config printout, sampler, telemetry."""
+        if self._setup_done:
+            return
+        self._setup_done = True
+        for zone in self._zones:
+            zone.light.begin()
+        if self._telemetry is None:
+            self._telemetry = create_telemetry()
+            if self._telemetry:
+                self._attach_telemetry()
+        self._log_config()
+        for zone in self._zones:
+            self._check_model(zone)
+        if self._pir and not self._pir_hold:
+            self._log.warning(LogMessage.PIR_NO_POWER)
+        if len(self._zones) == 1:
+            self._start_sampler()
+        # Threshold wake and the sampling thread need the sensor powered;
+        # PIR wake switches it itself
+        if not self._sampler and not PowerConfig.USE_THRESHOLD_WAKE and not self._pir:
+            zones = [self._zones[i] for i in power_up_order(len(self._zones))]
+            self._switched_sensors = tuple(
+                zone.sensor for zone in zones if zone.sensor.power_up_ms
+            )
+
+    def _start_sampler(self) -> None:
+        """Move sensor sampling to a worker thread if enabled and possible."""
+        if not SamplingConfig.USE_THREAD:
+            return
+        sampler = ThreadedSampler(
+            self._sensor,
+            period_ms=SamplingConfig.PERIOD_MS,
+            capacity=SamplingConfig.BUFFER_SIZE,
+        )
+        if not sampler.start():
+            self._log.warning(LogMessage.SAMPLER_INLINE)
+            return
+        self._sampler = sampler
+        # Light sleep would halt the sampling thread too
+        self._light_sleep = False
+        self._power = PowerManager(use_light_sleep=False)
+        self._scheduler.deinit()
+        self._scheduler = self._create_scheduler()
+
+    def _sleep_until_presence(self) -> None:
+        """
+        Sleep until the sensor's threshold interrupt fires.
+
+        Falls back to a regular poll sleep if the sensor cannot arm.
+        """
+        threshold_cm = SensorConfig.MAX_DISTANCE_CM + PowerConfig.WAKE_MARGIN_CM
+        pin = self._sensor.arm_wake(threshold_cm)
+        if pin is None:
+            self._scheduler.wait()
+            return
+        self._log.debug(LogMessage.WAKE_ARMED, int(threshold_cm))
+        if not self._power.sleep_until(pin, PowerConfig.WAKE_TIMEOUT_MS):
+            self._log.debug(LogMessage.WAKE_TIMEOUT, PowerConfig.WAKE_TIMEOUT_MS)
+        self._sensor.disarm_wake()
+        self._scheduler.resync()
+
+    def _sleep_until_motion(self) -> None:
+        """
+        Sleep with the sensor powered down until the PIR fires.
+
+        Wakes after WAKE_TIMEOUT_MS anyway for housekeeping. With
+        PIR_DEEP_SLEEP the device deep-sleeps instead and the PIR wake
+        reboots it into a fresh confirm window.
+        """
+        sensor = self._sensor
+        sensor.power_down()
+        self._log.debug(LogMessage.PIR_SLEEP)
+        start = ticks_ms()
+        if PowerConfig.PIR_DEEP_SLEEP:
+            self._log.flush()
+            self._power.deep_sleep_until(
+                self._pir, PowerConfig.WAKE_TIMEOUT_MS, hold=self._pir_hold,
+            )
+        elif self._power.sleep_until(self._pir, PowerConfig.WAKE_TIMEOUT_MS, level=1):
+            self._log.debug(LogMessage.PIR_WAKE, ticks_diff(ticks_ms(), start))
+        else:
+            self._log.debug(LogMessage.WAKE_TIMEOUT, PowerConfig.WAKE_TIMEOUT_MS)
+        sensor.power_up()
+        self._pir_at = ticks_ms()
+        self._scheduler.resync()
+
+    def _check_model(self, zone: MirrorZone) -> None:
+        """Warn if a VL53L0X reported an unexpected model ID."""
+        calibration = zone.sensor.calibration
+        if calibration and calibration["model"] != VL53L0XSensor.MODEL_ID:
+            self._log.warning(
+                LogMessage.SENSOR_MODEL, calibration["model"], VL53L0XSensor.MODEL_ID,
+            )
+
+    def _log_config(self) -> None:
+        """Log current configuration on startup."""
+        log = self._log
+        log.info(LogMessage.CONFIG_TITLE)
+        log.info(LogMessage.CONFIG_SENSOR, obj=self._sensor.sensor_type)
+        log.info(LogMessage.CONFIG_ZONES, len(self._zones))
+        log.info(
+            LogMessage.CONFIG_RANGE,
+            int(SensorConfig.MIN_DISTANCE_CM),
+            int(SensorConfig.MAX_DISTANCE_CM),
+        )
+        log.info(LogMessage.CONFIG_ACTIVATION, TimingConfig.ACTIVATION_MS)
+        if TrackingConfig.ENABLED:
+            log.info(LogMessage.CONFIG_APPROACH, TimingConfig.APPROACH_ACTIVATION_MS)
+        log.info(LogMessage.CONFIG_TIMEOUT, TimingConfig.TIMEOUT_MS)
+        if TimingConfig.ADAPTIVE_TIMEOUT:
+            log.info(
+                LogMessage.CONFIG_ADAPTIVE,
+                TimingConfig.MIN_TIMEOUT_MS,
+                TimingConfig.MAX_TIMEOUT_MS,
+            )
+        log.info(LogMessage.CONFIG_FADE, LightConfig.FADE_DURATION_MS, obj=LightConfig.USE_FADE)
+        log.info(LogMessage.CONFIG_DIMMING, obj=LightConfig.TRACK_DISTANCE)
+        log.info(LogMessage.CONFIG_LIGHT_SLEEP, obj=self._light_sleep)
+        log.info(LogMessage.CONFIG_WAKE_IRQ, obj=PowerConfig.USE_THRESHOLD_WAKE)
+        log.info(LogMessage.CONFIG_PIR, obj=self._pir is not None)
+        log.info(LogMessage.CONFIG_READY)
 
 
 def main() -> None:
     """Application entry point."""
-    sensor = create_sensor()
-    app = MirrorLightApp(sensor)
+    boot_cache = None
+    if BootConfig.FAST_BOOT and not ZoneConfig.ZONES:
+        boot_cache = BootCache(BootConfig.CACHE_PATH)
+    app = MirrorLightApp(create_sensors(boot_cache), boot_cache=boot_cache)
     app.run()
 
 
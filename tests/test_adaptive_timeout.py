@@ -0,0 +1,129 @@
+"""Tests for the timeout learned from session statistics."""
+import pytest
+
+from tests.conftest import reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def make_detector(**kwargs):
+    """Adaptive detector with the bounds used in these tests."""
+    from core.presence import PresenceDetector
+
+    options = {
+        "activation_ms": 200,
+        "timeout_ms": 3000,
+        "min_timeout_ms": 1500,
+        "max_timeout_ms": 10000,
+        "flap_window_ms": 20000,
+    }
+    options.update(kwargs)
+    return PresenceDetector(**options)
+
+
+def run_visits(detector, visits, gap_ms, pause_ms=2000, visit_ms=60000):
+    """
+    Replay visits in which the person briefly leaves the range.
+
+    Each visit lasts visit_ms with a drop-out of gap_ms every 10 s,
+    followed by an empty room. Returns (light-on ms, activations).
+    """
+    on_ms = 0
+    activations = 0
+    now = 0
+    for _ in range(visits):
+        start = now
+        end = start + visit_ms
+        while now < end + 30000:
+            offset = now - start
+            present = now < end and offset % 10000 >= gap_ms
+            was_active = detector.state in ("active", "timeout")
+            detector.update(present, now=now)
+            active = detector.state in ("active", "timeout")
+            activations += active and not was_active
+            on_ms += 100 if active else 0
+            now += 100
+        now += pause_ms
+    return on_ms, activations
+
+
+def test_histogram_is_fixed_size_and_ages():
+    """Counts should stay in the preallocated bins and halve when full."""
+    from core.presence import Histogram
+
+    histogram = Histogram(bins=4, bin_ms=100, max_count=10)
+    for value in (50, 150, 150, 99999):
+        histogram.add(value)
+
+    assert [histogram[i] for i in range(len(histogram))] == [1, 2, 0, 1]
+    assert histogram.percentile(0.5) == 200
+    assert histogram.percentile(1.0) == 400
+
+    for _ in range(6):
+        histogram.add(150)
+    assert histogram.total == 4
+    assert histogram[1] == 4
+
+
+def test_fidgety_user_raises_timeout_to_stop_flaps():
+    """Drop-outs longer than the timeout should teach a longer one."""
+    detector = make_detector()
+
+    _, early = run_visits(detector, visits=3, gap_ms=4000)
+    flaps = detector.flaps
+    _, late = run_visits(detector, visits=3, gap_ms=4000)
+
+    assert early > 3  # Default 3 s timeout flapped on 4 s gaps
+    assert late == 3  # One activation per visit once learned
+    assert detector.flaps == flaps
+    assert 4000 < detector.timeout_ms <= 10000
+
+
+def test_still_user_shortens_timeout():
+    """Short drop-outs should learn a shorter, cheaper timeout."""
+    fixed = make_detector(min_timeout_ms=None, max_timeout_ms=None)
+    fixed_on, _ = run_visits(fixed, visits=6, gap_ms=300)
+
+    learned = make_detector()
+    learned_on, activations = run_visits(learned, visits=6, gap_ms=300)
+
+    assert learned.timeout_ms == 1500
+    assert learned_on < fixed_on
+    assert activations == 6
+    assert learned.sessions.total == 6
+
+
+def test_learned_timeout_stays_within_bounds():
+    """Gaps longer than the upper bound must not stretch the timeout."""
+    detector = make_detector(max_timeout_ms=5000, flap_window_ms=20000)
+
+    run_visits(detector, visits=4, gap_ms=8000)
+
+    assert detector.timeout_ms == 5000
+    assert detector.gaps.percentile(0.5) > 5000
+
+
+def test_app_logs_learned_timeout(capsys):
+    """The zone should report a new learned timeout when the light goes off."""
+    from hardware.sensors.base import DistanceSensor
+    from main import MirrorLightApp
+    from tests.conftest import mock_ticks_ms
+
+    class FidgetySensor(DistanceSensor):
+        def measure(self) -> float:
+            now = mock_ticks_ms() % 100000
+            present = now < 60000 and now % 10000 >= 4000
+            return 30.0 if present else 200.0
+
+    app = MirrorLightApp(FidgetySensor())
+    while mock_ticks_ms() < 300000:
+        app.step()
+    app.log.flush()
+
+    timeout_ms = app.zones[0].presence.timeout_ms
+    assert timeout_ms > 4000
+    assert f"Timeout learned: {timeout_ms}ms" in capsys.readouterr().out
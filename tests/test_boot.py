@@ -0,0 +1,123 @@
+"""Tests for fast warm boot and the calibration cache."""
+import pytest
+
+from tests.conftest import reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+@pytest.fixture
+def emulator():
+    """Emulated VL53L0X on the runtime's I2C bus 0."""
+    from scripts.emulator import VL53L0XEmulator
+
+    return runtime.attach_i2c(VL53L0XEmulator(distance_mm=300))
+
+
+@pytest.fixture
+def soft_reset(monkeypatch):
+    """Make the last reset a soft reset (sensor stayed powered)."""
+    monkeypatch.setattr(runtime.machine, "reset_cause", lambda: runtime.machine.SOFT_RESET)
+
+
+def make_cache(tmp_path):
+    """Create cache in a temporary file."""
+    from core.bootcache import BootCache
+
+    return BootCache(str(tmp_path / "bootcache.json"))
+
+
+def test_warm_boot_skips_sensor_init(tmp_path, emulator, soft_reset):
+    """A cached calibration should avoid all init bus traffic."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    cache = make_cache(tmp_path)
+    assert cache.load("vl53l0x:8:9") is None
+    cold = VL53L0XSensor(sda_pin=8, scl_pin=9)
+    init_transactions = emulator.transactions
+    assert cache.save("vl53l0x:8:9", cold.calibration)
+
+    calibration = make_cache(tmp_path).load("vl53l0x:8:9")
+    before = emulator.transactions
+    warm = VL53L0XSensor(sda_pin=8, scl_pin=9, calibration=calibration)
+
+    assert init_transactions > 0
+    assert emulator.transactions == before
+    assert warm.calibration == cold.calibration
+    assert warm.measure() == 30.0
+
+
+def test_power_on_ignores_cache(tmp_path, emulator):
+    """After power loss the sensor must be initialized again."""
+    cache = make_cache(tmp_path)
+    cache.save("vl53l0x:8:9", {"model": 0xEE, "osc": 0})
+
+    assert cache.load("vl53l0x:8:9") is None
+    assert not cache.hit
+
+
+def test_fingerprint_mismatch_and_corrupt_file(tmp_path, soft_reset):
+    """Changed hardware or a damaged file should fall back to cold boot."""
+    cache = make_cache(tmp_path)
+    cache.save("vl53l0x:8:9", {"model": 0xEE, "osc": 0})
+    assert cache.load("ultrasonic:8:9") is None
+
+    (tmp_path / "bootcache.json").write_text("{not json")
+    assert cache.load("vl53l0x:8:9") is None
+    assert cache.load("vl53l0x:8:9") is None
+
+
+@pytest.mark.parametrize("change", [
+    ("SensorConfig", "SENSOR_TYPE", "ultrasonic"),
+    ("PinConfig", "SENSOR_POWER", 10),
+    ("ZoneConfig", "ZONES", ({"led": 4, "address": 0x30, "power": 10},)),
+    ("ZoneConfig", "ZONES", ({"led": 4, "address": 0x29, "power": 11},)),
+])
+def test_fingerprint_covers_sensor_setup(monkeypatch, change):
+    """Another sensor type, power pin or zone layout should miss the cache."""
+    import config
+    from main import boot_fingerprint
+
+    monkeypatch.setattr(config.ZoneConfig, "ZONES", ({"led": 4, "address": 0x29, "power": 10},))
+    before = boot_fingerprint()
+    section, name, value = change
+    monkeypatch.setattr(getattr(config, section), name, value)
+
+    assert boot_fingerprint() != before
+
+
+def test_unchanged_calibration_is_not_rewritten(tmp_path, soft_reset):
+    """Steady reboots should not wear flash."""
+    calibration = {"model": 0xEE, "osc": 0}
+    assert make_cache(tmp_path).save("vl53l0x:8:9", calibration)
+
+    cache = make_cache(tmp_path)
+    assert cache.load("vl53l0x:8:9") == calibration
+    assert not cache.save("vl53l0x:8:9", calibration)
+    assert cache.save("vl53l0x:8:9", {"model": 0xEE, "osc": 3})
+
+
+def test_app_samples_before_deferred_setup(tmp_path, emulator, capsys):
+    """Fast boot should take a sample before PWM and config output."""
+    from config import PinConfig
+    from main import MirrorLightApp, create_sensor
+
+    cache = make_cache(tmp_path)
+    app = MirrorLightApp(create_sensor(cache), boot_cache=cache)
+    assert runtime.pwm(PinConfig.LED).writes == 0
+    assert capsys.readouterr().out == ""
+
+    app.step()
+    app.log.flush()
+
+    output = capsys.readouterr().out
+    assert emulator.conversions == 1
+    assert 0 <= app.time_to_first_sample_ms < 100
+    assert f"First sample: {app.time_to_first_sample_ms}ms (cold boot)" in output
+    assert "Mirror Light Controller" in output
+    assert runtime.pwm(PinConfig.LED).duty == 0
+    assert (tmp_path / "bootcache.json").exists()
@@ -0,0 +1,181 @@
+"""Tests for host-side telemetry collector."""
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from tests.conftest import advance_time, reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+class CaptureTransport:
+    """Telemetry transport that keeps payloads."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def poll(self) -> bool:
+        return True
+
+    def publish(self, payload) -> bool:
+        self.payloads.append(bytes(payload))
+        return True
+
+
+def simulated_device(device_id, events):
+    """Return telemetry messages produced by a device publisher."""
+    from core.telemetry import TelemetryPublisher
+
+    transport = CaptureTransport()
+    publisher = TelemetryPublisher(transport, device_id=device_id, interval_ms=100)
+    for event in events:
+        publisher.record_event(event)
+        advance_time(100)
+        publisher.poll()
+    return transport.payloads
+
+
+def fixed_clock():
+    """Clock pinned to a known day."""
+    return datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def test_decode_device_message():
+    """Collector decoder should read what the device encodes."""
+    from scripts.collector import decode_batch
+
+    payload = simulated_device(3, [1])[0]
+    batch = decode_batch(payload)
+
+    assert batch.device == 3
+    assert batch.seq == 0
+    assert [r[:2] for r in batch.records] == [(1, 1)]
+
+
+def test_stream_decoder_resyncs():
+    """Garbage and split chunks should not lose messages."""
+    from scripts.collector import StreamDecoder
+
+    payloads = simulated_device(1, [1, 2])
+    stream = b"boot log\r\n" + payloads[0] + b"MX" + payloads[1]
+
+    decoder = StreamDecoder()
+    batches = []
+    for i in range(0, len(stream), 5):
+        batches += decoder.feed(stream[i:i + 5])
+
+    assert [b.seq for b in batches] == [0, 1]
+    assert decoder.skipped == len(b"boot log\r\n") + 2
+
+
+def test_collect_many_devices(tmp_path):
+    """UDP and TCP devices should land in per-device, per-day columns."""
+    from scripts.collector import Collector, ColumnStore, read_column
+
+    udp_devices = {device: simulated_device(device, [1, 2]) for device in (1, 2)}
+    tcp_devices = {device: simulated_device(device, [1, 2, 1]) for device in (3, 4)}
+
+    async def run():
+        store = ColumnStore(tmp_path)
+        collector = Collector(store, clock=fixed_clock)
+        udp = await collector.start_udp("127.0.0.1", 0)
+        tcp = await collector.start_tcp("127.0.0.1", 0)
+        udp_port = udp.get_extra_info("sockname")[1]
+        tcp_port = tcp.sockets[0].getsockname()[1]
+        loop = asyncio.get_running_loop()
+
+        async def udp_device(payloads):
+            sender, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=("127.0.0.1", udp_port),
+            )
+            for payload in payloads:
+                sender.sendto(payload)
+            sender.close()
+
+        async def tcp_device(payloads):
+            _, writer = await asyncio.open_connection("127.0.0.1", tcp_port)
+            writer.write(b"".join(payloads))
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        await asyncio.gather(
+            *(udp_device(p) for p in udp_devices.values()),
+            *(tcp_device(p) for p in tcp_devices.values()),
+        )
+        for _ in range(100):
+            if collector.messages == 10:
+                break
+            await asyncio.sleep(0.01)
+
+        udp.close()
+        tcp.close()
+        await tcp.wait_closed()
+        store.close()
+        return collector
+
+    collector = asyncio.run(run())
+
+    assert collector.messages == 10
+    assert collector.errors == 0
+    for device in (1, 2, 3, 4):
+        partition = tmp_path / "records" / f"device={device}" / "date=2026-03-01"
+        expected = 2 if device in (1, 2) else 3
+        assert len(read_column(partition / "kind.u8")) == expected
+        assert len(read_column(partition / "received_ms.i64")) == expected
+
+    partition = tmp_path / "records" / "device=3" / "date=2026-03-01"
+    assert list(read_column(partition / "arg.u8")) == [1, 2, 1]
+    assert list(read_column(partition / "seq.u16")) == [0, 1, 2]
+
+
+def test_trace_dump_lines_are_stored(tmp_path):
+    """Trace lines on a telemetry stream should land in the traces table."""
+    from core.trace import TracePhase, TracePoint, Tracer
+    from scripts.collector import Collector, ColumnStore, StreamDecoder, read_column
+
+    tracer = Tracer(capacity=4)
+    tracer.begin(TracePoint.SENSOR, 1)
+    advance_time(30)
+    tracer.end(TracePoint.SENSOR, 1)
+    lines = []
+    tracer.dump(write=lines.append)
+    text = "".join(f"{line}\r\n" for line in lines).encode()
+    payload = simulated_device(7, [1])[0]
+
+    store = ColumnStore(tmp_path)
+    collector = Collector(store, clock=fixed_clock)
+    decoder = StreamDecoder()
+    # Dumped before the first message: held until its device is known
+    collector.store_stream(decoder, decoder.feed(text[:-5]))
+    assert collector.traces == 0
+    collector.store_stream(decoder, decoder.feed(text[-5:] + payload))
+    store.close()
+
+    partition = tmp_path / "traces" / "device=7" / "date=2026-03-01"
+    assert collector.traces == 2
+    assert list(read_column(partition / "point.u8")) == [TracePoint.SENSOR] * 2
+    assert list(read_column(partition / "phase.u8")) == [TracePhase.BEGIN, TracePhase.END]
+    ticks = read_column(partition / "ticks_us.u32")
+    assert ticks[1] - ticks[0] == 30000
+
+
+def test_day_rollover_closes_earlier_files(tmp_path):
+    """Column files of a finished day should not stay open."""
+    from scripts.collector import Collector, ColumnStore
+
+    days = iter([fixed_clock(), datetime(2026, 3, 2, 0, 1, tzinfo=UTC)])
+    store = ColumnStore(tmp_path)
+    collector = Collector(store, clock=lambda: next(days))
+    collector.handle_datagram(simulated_device(1, [1])[0])
+    first_day = list(store._files.values())
+    collector.handle_datagram(simulated_device(1, [1])[0])
+
+    assert all(handle.closed for handle in first_day)
+    assert all("date=2026-03-02" in str(path) for path in store._files)
+    store.close()
@@ -0,0 +1,139 @@
+"""Tests for incremental multi-device deploy."""
+import subprocess
+import threading
+
+import pytest
+
+
+class FakeTransport:
+    """In-memory device filesystem standing in for mpremote."""
+
+    def __init__(self, port: str, barrier: threading.Barrier | None = None):
+        self.port = port
+        self.fs = {}
+        self.dirs = set()
+        self.sessions = 0
+        self.resets = 0
+        self._barrier = barrier
+
+    def read(self, path):
+        if self._barrier is not None:
+            self._barrier.wait()
+        data = self.fs.get(path)
+        return data.decode() if data is not None else None
+
+    def mkdir(self, path):
+        self.dirs.add(path)
+
+    def put(self, files):
+        self.sessions += 1
+        for local, remote in files:
+            self.fs[remote] = local.read_bytes()
+
+    def remove(self, paths):
+        for path in paths:
+            del self.fs[path]
+
+    def reset(self):
+        self.resets += 1
+
+
+@pytest.fixture
+def image(tmp_path):
+    """Small module tree image."""
+    files = {}
+    for name in ("boot.py", "config.py", "core/light.py", "main.py"):
+        path = tmp_path / name.replace("/", "_")
+        path.write_text(f"# {name}\n")
+        files[name] = path
+    return files
+
+
+def test_first_deploy_uploads_everything(image):
+    """A device without manifest should receive the whole image."""
+    from scripts.deploy import MANIFEST_PATH, deploy_device
+
+    device = FakeTransport("/dev/ttyUSB0")
+    result = deploy_device(device, image)
+
+    assert result.ok
+    assert result.uploaded == sorted(image)
+    assert device.dirs == {"core"}
+    assert device.fs["core/light.py"] == b"# core/light.py\n"
+    assert MANIFEST_PATH in device.fs
+    assert device.sessions == 1
+    assert device.resets == 1
+
+
+def test_redeploy_uploads_only_changes(image):
+    """Only modified files should be sent; unchanged devices untouched."""
+    from scripts.deploy import deploy_device
+
+    device = FakeTransport("/dev/ttyUSB0")
+    deploy_device(device, image)
+
+    result = deploy_device(device, image)
+    assert result.uploaded == []
+    assert result.unchanged == 4
+    assert device.sessions == 1
+    assert device.resets == 1
+
+    image["config.py"].write_text("# tuned\n")
+    result = deploy_device(device, image)
+    assert result.uploaded == ["config.py"]
+    assert device.fs["config.py"] == b"# tuned\n"
+
+
+def test_stale_files_are_removed(image):
+    """Files dropped from the image should be deleted from the device."""
+    from scripts.deploy import deploy_device
+
+    device = FakeTransport("/dev/ttyUSB0")
+    deploy_device(device, image)
+
+    del image["core/light.py"]
+    result = deploy_device(device, image)
+
+    assert result.removed == ["core/light.py"]
+    assert "core/light.py" not in device.fs
+
+
+def test_devices_deploy_concurrently(image):
+    """All ports should be in flight at once."""
+    from scripts.deploy import deploy
+
+    # Each read blocks until all three devices are reading
+    barrier = threading.Barrier(3, timeout=5)
+    devices = {}
+
+    def factory(port):
+        devices[port] = FakeTransport(port, barrier)
+        return devices[port]
+
+    ports = ["/dev/ttyUSB0", "/dev/ttyUSB1", "/dev/ttyUSB2"]
+    results = deploy(ports, image, transport_factory=factory)
+
+    assert [result.port for result in results] == ports
+    assert all(result.ok for result in results)
+    assert all(len(device.fs) == 5 for device in devices.values())
+
+
+def test_mpremote_commands_are_chained(image, monkeypatch):
+    """Uploads should run as a single chained mpremote invocation."""
+    from scripts import deploy as deploy_module
+
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append(args)
+        missing = args[-2:] == ["cat", ":.deploy_manifest"]
+        return subprocess.CompletedProcess(args, 1 if missing else 0, stdout="")
+
+    monkeypatch.setattr(deploy_module.subprocess, "run", fake_run)
+    transport = deploy_module.MpremoteTransport("/dev/ttyUSB0")
+    deploy_module.deploy_device(transport, image, reset=False)
+
+    put = [args for args in calls if "cp" in args]
+    assert len(put) == 1
+    assert put[0][:3] == ["mpremote", "connect", "/dev/ttyUSB0"]
+    assert put[0].count("+") == len(image)
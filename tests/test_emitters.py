@@ -0,0 +1,84 @@
+"""Tests for native/viper hot paths and the emitter build flag."""
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import reset_time
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+MARKED = (
+    "main.py",
+    "core/light.py",
+    "core/presence.py",
+    "hardware/sensors/ultrasonic.py",
+    "hardware/sensors/vl53l0x.py",
+)
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_build_applies_selected_emitter():
+    """Markers should become decorators only when an emitter is chosen."""
+    from scripts.build import apply_emitters
+
+    source = (SRC / "hardware/sensors/vl53l0x.py").read_text()
+
+    assert apply_emitters(source, "bytecode") == source
+    native = apply_emitters(source, "native")
+    viper = apply_emitters(source, "viper")
+    assert "@micropython.native\ndef _result_mm(" in native
+    assert "@micropython.viper\ndef _result_mm(" in viper
+    assert "# emit:" not in native + viper
+    compile(viper, "vl53l0x.py", "exec")
+
+
+def test_marked_methods_keep_indentation():
+    """Decorators on methods must stay inside the class body."""
+    from scripts.build import apply_emitters
+
+    source = (SRC / "core/presence.py").read_text()
+    native = apply_emitters(source, "native")
+
+    assert native.count("    @micropython.native\n    def ") == 3
+    compile(native, "presence.py", "exec")
+
+
+def test_benchmark_variants_match_build():
+    """The on-device benchmark must compile what the build would ship."""
+    from scripts.bench_emitters import variant
+    from scripts.build import apply_emitters
+
+    for path in MARKED:
+        source = (SRC / path).read_text()
+        assert "# emit: " in source, path
+        for emit in ("bytecode", "native", "viper"):
+            assert variant(source, emit) == apply_emitters(source, emit), (path, emit)
+
+
+def test_hot_paths_unchanged_under_bytecode():
+    """The extracted helpers should give the same results as before."""
+    from hardware.sensors.ultrasonic import _echo_mm, _echo_scale
+    from hardware.sensors.vl53l0x import _result_mm
+
+    block = bytearray(12)
+    block[10], block[11] = 0x01, 0x2C
+
+    assert _result_mm(block) == 300
+    assert _echo_mm(1746, _echo_scale(29.1)) == 300
+
+
+def test_benchmark_runs_every_case(monkeypatch):
+    """The benchmark should load each module and report every case."""
+    from scripts import bench_emitters
+
+    monkeypatch.chdir(SRC)
+    lines = []
+    results = bench_emitters.run(iterations=20, write=lines.append)
+
+    assert set(results) == {case[0] for case in bench_emitters.CASES}
+    assert all(len(timings) == 3 for timings in results.values())
+    assert len(lines) == len(results) + 1
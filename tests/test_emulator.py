@@ -0,0 +1,118 @@
+"""Tests for the VL53L0X register-level emulator."""
+import errno
+
+import pytest
+
+from tests.conftest import advance_time, reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+@pytest.fixture
+def emulator():
+    """Emulated VL53L0X on the runtime's I2C bus 0."""
+    from scripts.emulator import VL53L0XEmulator
+    from tests.conftest import runtime
+
+    return runtime.attach_i2c(VL53L0XEmulator())
+
+
+def make_sensor(**kwargs):
+    """Create driver on the emulated bus."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    return VL53L0XSensor(sda_pin=8, scl_pin=9, **kwargs)
+
+
+def test_measure_cost(emulator):
+    """Pin the bus traffic and time of one single-shot measurement."""
+    from tests.conftest import runtime
+
+    sensor = make_sensor()
+    emulator.distance_mm = 234
+    emulator.reset_counters()
+    start = runtime.clock.now_us
+
+    assert sensor.measure() == 23.4
+
+    # 1 start + 7 status polls (5ms steps past 33ms) + clear + result block
+    assert emulator.transactions == 10
+    assert emulator.bytes_written == 2
+    assert emulator.bytes_read == 7 + 12
+    # 7 polls of 5ms plus 1.1ms of 400kHz bus time
+    assert runtime.clock.now_us - start == 7 * 5000 + 1101
+    assert emulator.conversions == 1
+
+
+def test_init_does_not_start_ranging(emulator):
+    """Page-1 writes of the init sequence must not trigger a conversion."""
+    make_sensor()
+
+    assert not emulator.ranging
+    assert emulator.conversions == 0
+
+
+def test_bus_error_sets_fault(emulator):
+    """An injected I2C error should fault one measurement only."""
+    sensor = make_sensor()
+
+    emulator.fail_next(code=errno.ETIMEDOUT)
+    assert sensor.measure() == -1.0
+    assert sensor.faulted
+
+    assert sensor.measure() == 50.0
+    assert not sensor.faulted
+
+
+def test_stalled_conversion_times_out(emulator):
+    """A conversion that never completes should fault after the timeout."""
+    from tests.conftest import mock_ticks_ms
+
+    sensor = make_sensor(timeout_ms=100)
+    emulator.stalled = True
+
+    assert sensor.measure() == -1.0
+    assert sensor.faulted
+    assert 100 <= mock_ticks_ms() < 105
+
+
+def test_out_of_range(emulator):
+    """Out-of-range result should read as no target without a fault."""
+    sensor = make_sensor()
+    emulator.distance_mm = emulator.OUT_OF_RANGE_MM
+
+    assert sensor.measure() == -1.0
+    assert not sensor.faulted
+
+
+def test_missing_device_faults_at_init(emulator):
+    """A sensor that does not acknowledge should start faulted."""
+    emulator.present = False
+
+    sensor = make_sensor()
+
+    assert sensor.faulted
+    assert emulator.scan() == []
+
+
+def test_threshold_wake_drives_gpio1(emulator):
+    """Armed timed ranging should pull GPIO1 low only below threshold."""
+    sensor = make_sensor(int_pin=7, wake_period_ms=100)
+    emulator.distance_mm = 1000
+
+    assert sensor.arm_wake(60.0) is not None
+    advance_time(250)
+    assert emulator.gpio1 == 1
+    assert emulator.conversions == 3  # 33, 133, 233ms
+
+    emulator.distance_mm = 400
+    advance_time(100)
+    assert emulator.gpio1 == 0
+
+    sensor.disarm_wake()
+    assert not emulator.ranging
+    assert emulator.gpio1 == 1
@@ -0,0 +1,140 @@
+"""Tests for deferred event queue and dispatcher."""
+from itertools import pairwise
+
+import pytest
+
+from tests.conftest import advance_time, reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_queue_fifo_order():
+    """Events should be popped in posting order."""
+    from core.events import Event, EventQueue
+
+    queue = EventQueue(capacity=4)
+    queue.post(Event.PRESENCE_START)
+    queue.post(Event.PRESENCE_END)
+
+    assert len(queue) == 2
+    assert queue.pop() == Event.PRESENCE_START
+    assert queue.pop() == Event.PRESENCE_END
+    assert queue.pop() == Event.NONE
+
+
+def test_queue_full_drops_new_events():
+    """Posting to a full queue should fail and count the drop."""
+    from core.events import EventQueue
+
+    queue = EventQueue(capacity=2)
+
+    assert queue.post(1)
+    assert queue.post(2)
+    assert not queue.post(3)
+    assert queue.dropped == 1
+    assert queue.pop() == 1
+
+
+def test_queue_wraparound():
+    """Queue should keep working after indices wrap."""
+    from core.events import EventQueue
+
+    queue = EventQueue(capacity=3)
+
+    for i in range(1, 20):
+        queue.post(i)
+        assert queue.pop() == i
+
+    assert len(queue) == 0
+
+
+def test_dispatcher_runs_handlers():
+    """Dispatch should drain queue and call subscribed handlers."""
+    from core.events import Event, EventDispatcher, EventQueue
+
+    calls = []
+    queue = EventQueue()
+    dispatcher = EventDispatcher(queue)
+    dispatcher.subscribe(Event.PRESENCE_START, lambda: calls.append("start"))
+    dispatcher.subscribe(Event.PRESENCE_END, lambda: calls.append("end"))
+
+    queue.post(Event.PRESENCE_START)
+    queue.post(Event.PRESENCE_END)
+
+    assert dispatcher.dispatch() == 2
+    assert calls == ["start", "end"]
+    assert len(queue) == 0
+
+
+def test_dispatcher_limit():
+    """Dispatch limit should leave remaining events queued."""
+    from core.events import EventDispatcher, EventQueue
+
+    queue = EventQueue()
+    dispatcher = EventDispatcher(queue)
+    for _ in range(3):
+        queue.post(1)
+
+    assert dispatcher.dispatch(limit=1) == 1
+    assert len(queue) == 2
+
+
+def test_presence_posts_instead_of_calling():
+    """With a queue, transitions are deferred until dispatch."""
+    from core.events import Event, EventDispatcher, EventQueue
+    from core.presence import PresenceDetector, PresenceState
+
+    activated = []
+    queue = EventQueue()
+    dispatcher = EventDispatcher(queue)
+    dispatcher.subscribe(Event.PRESENCE_START, lambda: activated.append(True))
+
+    detector = PresenceDetector(
+        activation_ms=100,
+        timeout_ms=1000,
+        on_activate=lambda: activated.append("direct"),
+        events=queue,
+    )
+
+    detector.update(presence_detected=True)
+    advance_time(150)
+    detector.update(presence_detected=True)
+
+    assert detector.state == PresenceState.ACTIVE
+    assert not activated
+
+    dispatcher.dispatch()
+    assert activated == [True]
+
+
+def test_fade_never_delays_sampling(monkeypatch):
+    """Samples should stay on their period while the light fades."""
+    from config import LightConfig, PinConfig, TimingConfig
+    from main import MirrorLightApp, MirrorZone, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    sample_ms = []
+    process_sample = MirrorZone.process_sample
+
+    def spy(zone, distance, now=None):
+        sample_ms.append(runtime.clock.now_ms)
+        process_sample(zone, distance, now)
+
+    monkeypatch.setattr(MirrorZone, "process_sample", spy)
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=lambda ms: 250 if 2000 <= ms < 6000 else 2000))
+    app = MirrorLightApp(create_sensor())
+
+    while runtime.clock.now_ms < 15000:
+        app.step()
+
+    gaps = [b - a for a, b in pairwise(sample_ms)]
+    assert max(gaps) <= TimingConfig.POLL_INTERVAL_MS + 5
+    assert app.scheduler.missed == 0
+    # Both fades still ran in visible steps
+    changes = runtime.pwm(PinConfig.LED).changes
+    assert len(changes) > LightConfig.FADE_STEPS
+    assert runtime.pwm(PinConfig.LED).duty == 0
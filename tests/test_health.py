@@ -0,0 +1,117 @@
+"""Tests for sensor fault backoff and recovery."""
+import pytest
+
+from tests.conftest import advance_time, reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def make_sensor():
+    """Create scriptable fake sensor."""
+    from hardware.sensors.base import DistanceSensor
+
+    class FakeSensor(DistanceSensor):
+        def __init__(self):
+            self.broken = False
+            self.measure_calls = 0
+            self.recover_calls = 0
+            self.recover_ok = True
+
+        def measure(self) -> float:
+            self.measure_calls += 1
+            self._faulted = self.broken
+            return -1.0 if self.broken else 20.0
+
+        def recover(self) -> bool:
+            self.recover_calls += 1
+            return self.recover_ok
+
+    return FakeSensor()
+
+
+def test_single_fault_is_degraded():
+    """A fault below threshold should only degrade health."""
+    from hardware.sensors.health import SensorHealth, SensorMonitor
+
+    sensor = make_sensor()
+    monitor = SensorMonitor(sensor, failure_threshold=3)
+
+    sensor.broken = True
+    assert monitor.measure() == -1.0
+    assert monitor.health == SensorHealth.DEGRADED
+
+    sensor.broken = False
+    assert monitor.measure() == 20.0
+    assert monitor.health == SensorHealth.OK
+
+
+def test_threshold_enters_backoff():
+    """Consecutive faults should stop hitting the sensor."""
+    from hardware.sensors.health import SensorHealth, SensorMonitor
+
+    sensor = make_sensor()
+    sensor.broken = True
+    monitor = SensorMonitor(sensor, failure_threshold=2, backoff_min_ms=500)
+
+    monitor.measure()
+    monitor.measure()
+    assert monitor.health == SensorHealth.FAILED
+    assert sensor.measure_calls == 2
+
+    for _ in range(10):
+        assert monitor.measure() == -1.0
+    assert sensor.measure_calls == 2
+    assert sensor.recover_calls == 0
+
+
+def test_backoff_doubles_until_recovered():
+    """Failed recovery attempts should double the retry delay."""
+    from hardware.sensors.health import SensorHealth, SensorMonitor
+
+    sensor = make_sensor()
+    sensor.broken = True
+    monitor = SensorMonitor(
+        sensor, failure_threshold=1, backoff_min_ms=100, backoff_max_ms=300,
+    )
+
+    monitor.measure()
+    assert monitor.health == SensorHealth.FAILED
+
+    advance_time(100)
+    monitor.measure()
+    assert sensor.recover_calls == 1
+
+    advance_time(100)
+    monitor.measure()
+    assert sensor.recover_calls == 1
+
+    advance_time(100)
+    monitor.measure()
+    assert sensor.recover_calls == 2
+
+    sensor.broken = False
+    advance_time(300)
+    assert monitor.measure() == 20.0
+    assert monitor.health == SensorHealth.OK
+    assert monitor.consecutive_failures == 0
+
+
+def test_failed_recover_skips_measure():
+    """A recover() that fails should not spend a measurement."""
+    from hardware.sensors.health import SensorMonitor
+
+    sensor = make_sensor()
+    sensor.broken = True
+    sensor.recover_ok = False
+    monitor = SensorMonitor(sensor, failure_threshold=1, backoff_min_ms=100)
+
+    monitor.measure()
+    advance_time(100)
+    monitor.measure()
+
+    assert sensor.recover_calls == 1
+    assert sensor.measure_calls == 1
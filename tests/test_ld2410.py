@@ -0,0 +1,181 @@
+"""Tests for the LD2410 mmWave radar driver and its frame parser."""
+import tracemalloc
+
+import pytest
+
+from tests.conftest import advance_time, reset_time, runtime
+
+# Console capture of a radar at 256000 baud: the tail of a cut-off
+# frame, a command ACK, two basic reports and a frame with a bad tail.
+RECORDED = bytes.fromhex(
+    "0055 00f8 f7f6 f5"                                      # Cut-off frame tail
+    "fdfc fbfa 0400 ff01 0000 0403 0201"                     # Command ACK
+    "f4f3 f2f1 0d00 02aa 0251 0000 7800 3b78 0055 00f8 f7f6 f5"  # Still at 120cm
+    "f4f3 f2f1 0d00 02aa 0350 0050 6e00 3250 0055 00f8 f7f6 f5"  # Moving 80, still 110
+    "f4f3 f2f1 0d00 02aa 0000 0000 0000 0000 0055 00f8 f7f6 00"  # Corrupted tail
+)
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_recorded_stream_decodes_reports():
+    """Reports should be decoded and noise skipped."""
+    from hardware.sensors.ld2410 import LD2410Parser, TargetState
+
+    parser = LD2410Parser()
+
+    assert parser.feed(RECORDED) == 2
+    assert parser.state == TargetState.BOTH
+    assert (parser.moving_cm, parser.moving_energy) == (80, 80)
+    assert (parser.still_cm, parser.still_energy) == (110, 50)
+    assert parser.detect_cm == 80
+    assert parser.errors == 1
+    assert len(parser) <= 3
+
+
+def test_split_reads_match_one_chunk():
+    """Frames cut at any byte boundary should decode the same."""
+    from hardware.sensors.ld2410 import LD2410Parser
+    from scripts.emulator import report_frame
+
+    stream = report_frame(2, still_cm=95, still_energy=30)
+    stream += report_frame(1, moving_cm=140, moving_energy=70, engineering=True)
+
+    for chunk in (1, 2, 7, 23):
+        parser = LD2410Parser(capacity=48)
+        decoded = sum(
+            parser.feed(stream[i:i + chunk]) for i in range(0, len(stream), chunk)
+        )
+        assert decoded == 2, chunk
+        assert (parser.state, parser.moving_cm) == (1, 140), chunk
+        assert parser.errors == 0
+
+
+def test_garbage_never_fills_the_buffer():
+    """A stream without frames should be dropped, keeping a header prefix."""
+    from hardware.sensors.ld2410 import LD2410Parser
+    from scripts.emulator import report_frame
+
+    parser = LD2410Parser(capacity=48)
+    parser.feed(bytes(range(200)) + b"\xf4\xf3")
+    assert len(parser) == 3
+
+    assert parser.feed(report_frame(2, still_cm=60)[2:]) == 1
+    assert parser.still_cm == 60
+
+
+def test_parser_does_not_allocate():
+    """Receiving and parsing through space()/commit() must not retain memory."""
+    from hardware.sensors.ld2410 import LD2410Parser
+    from scripts.emulator import report_frame
+
+    parser = LD2410Parser()
+    frame = report_frame(2, still_cm=120, still_energy=40)
+    parser.feed(frame)  # Warm-up
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(50):
+            for byte in frame:
+                parser.space()[0] = byte
+                parser.commit(1)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    only_parser = [tracemalloc.Filter(True, "*/sensors/ld2410.py")]
+    stats = after.filter_traces(only_parser).compare_to(
+        before.filter_traces(only_parser), "lineno",
+    )
+    assert sum(stat.count_diff for stat in stats if stat.count_diff > 0) == 0
+    assert parser.frames == 51
+
+
+def test_driver_reports_distance_and_presence():
+    """The driver should expose the nearest target and a presence flag."""
+    from hardware.sensors.ld2410 import LD2410Sensor
+    from scripts.emulator import LD2410Emulator
+
+    radar = runtime.attach_uart(LD2410Emulator(distance_cm=120), uart_id=2)
+    sensor = LD2410Sensor(tx_pin=17, rx_pin=16, uart_id=2, range_cm=150)
+
+    advance_time(100)
+    assert sensor.measure_mm() == 1200
+    assert sensor.presence
+    assert sensor.measure() == 120.0
+
+    radar.distance_cm = 200  # Beyond range_cm
+    advance_time(100)
+    assert sensor.measure_mm() == -1
+    assert not sensor.presence
+    assert not sensor.faulted
+
+    radar.distance_cm = None
+    advance_time(100)
+    assert sensor.measure_mm() == -1
+    assert not sensor.faulted
+
+
+def test_silent_uart_is_a_fault():
+    """No reports within stale_ms should fault until reports resume."""
+    from hardware.sensors.ld2410 import LD2410Sensor
+    from scripts.emulator import LD2410Emulator
+
+    sensor = LD2410Sensor(tx_pin=17, rx_pin=16, uart_id=2, stale_ms=500)
+
+    advance_time(500)
+    assert sensor.measure_mm() == -1
+    assert sensor.faulted
+    assert not sensor.recover()
+
+    runtime.attach_uart(LD2410Emulator(distance_cm=90, moving=True), uart_id=2)
+    advance_time(100)
+    assert sensor.recover()
+    assert sensor.measure_mm() == 900
+    assert not sensor.faulted
+
+
+def test_app_keeps_light_on_for_still_person(monkeypatch):
+    """A still person beyond the ToF range should hold the light on."""
+    from config import SensorConfig, TimingConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import LD2410Emulator
+
+    monkeypatch.setattr(SensorConfig, "SENSOR_TYPE", "ld2410")
+    runtime.attach_uart(
+        LD2410Emulator(distance_cm=lambda ms: 110 if 2000 <= ms < 60000 else None),
+        uart_id=2,
+    )
+    app = MirrorLightApp(create_sensor())
+
+    while runtime.clock.now_ms < 30000:
+        app.step()
+    assert app.zones[0].light.is_on
+
+    while runtime.clock.now_ms < 60000 + TimingConfig.MAX_TIMEOUT_MS + 2000:
+        app.step()
+    assert not app.zones[0].light.is_on
+
+
+def test_app_does_not_light_sleep_over_the_stream(monkeypatch):
+    """Light sleep would drop radar frames; the app should poll awake."""
+    from config import PowerConfig, SensorConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import LD2410Emulator
+
+    monkeypatch.setattr(SensorConfig, "SENSOR_TYPE", "ld2410")
+    monkeypatch.setattr(PowerConfig, "USE_LIGHT_SLEEP", True)
+    runtime.attach_uart(LD2410Emulator(distance_cm=110), uart_id=2)
+    app = MirrorLightApp(create_sensor())
+
+    while runtime.clock.now_ms < 10000:
+        app.step()
+    assert runtime.light_sleeps == 0
+    assert runtime.uart(2).lost == 0
+    assert app.zones[0].sensor.health == "ok"
+    assert app.zones[0].light.is_on
@@ -0,0 +1,138 @@
+"""Tests for light fades and distance-tracking brightness."""
+import pytest
+
+from tests.conftest import advance_time, reset_time, runtime
+
+FULL = 65535
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def make_light(**kwargs):
+    """Create light on GPIO4 with a short fade."""
+    from core.light import LightController
+
+    return LightController(pin=4, fade_duration_ms=100, fade_steps=10, **kwargs)
+
+
+def finish_fade(light, period_ms=10):
+    """Step a running fade until it completes."""
+    while light.fading:
+        advance_time(period_ms)
+        light.update()
+
+
+def run_updates(light, duration_ms, period_ms):
+    """Call update() every period for duration."""
+    for _ in range(duration_ms // period_ms):
+        advance_time(period_ms)
+        light.update()
+
+
+def test_tracking_slews_towards_target():
+    """Brightness should move at the configured rate, not jump."""
+    light = make_light(slew_percent_per_s=50)
+    light.on()
+    finish_fade(light)
+
+    light.track(50)
+    run_updates(light, 500, 100)
+    assert runtime.pwm(4).duty == FULL - 5 * (FULL // 2 * 100 // 1000)
+
+    run_updates(light, 1000, 100)
+    assert abs(runtime.pwm(4).duty - FULL // 2) < FULL // 50  # Within dead band
+
+
+def test_imperceptible_changes_are_not_written():
+    """Targets within the dead band should cost no PWM writes."""
+    light = make_light(min_step_percent=2)
+    light.on()
+    finish_fade(light)
+    writes = runtime.pwm(4).writes
+
+    light.track(99)
+    run_updates(light, 1000, 100)
+
+    assert runtime.pwm(4).writes == writes
+    assert runtime.pwm(4).duty == FULL
+
+
+def test_frequent_updates_are_coalesced():
+    """Fast update calls should batch slew into visible steps."""
+    light = make_light(slew_percent_per_s=50, min_step_percent=2)
+    light.on()
+    finish_fade(light)
+    writes = runtime.pwm(4).writes
+
+    light.track(0)
+    run_updates(light, 1000, 10)
+
+    # 50% over 1s in 2% steps, not one write per 10ms call
+    assert runtime.pwm(4).writes - writes == 25
+    assert runtime.pwm(4).duty < FULL // 2 + FULL // 50
+
+
+def test_fade_in_goes_to_tracked_level():
+    """on() should fade to the tracked brightness, not full."""
+    light = make_light()
+    light.track(40)
+    assert not light.update()
+
+    light.on()
+    finish_fade(light)
+
+    assert runtime.pwm(4).duty == FULL * 40 // 100
+
+
+def test_fade_does_not_block():
+    """on() should return at once and update() step the fade over time."""
+    light = make_light()
+
+    light.on()
+    assert light.is_on and light.fading
+    assert runtime.clock.now_ms == 0
+
+    advance_time(50)
+    light.update()
+    assert runtime.pwm(4).duty == FULL * 5 // 10  # Step 5 of 10
+    finish_fade(light)
+    assert runtime.pwm(4).duty == FULL
+    assert runtime.clock.now_ms == 100
+
+    light.off()
+    light.on()  # Reversed mid-fade: starts from the current level
+    assert runtime.pwm(4).duty == FULL
+
+
+def test_app_dims_with_distance(monkeypatch):
+    """The app should brighten as the user comes closer."""
+    from config import LightConfig, PinConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    monkeypatch.setattr(LightConfig, "TRACK_DISTANCE", True)
+
+    def scene(now_ms):
+        if now_ms < 5000:
+            return 350  # Standing back: dim
+        return 100      # Leaning in: full
+
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=scene))
+    app = MirrorLightApp(create_sensor())
+
+    while runtime.clock.now_ms < 5000:
+        app.step()
+    trace = runtime.pwm(PinConfig.LED)
+    dimmed = trace.duty
+    writes = trace.writes
+
+    while runtime.clock.now_ms < 10000:
+        app.step()
+
+    assert dimmed < FULL * 60 // 100
+    assert trace.duty == FULL
+    assert trace.writes - writes < 20  # 50 samples, slewed in visible steps
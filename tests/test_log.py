@@ -0,0 +1,123 @@
+"""Tests for the ring-buffered logger."""
+import tracemalloc
+
+import pytest
+
+from tests.conftest import advance_time, reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_records_are_formatted_on_flush():
+    """Text should only be produced by flush(), oldest first."""
+    from core.log import Logger, LogMessage
+
+    log = Logger(capacity=4)
+    log.info(LogMessage.LIGHT_ON)
+    advance_time(1500)
+    log.warning(LogMessage.SENSOR_HEALTH, obj="degraded")
+
+    lines = []
+    assert log.flush(write=lines.append) == 2
+
+    assert lines == [
+        "       0 I Light ON - presence confirmed (zone 0)",
+        "    1500 W Sensor health: degraded (zone 0)",
+    ]
+    assert len(log) == 0
+
+
+def test_level_filter_and_flush_limit():
+    """Records below the level are skipped; limit bounds one flush."""
+    from core.log import Logger, LogLevel, LogMessage
+
+    log = Logger(capacity=8, level=LogLevel.INFO)
+    log.debug(LogMessage.WAKE_ARMED, 120)
+    log.info(LogMessage.CONFIG_TIMEOUT, 5000)
+    log.info(LogMessage.CONFIG_RANGE, 2, 100)
+
+    lines = []
+    assert log.flush(limit=1, write=lines.append) == 1
+    assert log.flush(write=lines.append) == 1
+    assert [line[11:] for line in lines] == ["  Timeout:     5000ms", "  Range:       2-100cm"]
+
+
+def test_full_ring_overwrites_oldest():
+    """A full ring should keep the newest records."""
+    from core.log import Logger, LogMessage
+
+    log = Logger(capacity=3)
+    for ms in range(5):
+        log.info(LogMessage.CONFIG_ACTIVATION, ms)
+
+    lines = []
+    log.flush(write=lines.append)
+
+    assert log.dropped == 2
+    assert [line.split()[-1] for line in lines] == ["2ms", "3ms", "4ms"]
+
+
+def test_logging_does_not_allocate():
+    """Recording must not retain memory in the hot path."""
+    from core.log import Logger, LogMessage
+
+    log = Logger(capacity=16)
+    health = "ok"
+    log.info(LogMessage.SENSOR_HEALTH, obj=health)  # Warm-up
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for ms in range(200):
+            log.info(LogMessage.FIRST_SAMPLE, ms, obj=health)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    only_log = [tracemalloc.Filter(True, "*/core/log.py")]
+    stats = after.filter_traces(only_log).compare_to(before.filter_traces(only_log), "lineno")
+    assert sum(stat.count_diff for stat in stats if stat.count_diff > 0) == 0
+
+
+def test_build_strips_debug_calls():
+    """Production builds should compile debug logging out."""
+    from scripts.build import strip_debug_logs
+
+    source = (
+        "def sleep(self):\n"
+        "    if armed:\n"
+        "        self._log.debug(LogMessage.WAKE_ARMED, 120)\n"
+        "    self._log.info(LogMessage.LIGHT_ON)\n"
+    )
+    stripped = strip_debug_logs(source)
+
+    compile(stripped, "main.py", "exec")
+    assert "debug" not in stripped
+    assert "self._log.info(LogMessage.LIGHT_ON)" in stripped
+
+
+def test_app_flushes_in_idle_window(capsys):
+    """Presence messages should reach the console once the room is empty."""
+    from hardware.sensors.base import DistanceSensor
+    from main import MirrorLightApp
+    from tests.conftest import mock_ticks_ms
+
+    class ScriptedSensor(DistanceSensor):
+        def measure(self) -> float:
+            return 30.0 if mock_ticks_ms() < 3000 else 200.0
+
+    app = MirrorLightApp(ScriptedSensor())
+    while mock_ticks_ms() < 3000:
+        app.step()
+    assert "Light ON" not in capsys.readouterr().out
+
+    while mock_ticks_ms() < 60000:
+        app.step()
+
+    output = capsys.readouterr().out
+    assert "I Light ON - presence confirmed" in output
+    assert "I Light OFF - presence timeout" in output
@@ -0,0 +1,169 @@
+"""Tests for allocation-free main loop and GC policy."""
+import fnmatch
+import gc
+import linecache
+import sys
+import tracemalloc
+
+import pytest
+
+from tests.conftest import reset_time
+
+SRC = "*/src/*"
+SRC_ONLY = [tracemalloc.Filter(True, SRC)]
+FLOAT_FREE_LIST = 100  # CPython 3.11 PyFloat_MAXFREELIST
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def make_app(distances, conversion_ms=0):
+    """Create app with scripted sensor."""
+    from hardware.sensors.base import DistanceSensor
+    from main import MirrorLightApp
+
+    class ScriptedSensor(DistanceSensor):
+        def __init__(self):
+            self._index = 0
+
+        def measure_mm(self) -> int:
+            self._index = (self._index + 1) % len(distances)
+            return distances[self._index]
+
+    ScriptedSensor.conversion_ms = conversion_ms
+    return MirrorLightApp(ScriptedSensor())
+
+
+def traced_size(make) -> int:
+    """Return the bytes tracemalloc records for the object make() returns."""
+    tracemalloc.start()
+    try:
+        value = make()  # noqa: F841 - held while measuring
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def allocated_per_step(app, steps):
+    """
+    Return the most src/ blocks alive at once during any single step.
+
+    tracemalloc restarts for every step and is snapshotted at each src/
+    line, at each return and after each builtin called from src/.
+    Temporaries freed before the step ends are therefore counted, as
+    well as memory the step keeps.
+
+    Blocks CPython allocates where MicroPython does not are skipped:
+    - ints below 2**30, which are small ints on MicroPython;
+    - for-loop iterators, which MicroPython keeps on the stack;
+    - frame objects created by the tracing itself (def lines).
+    Floats are heap objects on MicroPython, so the float free list is
+    emptied before each step: every float src/ creates is then a new
+    block. Short tuples still come from CPython free lists unseen.
+    """
+    small_int = traced_size(lambda: (1 << 29) + len(str(steps)))
+    def_lines = set()
+    worst = 0
+
+    def cpython_only(block) -> bool:
+        frame = block.traceback[0]
+        if block.size == small_int or (frame.filename, frame.lineno) in def_lines:
+            return True
+        return linecache.getline(frame.filename, frame.lineno).lstrip().startswith("for ")
+
+    def count(frame) -> bool:
+        nonlocal worst
+        code = frame.f_code
+        if not fnmatch.fnmatch(code.co_filename, SRC):
+            return False
+        def_lines.add((code.co_filename, code.co_firstlineno))
+        snapshot = tracemalloc.take_snapshot().filter_traces(SRC_ONLY)
+        blocks = sum(1 for block in snapshot.traces if not cpython_only(block))
+        worst = max(worst, blocks)
+        return True
+
+    def on_line(frame, event, arg):
+        return on_line if count(frame) else None
+
+    def on_call(frame, event, arg):
+        if event == "c_return":
+            count(frame)
+
+    gc.collect()
+    for _ in range(steps):
+        floats = [i + 0.5 for i in range(FLOAT_FREE_LIST)]  # noqa: F841 - drains it
+        tracemalloc.start()
+        sys.settrace(on_line)
+        sys.setprofile(on_call)
+        try:
+            app.step()
+        finally:
+            sys.setprofile(None)
+            sys.settrace(None)
+            tracemalloc.stop()
+    return worst
+
+
+def test_idle_loop_is_allocation_free():
+    """Empty-room iterations should not allocate."""
+    app = make_app([-1, 1200])
+
+    for _ in range(10):
+        app.step()
+
+    assert allocated_per_step(app, 100) == 0
+
+
+def test_presence_loop_is_allocation_free():
+    """Sustained presence should not allocate once active."""
+    app = make_app([200, 210])
+
+    for _ in range(30):
+        app.step()
+
+    assert allocated_per_step(app, 100) == 0
+
+
+def test_allocation_probe_sees_transient_blocks():
+    """A str allocated and dropped within a step should be counted."""
+    app = make_app([200, 210], conversion_ms=1)
+    app._conversion_wait = hex  # Formats a str per sample, dropped at once
+
+    for _ in range(30):
+        app.step()
+
+    assert allocated_per_step(app, 10) > 0
+
+
+def test_allocation_probe_sees_floats():
+    """A float created and dropped within a step should be counted."""
+    app = make_app([200, 210], conversion_ms=1)
+    app._conversion_wait = float  # Returns a float per sample, dropped at once
+
+    for _ in range(30):
+        app.step()
+    [i + 0.5 for i in range(200)]  # Refill the float free list
+
+    assert allocated_per_step(app, 10) > 0
+
+def test_gc_policy_idle_collects_after_budget(monkeypatch):
+    """Idle window should collect only once the budget is exceeded."""
+    from core import memory
+    from core.memory import GCPolicy
+
+    allocated = [1000]
+    monkeypatch.setattr(memory, "_mem_alloc", lambda: allocated[0])
+
+    policy = GCPolicy(threshold_bytes=0, idle_collect_bytes=500)
+    policy.configure()
+
+    allocated[0] += 400
+    assert not policy.idle()
+
+    allocated[0] += 200
+    assert policy.idle()
+    assert policy.collections == 1
+    assert not policy.idle()
@@ -0,0 +1,108 @@
+"""Tests for the integer-millimetre distance pipeline."""
+import pytest
+
+from tests.conftest import reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_drivers_measure_whole_millimetres():
+    """Drivers should return ints in mm and keep the cm view."""
+    from hardware.sensors.ultrasonic import UltrasonicSensor
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+    from scripts.emulator import VL53L0XEmulator
+
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=234))
+    tof = VL53L0XSensor(sda_pin=8, scl_pin=9)
+    echo = UltrasonicSensor(trigger_pin=13, echo_pin=12)
+    runtime.pin(12).pulse_us = 1164
+
+    assert type(tof.measure_mm()) is int
+    assert tof.measure_mm() == 234
+    assert tof.measure() == 23.4
+    assert type(echo.measure_mm()) is int
+    assert echo.measure_mm() == 200
+    assert echo.measure() == 20.0
+
+    runtime.pin(12).pulse_us = None
+    assert echo.measure_mm() == -1
+    assert echo.measure() == -1.0
+
+
+def test_cm_driver_is_rounded_to_millimetres():
+    """A driver written in cm should still feed the mm pipeline."""
+    from hardware.sensors.base import DistanceSensor
+
+    class CentimetreSensor(DistanceSensor):
+        value = 12.36
+
+        def measure(self) -> float:
+            return self.value
+
+    sensor = CentimetreSensor()
+    assert sensor.measure_mm() == 124
+    assert sensor.read_mm() == 124
+    assert sensor.read() == 12.4
+
+    sensor.value = -1.0
+    assert sensor.measure_mm() == -1
+
+
+def test_driver_without_measure_is_rejected():
+    """A driver implementing neither measure method should not instantiate."""
+    from hardware.sensors.base import DistanceSensor
+
+    class SilentSensor(DistanceSensor):
+        pass
+
+    with pytest.raises(TypeError, match="SilentSensor"):
+        SilentSensor()
+
+
+def test_zone_thresholds_match_config():
+    """Integer thresholds should give the same decisions as the cm config."""
+    from config import SensorConfig
+    from hardware.sensors.base import DistanceSensor
+    from main import MirrorLightApp
+
+    class EmptyRoom(DistanceSensor):
+        def measure_mm(self) -> int:
+            return 2000
+
+    zone = MirrorLightApp(EmptyRoom()).zones[0]
+    low = round(SensorConfig.MIN_DISTANCE_CM * 10)
+    high = round(SensorConfig.MAX_DISTANCE_CM * 10)
+
+    assert not zone._is_presence(-1)
+    assert not zone._is_presence(low - 1)
+    assert zone._is_presence(low)
+    assert zone._is_presence(high - 1)
+    assert not zone._is_presence(high)
+
+
+def test_app_pipeline_carries_ints(monkeypatch):
+    """Samples should reach tracking and the FSM as ints."""
+    from main import MirrorLightApp, MirrorZone, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    samples = []
+    process_sample = MirrorZone.process_sample
+
+    def spy(zone, distance, now=None):
+        samples.append(distance)
+        process_sample(zone, distance, now)
+
+    monkeypatch.setattr(MirrorZone, "process_sample", spy)
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=lambda ms: 2000 - ms // 2))
+    app = MirrorLightApp(create_sensor())
+    for _ in range(20):
+        app.step()
+
+    assert samples and all(type(sample) is int for sample in samples)
+    tracker = app.zones[0].tracker
+    assert type(tracker.position) is int
+    assert type(tracker.velocity) is int
@@ -0,0 +1,167 @@
+"""Tests for PIR wake with ToF presence confirmation."""
+import pytest
+
+from tests.conftest import reset_time, runtime
+
+PIR = 27
+XSHUT = 10
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+@pytest.fixture
+def pir_app(monkeypatch):
+    """App factory with PIR wake and a switchable VL53L0X."""
+    from config import PinConfig, PowerConfig
+
+    monkeypatch.setattr(PowerConfig, "USE_PIR_WAKE", True)
+    monkeypatch.setattr(PinConfig, "PIR", PIR)
+    monkeypatch.setattr(PinConfig, "SENSOR_POWER", XSHUT)
+
+    def create(distance_mm):
+        from main import MirrorLightApp, create_sensor
+        from scripts.emulator import VL53L0XEmulator
+
+        emulator = runtime.attach_i2c(VL53L0XEmulator(distance_mm=distance_mm))
+        xshut = runtime.pin(XSHUT)
+        xshut.pull = runtime.machine.Pin.PULL_UP
+        xshut.watch(emulator.set_xshut)
+        return MirrorLightApp(create_sensor()), emulator
+
+    return create
+
+
+def motion(start_ms: int, end_ms: int) -> None:
+    """Drive the PIR output high between start_ms and end_ms."""
+    pin = runtime.pin(PIR)
+    runtime.clock.call_at(start_ms * 1000, lambda: pin.drive(1))
+    runtime.clock.call_at(end_ms * 1000, lambda: pin.drive(0))
+
+
+def probe_at(ms: int, read) -> list:
+    """Record read() at ms of virtual time (also mid-sleep)."""
+    values = []
+    runtime.clock.call_at(ms * 1000, lambda: values.append(read()))
+    return values
+
+
+def run_until(app, ms: int) -> None:
+    while runtime.clock.now_ms < ms:
+        app.step()
+
+
+def test_sleep_until_high_level():
+    """sleep_until() should wake on an active-high pin."""
+    from machine import Pin
+
+    from core.power import PowerManager
+
+    motion(700, 900)
+    pin = Pin(PIR, Pin.IN)
+
+    assert PowerManager(use_light_sleep=True).sleep_until(pin, 10000, level=1)
+    assert 700 <= runtime.clock.now_ms <= 702
+    runtime.advance(300)  # Motion over
+    assert not PowerManager(use_light_sleep=False).sleep_until(pin, 500, level=1)
+
+
+def test_empty_room_sleeps_with_sensor_off(pir_app):
+    """Without motion the sensor should be off and the CPU in light sleep."""
+    from config import PowerConfig
+
+    app, emulator = pir_app(distance_mm=2000)
+    start = probe_at(PowerConfig.PIR_CONFIRM_MS + 1000, lambda: emulator.transactions)
+    end = probe_at(50000, lambda: (emulator.transactions, emulator.powered))
+
+    run_until(app, 55000)
+    assert end == [(start[0], False)]
+    assert runtime.light_sleep_us > 50000 * 1000
+
+
+def test_ranging_keeps_light_on_for_still_person(pir_app):
+    """ToF should hold presence after the PIR stops seeing motion."""
+    from config import TimingConfig
+
+    motion(20000, 22000)  # Walks in, then stands still at the mirror
+    app, emulator = pir_app(
+        distance_mm=lambda ms: 250 if 20000 <= ms < 80000 else 2000,
+    )
+    before = probe_at(19000, lambda: emulator.powered)
+
+    run_until(app, 60000)
+    assert before == [False]
+    assert app.zones[0].light.is_on
+    assert emulator.powered
+
+    # Light off, then back to PIR-only idle
+    after = probe_at(80000 + TimingConfig.MAX_TIMEOUT_MS + 2000, lambda: emulator.powered)
+    run_until(app, 80000 + TimingConfig.MAX_TIMEOUT_MS + 3000)
+    assert not app.zones[0].light.is_on
+    assert after == [False]
+
+
+def test_pir_motion_extends_ranging(pir_app):
+    """Ranging should continue while the PIR sees motion out of range."""
+    from config import PowerConfig
+
+    motion(10000, 20000)  # Moving around beyond MAX_DISTANCE_CM
+    app, emulator = pir_app(distance_mm=2000)
+    during = probe_at(19000, lambda: emulator.powered)
+    after = probe_at(20000 + PowerConfig.PIR_CONFIRM_MS + 1000, lambda: emulator.powered)
+
+    run_until(app, 30000)
+    assert during == [True]
+    assert after == [False]
+    assert not app.zones[0].light.is_on
+
+
+def test_deep_sleep_until_pir(pir_app, monkeypatch):
+    """PIR_DEEP_SLEEP should arm ext0 on the PIR and deep-sleep."""
+    from config import PowerConfig
+    from scripts.emulator.runtime import DeepSleep
+
+    monkeypatch.setattr(PowerConfig, "PIR_DEEP_SLEEP", True)
+    app, emulator = pir_app(distance_mm=2000)
+
+    with pytest.raises(DeepSleep):
+        run_until(app, PowerConfig.PIR_CONFIRM_MS + 1000)
+    assert runtime.deep_sleeps == 1
+    assert runtime._ext0 == (runtime.pin(PIR), 1)
+    # XSHUT is pulled up: only the hold keeps the sensor off
+    assert runtime.pin(XSHUT).held == 0
+    assert not emulator.powered
+
+
+def test_boot_after_deep_sleep_releases_power_hold(pir_app, monkeypatch):
+    """The sensor should power up again on the boot the PIR wakes."""
+    from config import PowerConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator.runtime import DeepSleep
+
+    monkeypatch.setattr(PowerConfig, "PIR_DEEP_SLEEP", True)
+    app, emulator = pir_app(distance_mm=2000)
+    with pytest.raises(DeepSleep):
+        run_until(app, PowerConfig.PIR_CONFIRM_MS + 1000)
+
+    runtime.pin(PIR).drive(1)  # Wake: reboot into a fresh app
+    app = MirrorLightApp(create_sensor())
+    app.step()
+    assert runtime.pin(XSHUT).held is None
+    assert emulator.powered
+    assert app.zones[0].sensor.health == "ok"
+
+
+def test_pir_wake_without_power_pin_warns(pir_app, monkeypatch, capsys):
+    """PIR mode cannot switch the sensor off without a power pin."""
+    from config import PinConfig
+
+    monkeypatch.setattr(PinConfig, "SENSOR_POWER", None)
+    app, _ = pir_app(distance_mm=2000)
+    app.step()
+    app.log.flush()
+
+    assert "W PIR wake without a sensor power pin" in capsys.readouterr().out
@@ -0,0 +1,99 @@
+"""Tests for power management and threshold wake."""
+import pytest
+
+from tests.conftest import reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+class FakePin:
+    """Input pin that goes low after a number of reads."""
+
+    def __init__(self, low_after: int = -1):
+        self._reads = 0
+        self._low_after = low_after
+
+    def value(self):
+        self._reads += 1
+        if self._low_after < 0:
+            return 1
+        return 0 if self._reads > self._low_after else 1
+
+
+class RecordingI2C:
+    """I2C stub that records register writes."""
+
+    def __init__(self):
+        self.writes = {}
+
+    def writeto_mem(self, address, reg, data):
+        self.writes[reg] = bytes(data)
+
+    def readfrom_mem(self, address, reg, length):
+        return bytes(length)
+
+    def readfrom_mem_into(self, address, reg, buf):
+        buf[0] = 0x10 if reg == 0x84 else 0
+
+
+def test_sleep_until_pin_wakes_early():
+    """Pin going low should end the sleep before the timeout."""
+    from core.power import PowerManager
+
+    power = PowerManager(use_light_sleep=False, pin_poll_ms=100)
+
+    assert power.sleep_until(FakePin(low_after=3), timeout_ms=10000)
+
+
+def test_sleep_until_times_out():
+    """Pin staying high should return after the timeout."""
+    from core.power import PowerManager
+    from tests.conftest import mock_ticks_ms
+
+    power = PowerManager(use_light_sleep=False, pin_poll_ms=100)
+
+    assert not power.sleep_until(FakePin(), timeout_ms=1000)
+    assert mock_ticks_ms() == 1000
+
+
+def test_sleep_until_pin_already_low():
+    """An already asserted pin should not sleep at all."""
+    from core.power import PowerManager
+    from tests.conftest import mock_ticks_ms
+
+    power = PowerManager(use_light_sleep=False)
+
+    assert power.sleep_until(FakePin(low_after=0), timeout_ms=1000)
+    assert mock_ticks_ms() == 0
+
+
+def test_vl53l0x_arm_wake_programs_threshold():
+    """Arming should set threshold, GPIO function and timed mode."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9, int_pin=7)
+    i2c = RecordingI2C()
+    sensor._i2c = i2c
+
+    assert sensor.arm_wake(60.0) is not None
+    assert i2c.writes[0x0E] == (300).to_bytes(2, "big")  # 600mm / 2mm units
+    assert i2c.writes[0x0A] == b"\x01"
+    assert i2c.writes[0x84] == b"\x00"
+    assert i2c.writes[0x00] == b"\x04"
+
+    sensor.disarm_wake()
+    assert i2c.writes[0x00] == b"\x01"
+    assert i2c.writes[0x0A] == b"\x04"
+
+
+def test_vl53l0x_without_int_pin_cannot_arm():
+    """Without a wired interrupt, arm_wake should be unsupported."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9)
+
+    assert sensor.arm_wake(60.0) is None
@@ -0,0 +1,126 @@
+"""Tests for the virtual MicroPython runtime."""
+import pytest
+
+from tests.conftest import advance_time, reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_ticks_wrap_like_micropython():
+    """Raw ticks wrap; ticks_diff must still see elapsed time."""
+    from time import ticks_diff, ticks_us
+
+    runtime.clock.now_us = (1 << 30) - 500
+    start = ticks_us()
+    advance_time(1)
+
+    assert ticks_us() < start
+    assert ticks_diff(ticks_us(), start) == 1000
+
+
+def test_timer_mode_scheduler_follows_timer():
+    """Timer ticks delivered via micropython.schedule should pace wait()."""
+    from core.power import PowerManager
+    from core.scheduler import SampleScheduler
+    from tests.conftest import mock_ticks_ms
+
+    scheduler = SampleScheduler(100, PowerManager(use_light_sleep=False), timer_id=0)
+
+    starts = []
+    for _ in range(3):
+        advance_time(30)  # Work
+        scheduler.wait()
+        starts.append(mock_ticks_ms())
+    scheduler.deinit()
+
+    assert starts == [100, 200, 300]
+    assert scheduler.missed == 0
+
+
+def test_pin_irq_fires_on_edge():
+    """Externally driven edges should call the handler for its trigger."""
+    from machine import Pin
+
+    edges = []
+    pin = Pin(5, Pin.IN, Pin.PULL_UP)
+    pin.irq(handler=edges.append, trigger=Pin.IRQ_FALLING)
+
+    assert pin.value() == 1
+    runtime.pin(5).drive(0)
+    runtime.pin(5).drive(1)
+
+    assert len(edges) == 1
+    assert pin.value() == 1
+
+
+def test_light_sleep_wakes_on_ext0():
+    """Light sleep should end when the ext0 pin reaches its level."""
+    from machine import Pin
+
+    from core.power import PowerManager
+    from tests.conftest import mock_ticks_ms
+
+    runtime.pin(7).connect(lambda: runtime.clock.now_ms < 2500)
+    pin = Pin(7, Pin.IN, Pin.PULL_UP)
+
+    assert PowerManager(use_light_sleep=True).sleep_until(pin, 10000)
+    assert mock_ticks_ms() == 2500
+    assert runtime.light_sleep_us == 2500 * 1000
+
+
+def test_fade_is_recorded_as_duty_history():
+    """PWM writes should be traced over virtual time."""
+    from core.light import LightController
+
+    light = LightController(pin=4, fade_duration_ms=500, fade_steps=50)
+    light.on()
+    while light.fading:
+        runtime.advance(10)
+        light.update()
+
+    trace = runtime.pwm(4)
+    assert trace.duty == 65535
+    assert runtime.clock.now_ms == 500
+    assert trace.writes == 51  # init + 49 steps + final
+    assert 0.45 < trace.mean() < 0.55
+
+
+def test_ultrasonic_echo_pulse():
+    """time_pulse_us should return the echo pulse configured on the pin."""
+    from hardware.sensors.ultrasonic import UltrasonicSensor
+
+    sensor = UltrasonicSensor(trigger_pin=13, echo_pin=12)
+
+    assert sensor.measure() == -1.0  # No echo: timeout
+
+    runtime.pin(12).pulse_us = 1164
+    assert sensor.measure() == pytest.approx(20.0)
+
+
+def test_app_fast_forwards_through_a_visit():
+    """The real app should run minutes of behaviour against the emulator."""
+    from config import PinConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    def scene(now_ms):
+        return 250 if 60000 <= now_ms < 120000 else 2000
+
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=scene))
+    app = MirrorLightApp(create_sensor())
+
+    while runtime.clock.now_ms < 300000:
+        app.step()
+
+    trace = runtime.pwm(PinConfig.LED)
+    turned_on = [when for when, duty in trace.changes if duty == 65535]
+    turned_off = [when for when, duty in trace.changes[1:] if duty == 0]
+    assert len(turned_on) == 1
+    assert 61000000 < turned_on[0] < 63000000
+    assert len(turned_off) == 1
+    assert 123000000 < turned_off[0] < 125000000
+    assert runtime.light_sleep_us > 150 * 1000000
@@ -0,0 +1,89 @@
+"""Tests for threaded sampling and ring buffer."""
+import pytest
+
+from tests.conftest import reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_ring_fifo_and_overrun():
+    """Ring should keep order and count samples dropped when full."""
+    from core.sampler import SampleRing
+
+    ring = SampleRing(capacity=2)
+
+    assert ring.push(100, 100)
+    assert ring.push(200, 200)
+    assert not ring.push(300, 300)
+    assert ring.overruns == 1
+
+    assert ring.pop()
+    assert (ring.distance, ring.timestamp) == (100, 100)
+    assert ring.pop()
+    assert (ring.distance, ring.timestamp) == (200, 200)
+    assert not ring.pop()
+
+
+def test_worker_keeps_fixed_cadence():
+    """Measurement time should not stretch the sampling period."""
+    from core.sampler import ThreadedSampler
+    from tests.conftest import advance_time
+
+    class SlowSensor:
+        def __init__(self):
+            self.calls = 0
+
+        def measure_mm(self) -> int:
+            self.calls += 1
+            advance_time(30)  # Conversion time
+            if self.calls == 5:
+                sampler.stop()
+            return 200
+
+    sampler = ThreadedSampler(SlowSensor(), period_ms=100, capacity=8)
+    sampler._running = True
+    sampler._run()
+
+    stamps = []
+    while sampler.ring.pop():
+        stamps.append(sampler.ring.timestamp)
+    assert stamps == [30, 130, 230, 330, 430]
+
+
+def test_worker_resyncs_after_overrun():
+    """A measurement longer than the period should not cause a burst."""
+    from core.sampler import ThreadedSampler
+    from tests.conftest import advance_time
+
+    durations = iter([250, 10, 10])
+
+    class StallingSensor:
+        def measure_mm(self) -> int:
+            try:
+                advance_time(next(durations))
+            except StopIteration:
+                sampler.stop()
+            return 200
+
+    sampler = ThreadedSampler(StallingSensor(), period_ms=100)
+    sampler._running = True
+    sampler._run()
+
+    stamps = []
+    while sampler.ring.pop():
+        stamps.append(sampler.ring.timestamp)
+    assert stamps[:3] == [250, 260, 360]
+
+
+def test_start_falls_back_on_single_core(monkeypatch):
+    """Without a second core the sampler should not start."""
+    from core import sampler as sampler_module
+    from core.sampler import ThreadedSampler
+
+    monkeypatch.setattr(sampler_module, "_thread", None)
+
+    assert not ThreadedSampler(sensor=None).start()
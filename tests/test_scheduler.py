@@ -0,0 +1,85 @@
+"""Tests for fixed-period sample scheduler."""
+import pytest
+
+from tests.conftest import advance_time, reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+class LatePower:
+    """PowerManager stand-in that oversleeps by a fixed wake latency."""
+
+    def __init__(self, latency_ms: int = 0):
+        self.latency_ms = latency_ms
+        self.sleeps = []
+
+    def sleep(self, duration_ms: int) -> None:
+        self.sleeps.append(duration_ms)
+        advance_time(duration_ms + self.latency_ms)
+
+
+def test_work_time_does_not_drift():
+    """Iterations should start on period boundaries despite work time."""
+    from core.scheduler import SampleScheduler
+    from tests.conftest import mock_ticks_ms
+
+    power = LatePower()
+    scheduler = SampleScheduler(100, power)
+
+    starts = []
+    for work_ms in (30, 70, 5, 60):
+        advance_time(work_ms)
+        scheduler.wait()
+        starts.append(mock_ticks_ms())
+
+    assert starts == [100, 200, 300, 400]
+    assert power.sleeps == [70, 30, 95, 40]
+    assert scheduler.max_jitter_us == 0
+
+
+def test_missed_periods_are_skipped():
+    """Overrunning several periods should skip, not burst."""
+    from core.scheduler import SampleScheduler
+    from tests.conftest import mock_ticks_ms
+
+    scheduler = SampleScheduler(100, LatePower())
+
+    advance_time(350)
+    scheduler.wait()
+    assert scheduler.missed == 2
+    assert scheduler.last_jitter_us == 50000
+
+    scheduler.wait()
+    assert mock_ticks_ms() == 400
+
+
+def test_wake_latency_is_compensated():
+    """Systematic oversleep should be learned and slept off early."""
+    from core.scheduler import SampleScheduler
+
+    scheduler = SampleScheduler(100, LatePower(latency_ms=3))
+
+    for _ in range(100):
+        scheduler.wait()
+
+    assert scheduler.max_jitter_us == 3000
+    assert abs(scheduler.last_jitter_us) <= 1000
+
+
+def test_resync_restarts_schedule():
+    """After an unscheduled sleep the next period starts from now."""
+    from core.scheduler import SampleScheduler
+    from tests.conftest import mock_ticks_ms
+
+    scheduler = SampleScheduler(100, LatePower())
+
+    advance_time(5000)
+    scheduler.resync()
+    scheduler.wait()
+
+    assert mock_ticks_ms() == 5100
+    assert scheduler.missed == 0
@@ -0,0 +1,105 @@
+"""Tests for the DistanceSensor sample-and-hold cache."""
+import pytest
+
+from tests.conftest import advance_time, reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+@pytest.fixture
+def emulator():
+    """Emulated VL53L0X on the runtime's I2C bus 0."""
+    from scripts.emulator import VL53L0XEmulator
+
+    return runtime.attach_i2c(VL53L0XEmulator(distance_mm=300))
+
+
+def make_sensor():
+    """Create driver on the emulated bus."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    return VL53L0XSensor(sda_pin=8, scl_pin=9)
+
+
+def test_readers_share_one_ranging(emulator):
+    """Reads within max-age should not range again."""
+    sensor = make_sensor()
+
+    assert sensor.read(max_age_ms=100) == 30.0
+    assert sensor.read(max_age_ms=100) == 30.0
+    assert sensor.read(max_age_ms=100) == 30.0
+
+    assert emulator.conversions == 1
+
+
+def test_stale_sample_is_measured_again(emulator):
+    """A sample as old as max-age should be replaced."""
+    from tests.conftest import mock_ticks_ms
+
+    sensor = make_sensor()
+    sensor.max_age_ms = 100
+
+    sensor.read()
+    first = sensor.sample_timestamp
+    advance_time(100 - (mock_ticks_ms() - first))
+    emulator.distance_mm = 250
+    assert sensor.read() == 25.0
+
+    assert emulator.conversions == 2
+    assert sensor.sample_timestamp == first + 100
+
+
+def test_default_max_age_always_measures(emulator):
+    """Without a max-age, read() behaves like measure()."""
+    sensor = make_sensor()
+
+    sensor.read()
+    sensor.read()
+
+    assert emulator.conversions == 2
+
+
+def test_validity_flag(emulator):
+    """Faults and out-of-range samples should be marked invalid."""
+    sensor = make_sensor()
+    assert not sensor.sample_valid
+
+    sensor.read()
+    assert sensor.sample_valid
+
+    emulator.fail_next()
+    assert sensor.read() == -1.0
+    assert not sensor.sample_valid
+
+    emulator.distance_mm = emulator.OUT_OF_RANGE_MM
+    sensor.read()
+    assert not sensor.sample_valid
+
+
+def test_invalidate_forces_measurement(emulator):
+    """invalidate() should make the next read hit the hardware."""
+    sensor = make_sensor()
+
+    sensor.read(max_age_ms=1000)
+    sensor.invalidate()
+    sensor.read(max_age_ms=1000)
+
+    assert emulator.conversions == 2
+
+
+def test_monitor_caches_backoff_result(emulator):
+    """A monitored sensor should share samples like a plain one."""
+    from hardware.sensors.health import SensorMonitor
+
+    monitor = SensorMonitor(make_sensor())
+    monitor.max_age_ms = 50
+
+    monitor.read()
+    monitor.read()
+
+    assert emulator.conversions == 1
+    assert monitor.sample_valid
@@ -0,0 +1,141 @@
+"""Tests for duty-cycled sensor power (XSHUT / supply switch)."""
+import pytest
+
+from tests.conftest import mock_ticks_ms, reset_time, runtime
+
+XSHUT = 10
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def wire_xshut(emulator, pin):
+    """Connect emulator XSHUT to a GPIO with the breakout's pull-up."""
+    state = runtime.pin(pin)
+    state.pull = runtime.machine.Pin.PULL_UP
+    state.watch(emulator.set_xshut)
+    return emulator
+
+
+def attach(distance_mm=300, pin=XSHUT):
+    """Emulated VL53L0X at the default address with XSHUT wired."""
+    from scripts.emulator import VL53L0XEmulator
+
+    return wire_xshut(runtime.attach_i2c(VL53L0XEmulator(distance_mm=distance_mm)), pin)
+
+
+def test_power_up_skips_detection():
+    """Re-init after XSHUT should be shorter than the first start."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    emulator = attach()
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9, xshut_pin=XSHUT)
+    first_start = emulator.transactions
+
+    assert sensor.power_down()
+    assert not emulator.powered
+    emulator.reset_counters()
+    assert sensor.measure() == 30.0  # Powers up on demand
+
+    assert emulator.power_cycles == 2
+    assert emulator.transactions - 10 < first_start  # Minus one ranging
+    assert sensor.power_up_ms == 3
+
+
+def test_shared_bus_sensors_get_their_addresses(monkeypatch):
+    """XSHUT bring-up should move each sensor off the default address."""
+    from config import ZoneConfig
+    from main import create_sensors
+
+    zones = (
+        {"led": 4, "address": 0x30, "power": 10},
+        {"led": 5, "address": 0x31, "power": 11},
+    )
+    monkeypatch.setattr(ZoneConfig, "ZONES", zones)
+    first = attach(distance_mm=200, pin=10)
+    second = attach(distance_mm=500, pin=11)
+
+    sensors = create_sensors()
+
+    assert (first.address, second.address) == (0x30, 0x31)
+    assert [sensor.measure() for sensor in sensors] == [20.0, 50.0]
+
+
+def test_default_address_sensor_powers_up_last(monkeypatch):
+    """A zone keeping 0x29 should not be moved by the next sensor's bring-up."""
+    from config import PowerConfig, TimingConfig, ZoneConfig
+    from main import MirrorLightApp, create_sensors
+
+    monkeypatch.setattr(TimingConfig, "POLL_INTERVAL_MS", 400)  # Ticks long enough to gate
+    zones = (
+        {"led": 4, "address": 0x29, "power": 10},
+        {"led": 5, "address": 0x30, "power": 11},
+    )
+    monkeypatch.setattr(ZoneConfig, "ZONES", zones)
+    first = attach(distance_mm=600, pin=10)  # Empty room, so gating starts
+    second = attach(distance_mm=900, pin=11)
+
+    sensors = create_sensors()
+    assert (first.address, second.address) == (0x29, 0x30)
+    assert [sensor.measure() for sensor in sensors] == [60.0, 90.0]
+
+    # Gated power cycles in an empty room keep the addresses apart
+    app = MirrorLightApp(sensors)
+    while runtime.clock.now_ms < PowerConfig.SENSOR_OFF_AFTER_MS + 5000:
+        app.step()
+    assert first.power_cycles > 2
+    assert (first.address, second.address) == (0x29, 0x30)
+    assert [sensor.measure() for sensor in sensors] == [60.0, 90.0]
+
+
+def test_power_manager_wakes_sensor_before_deadline():
+    """Gated sleeps should switch off and be ready when they end."""
+    from core.power import PowerManager
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+
+    emulator = attach()
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9, xshut_pin=XSHUT)
+    power = PowerManager(use_light_sleep=False, sensor_min_off_ms=20)
+    power.gate_sensors((sensor,))
+    off_ms = emulator.off_ms  # Start from shutdown
+
+    power.sleep(15)
+    assert emulator.off_ms == off_ms
+
+    start = mock_ticks_ms()
+    power.sleep(100)
+
+    assert emulator.off_ms - off_ms == 100 - sensor.power_up_ms
+    assert emulator.powered
+    assert mock_ticks_ms() - start <= 101
+    assert power.sensor_power_cycles == 1
+
+
+def test_app_gates_sensor_only_in_long_idle(monkeypatch):
+    """An empty room should power the sensor down; a visitor should not."""
+    from config import PinConfig, PowerConfig
+    from main import MirrorLightApp, create_sensors
+
+    monkeypatch.setattr(PinConfig, "SENSOR_POWER", XSHUT)
+
+    def scene(now_ms):
+        return 250 if now_ms >= 60000 else 2000
+
+    emulator = attach(distance_mm=scene)
+    app = MirrorLightApp(create_sensors())
+
+    while runtime.clock.now_ms < 60000:
+        app.step()
+    gated_ms = 60000 - PowerConfig.SENSOR_OFF_AFTER_MS
+    assert emulator.off_ms > gated_ms // 2
+    cycles = emulator.power_cycles
+
+    while runtime.clock.now_ms < 70000:
+        app.step()
+
+    assert emulator.power_cycles - cycles <= 1
+    assert runtime.pwm(PinConfig.LED).duty == 65535
+    assert app.zones[0].sensor.health == "ok"
@@ -0,0 +1,163 @@
+"""Tests for the split-phase start/ready/collect sensor API."""
+import pytest
+
+from tests.conftest import reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_vl53l0x_split_phase_skips_status_polling():
+    """Sleeping through the conversion should leave one status read."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+    from scripts.emulator import VL53L0XEmulator
+
+    emulator = runtime.attach_i2c(VL53L0XEmulator(distance_mm=234))
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9)
+    emulator.reset_counters()
+
+    assert sensor.start()
+    assert not sensor.ready()
+    runtime.clock.advance_us(sensor.conversion_ms * 1000)
+    assert sensor.ready()
+    assert sensor.collect() == 234
+
+    # start + two ready() checks + status check in collect + clear + result block
+    assert emulator.transactions == 6
+    assert emulator.conversions == 1
+
+
+def test_vl53l0x_collect_waits_if_called_early():
+    """collect() straight after start() should still return the sample."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+    from scripts.emulator import VL53L0XEmulator
+
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=500))
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9)
+
+    sensor.start()
+    assert sensor.collect() == 500
+    assert sensor.collect() == -1  # Nothing started
+
+
+def test_ultrasonic_split_phase_times_echo_from_irq():
+    """Echo edges stamped in the pin IRQ should give the distance."""
+    from hardware.sensors.ultrasonic import UltrasonicSensor
+
+    runtime.connect_echo(13, 12)
+    sensor = UltrasonicSensor(trigger_pin=13, echo_pin=12)
+    runtime.pin(12).pulse_us = 1164
+
+    assert sensor.start()
+    assert not sensor.ready()
+    runtime.clock.advance_us(2000)
+    assert sensor.ready()
+    assert sensor.collect() == 200
+    assert runtime.pin(12).handler is None
+
+    runtime.pin(12).pulse_us = None  # Nothing in range
+    sensor.start()
+    assert sensor.collect() == -1
+
+
+def test_ultrasonic_edges_survive_irq_latency():
+    """A short echo should be timed at its edges, not when handlers run."""
+    from hardware.sensors.ultrasonic import UltrasonicSensor
+
+    runtime.connect_echo(13, 12)
+    runtime.soft_irq_latency_us = 2000  # Longer than the echo
+    sensor = UltrasonicSensor(trigger_pin=13, echo_pin=12)
+    runtime.pin(12).pulse_us = 1164
+
+    assert sensor.start()
+    runtime.clock.advance_us(5000)
+    assert sensor.collect() == 200
+
+
+def test_ultrasonic_read_naps_until_echo():
+    """read(wait=...) should stop napping when a short echo is in."""
+    from hardware.sensors.ultrasonic import UltrasonicSensor
+
+    runtime.connect_echo(13, 12)
+    sensor = UltrasonicSensor(trigger_pin=13, echo_pin=12)
+    runtime.pin(12).pulse_us = 1164  # 20cm: echo over ~1.7ms after start
+    waits = []
+
+    def wait(ms):
+        waits.append(ms)
+        runtime.clock.advance_us(ms * 1000)
+
+    assert sensor.read(wait=wait) == 20.0
+    assert waits == [1, 1]
+
+    waits.clear()
+    sensor.invalidate()
+    runtime.pin(12).pulse_us = None  # Nothing in range: nap to the timeout
+    assert sensor.read(wait=wait) == -1.0
+    assert sum(waits) == sensor.conversion_ms
+
+
+def test_read_naps_through_conversion():
+    """read(wait=...) should start, wait conversion_ms and collect."""
+    from hardware.sensors.vl53l0x import VL53L0XSensor
+    from scripts.emulator import VL53L0XEmulator
+
+    emulator = runtime.attach_i2c(VL53L0XEmulator(distance_mm=300))
+    sensor = VL53L0XSensor(sda_pin=8, scl_pin=9)
+    waits = []
+
+    def wait(ms):
+        waits.append(ms)
+        runtime.clock.advance_us(ms * 1000)
+
+    emulator.reset_counters()
+    assert sensor.read(wait=wait) == 30.0
+    assert waits == [sensor.conversion_ms]
+    assert emulator.transactions == 4
+
+
+def test_app_samples_split_phase(monkeypatch):
+    """The app should use fewer bus transactions with SPLIT_PHASE."""
+    from config import SamplingConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    counts = {}
+    for split_phase in (False, True):
+        reset_time()
+        monkeypatch.setattr(SamplingConfig, "SPLIT_PHASE", split_phase)
+        emulator = runtime.attach_i2c(VL53L0XEmulator(distance_mm=2000))
+        app = MirrorLightApp(create_sensor())
+        app.step()
+        emulator.reset_counters()
+        for _ in range(10):
+            app.step()
+        assert emulator.conversions == 10
+        counts[split_phase] = emulator.transactions
+
+    assert counts[True] < counts[False]
+
+
+def test_unplugged_sensor_degrades_split_phase(monkeypatch):
+    """Failed starts should count as faults and trigger recovery."""
+    from config import SamplingConfig
+    from hardware.sensors import SensorHealth
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    monkeypatch.setattr(SamplingConfig, "SPLIT_PHASE", True)
+    emulator = runtime.attach_i2c(VL53L0XEmulator(distance_mm=2000))
+    sensor = create_sensor()
+    app = MirrorLightApp(sensor)
+    app.step()
+
+    emulator.present = False
+    for _ in range(100):
+        app.step()
+
+    assert sensor.health == SensorHealth.FAILED
+    assert sensor.consecutive_failures >= 3
+    assert sensor.recoveries > 0
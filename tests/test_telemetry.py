@@ -0,0 +1,254 @@
+"""Tests for batched telemetry publisher."""
+import select
+import socket
+import struct
+
+import pytest
+
+from tests.conftest import advance_time, reset_time, runtime
+
+
+class LocalBroker:
+    """Minimal MQTT broker on a loopback socket, serviced inline by serve()."""
+
+    def __init__(self, answer=True):
+        self.messages = []
+        self.answer = answer  # False: accept TCP but never send CONNACK
+        self.port = 0
+        self._listener = None
+        self._clients = []
+        self.start()
+
+    def start(self):
+        """Listen (again) on the broker port."""
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("127.0.0.1", self.port))
+        listener.listen(4)
+        listener.setblocking(False)
+        self.port = listener.getsockname()[1]
+        self._listener = listener
+
+    def stop(self):
+        """Go offline: refuse connections and drop clients."""
+        for sock, _ in self._clients:
+            sock.close()
+        self._clients = []
+        self._listener.close()
+
+    def serve(self):
+        """Accept clients, answer CONNECT and collect PUBLISH packets."""
+        try:
+            sock, _ = self._listener.accept()
+            sock.setblocking(False)
+            self._clients.append((sock, bytearray()))
+        except OSError:
+            pass
+        for sock, buffer in self._clients:
+            try:
+                buffer += sock.recv(4096)
+            except OSError:
+                continue
+            while self._packet(sock, buffer):
+                pass
+
+    def transport(self, **kwargs):
+        """Return an MQTTTransport for this broker."""
+        from core.telemetry import MQTTTransport
+
+        return MQTTTransport("test", "127.0.0.1", "mirror/t", port=self.port, **kwargs)
+
+    def _packet(self, sock, buffer):
+        size, shift, pos = 0, 0, 1
+        while True:
+            if pos >= len(buffer):
+                return False
+            size |= (buffer[pos] & 0x7F) << shift
+            shift += 7
+            pos += 1
+            if not buffer[pos - 1] & 0x80:
+                break
+        if len(buffer) < pos + size:
+            return False
+        kind, body = buffer[0] & 0xF0, bytes(buffer[pos:pos + size])
+        del buffer[:pos + size]
+        if kind == 0x10 and self.answer:
+            sock.send(b"\x20\x02\x00\x00")
+        elif kind == 0x30:
+            length = struct.unpack_from("!H", body)[0]
+            self.messages.append((body[2:2 + length], body[2 + length:]))
+        return True
+
+
+def connect(transport, broker):
+    """Poll the transport every 10ms of virtual time until connected."""
+    for _ in range(300):
+        if transport.poll():
+            return
+        broker.serve()
+        select.select([], [], [], 0.001)
+        advance_time(10)
+    raise AssertionError("no connection")
+
+
+def deliver(publisher, broker):
+    """Poll the publisher and wait until the broker got what was sent."""
+    count = len(broker.messages)
+    sent = publisher.poll()
+    for _ in range(500 if sent else 10):
+        broker.serve()
+        if len(broker.messages) > count:
+            break
+        select.select([], [], [], 0.001)
+    return sent
+
+
+def decode(payload):
+    """Decode one telemetry message into (header, counters, records)."""
+    from core.telemetry import (
+        TELEMETRY_HEADER_FORMAT,
+        TELEMETRY_HEADER_SIZE,
+        TELEMETRY_RECORD_FORMAT,
+        TELEMETRY_RECORD_SIZE,
+    )
+
+    header = struct.unpack_from(TELEMETRY_HEADER_FORMAT, payload, 0)
+    n_counters, n_records = header[5], header[6]
+    counters = struct.unpack_from(f"<{n_counters}I", payload, TELEMETRY_HEADER_SIZE)
+    offset = TELEMETRY_HEADER_SIZE + n_counters * 4
+    records = [
+        struct.unpack_from(TELEMETRY_RECORD_FORMAT, payload, offset + i * TELEMETRY_RECORD_SIZE)
+        for i in range(n_records)
+    ]
+    assert len(payload) == offset + n_records * TELEMETRY_RECORD_SIZE
+    return header, counters, records
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+@pytest.fixture
+def broker():
+    """Provide a fresh broker stand-in."""
+    broker = LocalBroker()
+    yield broker
+    broker.stop()
+
+
+def make_publisher(broker, **kwargs):
+    """Create publisher sending to broker over a connected MQTT transport."""
+    from core.telemetry import TelemetryPublisher
+
+    transport = broker.transport()
+    connect(transport, broker)
+    return TelemetryPublisher(transport, device_id=7, **kwargs)
+
+
+def test_publish_rate_limited(broker):
+    """No message should be sent before the interval elapses."""
+    publisher = make_publisher(broker, interval_ms=1000)
+
+    publisher.record_event(1)
+    assert not publisher.poll()
+    advance_time(999)
+    assert not publisher.poll()
+    advance_time(1)
+    assert deliver(publisher, broker)
+    assert len(broker.messages) == 1
+    assert publisher.pending == 0
+
+
+def test_message_roundtrip(broker):
+    """Batches should decode back to header, counters and records."""
+    from core.telemetry import Counter, RecordKind
+
+    publisher = make_publisher(broker, interval_ms=100, distance_every=2)
+    publisher.count(Counter.ACTIVATIONS)
+    publisher.record_event(1)
+    publisher.record_distance(205)
+    publisher.record_distance(-1)
+
+    advance_time(100)
+    deliver(publisher, broker)
+
+    topic, payload = broker.messages[0]
+    header, counters, records = decode(payload)
+
+    assert topic == b"mirror/t"
+    assert header[0] == b"MT"
+    assert header[2] == 7
+    assert counters[Counter.ACTIVATIONS] == 1
+    assert counters[Counter.SAMPLES] == 2
+    assert [(r[0], r[1], r[2]) for r in records] == [
+        (RecordKind.EVENT, 1, 0),
+        (RecordKind.DISTANCE, 0, -1),
+    ]
+
+
+def test_backpressure_drops_oldest(broker):
+    """Offline broker should keep newest records and count drops."""
+    from core.telemetry import Counter, TelemetryPublisher
+
+    broker.stop()  # Connections refused
+    transport = broker.transport(retry_ms=1000)
+    publisher = TelemetryPublisher(transport, device_id=7, interval_ms=100, capacity=3)
+
+    for event in range(1, 6):
+        publisher.record_event(event)
+    advance_time(100)
+
+    assert not publisher.poll()
+    assert publisher.pending == 3
+    assert publisher.counter(Counter.DROPPED) == 2
+    assert publisher.counter(Counter.PUBLISH_FAILURES) == 1
+
+    broker.start()
+    connect(transport, broker)  # Reconnects after retry_ms
+    assert deliver(publisher, broker)
+
+    _, counters, records = decode(broker.messages[0][1])
+    assert [r[1] for r in records] == [3, 4, 5]
+    assert counters[Counter.DROPPED] == 2
+
+
+def test_sequence_increments(broker):
+    """Each delivered message should carry the next sequence number."""
+    publisher = make_publisher(broker, interval_ms=100)
+
+    for _ in range(3):
+        advance_time(100)
+        deliver(publisher, broker)
+
+    assert [decode(p)[0][3] for _, p in broker.messages] == [0, 1, 2]
+
+
+def test_silent_broker_never_blocks_the_loop():
+    """A broker that never answers should cost the loop no waiting."""
+    from time import perf_counter  # Host clock (not emulated)
+
+    from core.telemetry import Counter, TelemetryPublisher
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+
+    broker = LocalBroker(answer=False)
+    transport = broker.transport(timeout_ms=2000, retry_ms=3000)
+    publisher = TelemetryPublisher(transport, interval_ms=1000)
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=2000))
+    app = MirrorLightApp(create_sensor(), telemetry=publisher)
+
+    slowest = 0.0
+    try:
+        while runtime.clock.now_ms < 12000:
+            start = perf_counter()
+            app.step()
+            slowest = max(slowest, perf_counter() - start)
+            broker.serve()
+    finally:
+        broker.stop()
+
+    assert slowest < 0.05
+    assert not transport.connected
+    assert publisher.counter(Counter.PUBLISH_FAILURES) >= 10
@@ -0,0 +1,131 @@
+"""Tests for latency tracing and the Chrome trace export."""
+import json
+import tracemalloc
+
+import pytest
+
+from tests.conftest import reset_time, runtime
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def test_dump_format_and_ring_overwrite():
+    """Dumps should list the newest records oldest first, then clear."""
+    from core.trace import TracePhase, TracePoint, Tracer
+
+    tracer = Tracer(capacity=3)
+    tracer.begin(TracePoint.SENSOR, 1)
+    runtime.clock.advance_us(250)
+    tracer.end(TracePoint.SENSOR, 1)
+    tracer.instant(TracePoint.ENTER, 1)
+    tracer.begin(TracePoint.DWELL, 1)
+    tracer.trigger()
+
+    lines = []
+    assert tracer.dump(write=lines.append) == 3
+
+    start = runtime.clock.ticks_us() - 250
+    assert lines == [
+        "@trace-dump 3 1",
+        f"@trace {start + 250} {TracePoint.SENSOR} {TracePhase.END} 1",
+        f"@trace {start + 250} {TracePoint.ENTER} {TracePhase.INSTANT} 1",
+        f"@trace {start + 250} {TracePoint.DWELL} {TracePhase.BEGIN} 1",
+    ]
+    assert len(tracer) == 0
+    assert not tracer.triggered
+    assert tracer.dropped == 0
+
+
+def test_tracing_does_not_allocate():
+    """Recording must not retain memory in the hot path."""
+    from core.trace import TracePoint, Tracer
+
+    tracer = Tracer(capacity=16)
+    tracer.begin(TracePoint.FILTER)  # Warm-up
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(100):
+            tracer.begin(TracePoint.FILTER)
+            tracer.end(TracePoint.FILTER)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    only_trace = [tracemalloc.Filter(True, "*/core/trace.py")]
+    stats = after.filter_traces(only_trace).compare_to(before.filter_traces(only_trace), "lineno")
+    assert sum(stat.count_diff for stat in stats if stat.count_diff > 0) == 0
+
+
+def test_app_traces_activation_breakdown(monkeypatch, capsys):
+    """A visit should dump one activation whose parts add up."""
+    from config import LightConfig, TimingConfig, TraceConfig
+    from main import MirrorLightApp, create_sensor
+    from scripts.emulator import VL53L0XEmulator
+    from scripts.trace_export import activation_latencies, parse_dump
+
+    monkeypatch.setattr(TraceConfig, "ENABLED", True)
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=lambda ms: 250 if 5000 <= ms < 15000 else 2000))
+    app = MirrorLightApp(create_sensor())
+
+    while runtime.clock.now_ms < 30000:
+        app.step()
+
+    output = capsys.readouterr().out
+    (latency,) = activation_latencies(parse_dump(output.splitlines()))
+    parts = ("sensor_ms", "filter_ms", "dwell_ms", "dispatch_ms", "fade_ms")
+
+    assert latency["zone"] == 0
+    assert 0 < latency["sensor_ms"] < TimingConfig.POLL_INTERVAL_MS
+    assert TimingConfig.ACTIVATION_MS <= latency["dwell_ms"] < TimingConfig.ACTIVATION_MS + 200
+    assert latency["fade_ms"] == pytest.approx(LightConfig.FADE_DURATION_MS, abs=20)
+    assert latency["total_ms"] >= sum(latency[part] for part in parts)
+    assert not app.tracer.triggered
+
+
+def test_tracing_is_off_by_default():
+    """Without TraceConfig.ENABLED there is no tracer."""
+    from hardware.sensors.base import DistanceSensor
+    from main import MirrorLightApp
+
+    class EmptyRoom(DistanceSensor):
+        def measure(self) -> float:
+            return 200.0
+
+    app = MirrorLightApp(EmptyRoom())
+    app.step()
+
+    assert app.tracer is None
+    assert app.zones[0].tracer is None
+
+
+def test_export_drops_unmatched_spans_and_unwraps_ticks(tmp_path):
+    """Truncated spans should be dropped and tick wraparound undone."""
+    from scripts.trace_export import TICKS_PERIOD, export
+
+    wrap = TICKS_PERIOD - 100
+    lines = [
+        "1234 I Light OFF - presence timeout (zone 0)",
+        "@trace-dump 5 2",
+        f"@trace {wrap - 50} 0 1 0",   # Sensor end, begin was overwritten
+        f"@trace {wrap} 0 0 0",        # Sensor begin
+        "@trace 20 0 1 0",             # Sensor end after wraparound
+        "@trace 30 3 0 0",             # Dwell begin, never ended
+        "@trace 40 2 2 0",             # Enter
+    ]
+    output = tmp_path / "trace.json"
+
+    export(lines, output)
+
+    events = json.loads(output.read_text())["traceEvents"]
+    spans = [(event["name"], event["ph"], event["ts"]) for event in events if event["ph"] != "M"]
+    assert spans == [
+        ("sensor", "B", wrap),
+        ("sensor", "E", TICKS_PERIOD + 20),
+        ("enter", "i", TICKS_PERIOD + 40),
+    ]
@@ -0,0 +1,89 @@
+"""Tests for approach tracking and pre-armed activation."""
+import pytest
+
+from tests.conftest import advance_time, reset_time
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+def feed(tracker, distances, step_ms=100):
+    """Feed samples at fixed interval, return last approach flag."""
+    result = False
+    for distance in distances:
+        result = tracker.update(distance)
+        advance_time(step_ms)
+    return result
+
+
+def test_walking_up_is_approach():
+    """Steady inbound motion should be reported as an approach."""
+    from core.tracking import ApproachTracker
+
+    tracker = ApproachTracker()
+
+    # ~1 m/s towards the mirror
+    assert feed(tracker, [1200, 1100, 1000, 900, 800, 700, 600, 500])
+    assert tracker.velocity < 0
+
+
+def test_walk_by_is_rejected():
+    """Someone passing at constant distance is not an approach."""
+    from core.tracking import ApproachTracker
+
+    tracker = ApproachTracker()
+
+    assert not feed(tracker, [-1, 300, 310, 290, 300, 310, -1])
+    assert not feed(tracker, [320, 300, 310, 300])
+
+
+def test_invalid_sample_drops_track():
+    """Lost target should reset the track."""
+    from core.tracking import ApproachTracker
+
+    tracker = ApproachTracker()
+
+    feed(tracker, [1200, 1100, 1000, 900, 800, 700])
+    assert tracker.approaching
+
+    tracker.update(-1)
+    assert not tracker.approaching
+
+
+def test_approach_shortens_dwell():
+    """Pre-armed detection should activate after the approach dwell."""
+    from core.presence import PresenceDetector, PresenceState
+
+    detector = PresenceDetector(
+        activation_ms=1000, timeout_ms=3000, approach_activation_ms=200,
+    )
+
+    detector.update(presence_detected=False, approaching=True)
+    detector.update(presence_detected=True, approaching=True)
+    assert detector.state == PresenceState.DETECTING
+
+    advance_time(100)
+    detector.update(presence_detected=True)
+    assert detector.state == PresenceState.DETECTING
+
+    advance_time(100)
+    detector.update(presence_detected=True)
+    assert detector.state == PresenceState.ACTIVE
+
+
+def test_without_approach_full_dwell():
+    """Unarmed detection should still need the full activation time."""
+    from core.presence import PresenceDetector, PresenceState
+
+    detector = PresenceDetector(
+        activation_ms=1000, timeout_ms=3000, approach_activation_ms=200,
+    )
+
+    detector.update(presence_detected=True)
+    advance_time(500)
+    detector.update(presence_detected=True)
+    assert detector.state == PresenceState.DETECTING
+    assert not detector.approach_armed
@@ -0,0 +1,183 @@
+"""Tests for driving several mirrors from one board."""
+from itertools import pairwise
+
+import pytest
+
+from tests.conftest import reset_time, runtime
+
+ZONES = ({"led": 4, "address": 0x29, "power": 10}, {"led": 5, "address": 0x30, "power": 11})
+
+
+@pytest.fixture(autouse=True)
+def setup():
+    """Reset time before each test."""
+    reset_time()
+
+
+@pytest.fixture
+def two_zones(monkeypatch):
+    """Configure two mirrors with VL53L0X sensors on the shared bus."""
+    from config import ZoneConfig
+
+    monkeypatch.setattr(ZoneConfig, "ZONES", ZONES)
+
+
+def visitor_at(start_ms, end_ms):
+    """Scene: someone at 25cm between start and end, empty room otherwise."""
+    def scene(now_ms):
+        return 250 if start_ms <= now_ms < end_ms else 2000
+    return scene
+
+
+def attach(scenes, zones=ZONES):
+    """Put one emulated VL53L0X per zone on its bus, XSHUT wired if set."""
+    from scripts.emulator import VL53L0XEmulator
+
+    emulators = []
+    for scene, zone in zip(scenes, zones):
+        emulator = VL53L0XEmulator(distance_mm=scene)
+        runtime.attach_i2c(emulator, bus=zone.get("i2c", 0))
+        if "power" in zone:
+            xshut = runtime.pin(zone["power"])
+            xshut.pull = runtime.machine.Pin.PULL_UP
+            xshut.watch(emulator.set_xshut)
+        emulators.append(emulator)
+    return emulators
+
+
+def first_on_ms(pin):
+    """Return when the light on pin first reached full duty, or None."""
+    for when_us, duty in runtime.pwm(pin).changes:
+        if duty == 65535:
+            return when_us // 1000
+    return None
+
+
+def test_zones_are_independent(two_zones):
+    """Presence at one mirror should only light that mirror."""
+    from main import MirrorLightApp, create_sensors
+
+    attach([visitor_at(0, 0), visitor_at(5000, 20000)])
+    app = MirrorLightApp(create_sensors())
+
+    while runtime.clock.now_ms < 30000:
+        app.step()
+
+    assert first_on_ms(4) is None
+    assert 5000 < first_on_ms(5) < 7000
+    assert runtime.pwm(5).duty == 0
+    assert len(app.zones) == 2
+
+
+def test_round_robin_keeps_per_zone_rate(two_zones):
+    """Adding a zone should not slow down sampling of the others."""
+    from config import TimingConfig
+    from main import MirrorLightApp, create_sensors
+
+    emulators = attach([visitor_at(0, 0), visitor_at(0, 0)])
+    app = MirrorLightApp(create_sensors())
+
+    while runtime.clock.now_ms < 10000:
+        app.step()
+
+    expected = 10000 // TimingConfig.POLL_INTERVAL_MS
+    for emulator in emulators:
+        assert expected - 2 <= emulator.conversions <= expected + 1
+    assert app.scheduler.missed == 0
+
+
+def test_activation_latency_does_not_grow(monkeypatch):
+    """A visitor should be detected as fast with two zones as with one."""
+    from config import ZoneConfig
+    from main import MirrorLightApp, create_sensors
+    from scripts.emulator import VL53L0XEmulator
+
+    runtime.attach_i2c(VL53L0XEmulator(distance_mm=visitor_at(5000, 20000)))
+    app = MirrorLightApp(create_sensors())
+    while runtime.clock.now_ms < 10000:
+        app.step()
+    single = first_on_ms(4) - 5000
+
+    reset_time()
+    monkeypatch.setattr(ZoneConfig, "ZONES", ZONES)
+    attach([visitor_at(5000, 20000), visitor_at(0, 0)])
+    app = MirrorLightApp(create_sensors())
+    while runtime.clock.now_ms < 10000:
+        app.step()
+
+    assert first_on_ms(4) - 5000 <= single + 100
+
+
+def test_sensor_count_must_match_zones(two_zones):
+    """A sensor list that does not match ZoneConfig.ZONES is an error."""
+    from hardware.sensors.ultrasonic import UltrasonicSensor
+    from main import MirrorLightApp
+
+    with pytest.raises(ValueError):
+        MirrorLightApp([UltrasonicSensor(trigger_pin=13, echo_pin=12)])
+
+
+def test_fade_does_not_stall_other_zones(two_zones, monkeypatch):
+    """A mirror fading on or off should not delay samples of the other."""
+    from config import TimingConfig
+    from main import MirrorLightApp, MirrorZone, create_sensors
+
+    sample_ms = {0: [], 1: []}
+    process_sample = MirrorZone.process_sample
+
+    def spy(zone, distance, now=None):
+        sample_ms[zone.index].append(runtime.clock.now_ms)
+        process_sample(zone, distance, now)
+
+    monkeypatch.setattr(MirrorZone, "process_sample", spy)
+    attach([visitor_at(2000, 6000), visitor_at(0, 0)])
+    app = MirrorLightApp(create_sensors())
+
+    while runtime.clock.now_ms < 15000:
+        app.step()
+
+    assert first_on_ms(4) is not None
+    for times in sample_ms.values():
+        gaps = [b - a for a, b in pairwise(times)]
+        assert max(gaps) <= TimingConfig.POLL_INTERVAL_MS + 5
+    assert app.scheduler.missed == 0
+
+
+def test_zones_on_separate_buses(monkeypatch):
+    """Zones with their own I2C bus should keep the default address."""
+    from config import ZoneConfig
+    from main import MirrorLightApp, create_sensors
+
+    zones = (
+        {"led": 4, "i2c": 0, "sda": 8, "scl": 9},
+        {"led": 5, "i2c": 1, "sda": 16, "scl": 17},
+    )
+    monkeypatch.setattr(ZoneConfig, "ZONES", zones)
+    emulators = attach([visitor_at(0, 0), visitor_at(5000, 20000)], zones)
+    app = MirrorLightApp(create_sensors())
+
+    while runtime.clock.now_ms < 10000:
+        app.step()
+
+    assert first_on_ms(4) is None
+    assert 5000 < first_on_ms(5) < 7000
+    assert [emulator.conversions > 0 for emulator in emulators] == [True, True]
+    assert [zone.sensor.health for zone in app.zones] == ["ok", "ok"]
+
+
+@pytest.mark.parametrize("zones", [
+    # Readdressed sensor without XSHUT: both boot at 0x29
+    ({"led": 4, "power": 10}, {"led": 5, "address": 0x30}),
+    # One bus on two pin pairs
+    ({"led": 4, "sda": 8, "scl": 9}, {"led": 5, "sda": 16, "scl": 17}),
+    # Same address twice
+    ({"led": 4, "address": 0x30, "power": 10}, {"led": 5, "address": 0x30, "power": 11}),
+])
+def test_unworkable_bus_layouts_are_rejected(monkeypatch, zones):
+    """Zone layouts that cannot come up on real hardware are errors."""
+    from config import ZoneConfig
+    from main import create_sensors
+
+    monkeypatch.setattr(ZoneConfig, "ZONES", zones)
+    with pytest.raises(ValueError):
+        create_sensors()